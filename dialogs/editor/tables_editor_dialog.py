@@ -19,6 +19,7 @@ from libraries.context.context import Context
 from libraries.csv.csv_helper import CsvHelper
 from libraries.file.file_helper import FileHelper
 from libraries.list.list_helper import ListHelper
+from libraries.store.store_helper import StoreHelper
 from libraries.ui.ui_helper import UIHelper
 from libraries.ui.ui_table import UITable
 from libraries.verifier.verifier import Verifier
@@ -1472,6 +1473,10 @@ class TablesEditorDialog:
             )
         )
 
+        # Delete blobs no longer referenced
+        if Context.is_deduplicated_store():
+            StoreHelper.collect_garbage()
+
         # Remove the table from the CSV
         csv_items = CsvHelper.read_data(
             file_path=Context.get_csv_path()
@@ -1534,23 +1539,31 @@ class TablesEditorDialog:
         # Flag item as modified
         self.__flag_item_as_modified()
 
-        # Copy folder to the new version
-        FileHelper.copy_folder(
-            source_folder_path=os.path.join(
-                Context.get_working_path(),
-                'tables',
-                Context.get_selected_emulator().value,
-                self.__current_item_id,
-                self.info_current_version_combo.get()
-            ),
-            destination_folder_path=os.path.join(
-                Context.get_working_path(),
-                'tables',
-                Context.get_selected_emulator().value,
-                self.__current_item_id,
-                self.new_version
-            )
+        # Copy folder to the new version (only linked if deduplicated store)
+        source_folder_path = os.path.join(
+            Context.get_working_path(),
+            'tables',
+            Context.get_selected_emulator().value,
+            self.__current_item_id,
+            self.info_current_version_combo.get()
         )
+        destination_folder_path = os.path.join(
+            Context.get_working_path(),
+            'tables',
+            Context.get_selected_emulator().value,
+            self.__current_item_id,
+            self.new_version
+        )
+        if Context.is_deduplicated_store():
+            StoreHelper.link_folder(
+                source_folder_path=source_folder_path,
+                destination_folder_path=destination_folder_path
+            )
+        else:
+            FileHelper.copy_folder(
+                source_folder_path=source_folder_path,
+                destination_folder_path=destination_folder_path
+            )
 
         # Add the new version and select it
         all_versions = list(self.info_current_version_combo["values"])
@@ -1768,6 +1781,10 @@ class TablesEditorDialog:
             )
         )
 
+        # Delete blobs no longer referenced
+        if Context.is_deduplicated_store():
+            StoreHelper.collect_garbage()
+
         # Remove the deleted version and select the current selected version
         all_versions = list(self.info_current_version_combo["values"])
         all_versions.remove(self.info_current_version_combo.get())
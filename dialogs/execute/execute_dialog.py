@@ -7,6 +7,7 @@ from tkinter import messagebox
 from tkinter import ttk
 
 from executor.bdd_tables.bdd_tables_executor import BDDTablesExecutor
+from executor.execution_checkpoint import ExecutionCheckpoint
 from executor.playlists.playlists_executor import PlaylistsExecutor
 from executor.tables.tables_executor import TablesExecutor
 from executor.configs.configs_executor import ConfigsExecutor
@@ -14,6 +15,7 @@ from libraries.constants.constants import Category, Constants
 from libraries.context.context import Context
 from libraries.logging.logging_helper import LoggingHelper
 from libraries.ui.ui_helper import UIHelper
+from libraries.ui.ui_progress import UIProgress
 
 # pylint: disable=attribute-defined-outside-init, too-many-locals
 # pylint: disable=too-many-instance-attributes
@@ -25,9 +27,10 @@ class ExecuteDialog:
     def __init__(
         self,
         parent,
-        callback: any
+        callback: any,
+        checkpoint: ExecutionCheckpoint = None
     ):
-        """Initialize dialog"""
+        """Initialize dialog (resuming the execution of the checkpoint if specified)"""
 
         self.__callback = callback
 
@@ -48,13 +51,20 @@ class ExecuteDialog:
             side=tk.TOP
         )
 
-        self.progress_label = tk.Label(
+        progress_label = tk.Label(
             self.dialog
         )
-        self.progress_label.pack(
+        progress_label.pack(
             side=tk.TOP
         )
 
+        # Report progress from the execution thread
+        self.__progress = UIProgress(
+            dialog=self.dialog,
+            progress_bar=progress_bar,
+            progress_label=progress_label
+        )
+
         # Create a textare with a scrollbar
         execution_frame = tk.Frame(self.dialog)
         execution_frame.pack(
@@ -109,32 +119,34 @@ class ExecuteDialog:
         match(Context.get_selected_category()):
             case Category.TABLES:
                 self.__executor = TablesExecutor(
-                    progress_bar=progress_bar,
-                    progress_label=self.progress_label,
+                    progress=self.__progress,
                     button_close=button_close
                 )
 
             case Category.PLAYLISTS:
                 self.__executor = PlaylistsExecutor(
-                    progress_bar=progress_bar,
-                    progress_label=self.progress_label,
+                    progress=self.__progress,
                     button_close=button_close
                 )
 
             case Category.BDD_TABLES:
                 self.__executor = BDDTablesExecutor(
-                    progress_bar=progress_bar,
-                    progress_label=self.progress_label,
+                    progress=self.__progress,
                     button_close=button_close
                 )
 
             case Category.CONFIGS:
                 self.__executor = ConfigsExecutor(
-                    progress_bar=progress_bar,
-                    progress_label=self.progress_label,
+                    progress=self.__progress,
                     button_close=button_close
                 )
 
+        # Resume an interrupted execution
+        if checkpoint is not None:
+            self.__executor.resume_execution(
+                checkpoint=checkpoint
+            )
+
         # Execute in a thread
         self.execution_thread = threading.Thread(
             target=self.__executor.execute
@@ -155,7 +167,7 @@ class ExecuteDialog:
         """Close after execution stopped"""
 
         # Update progress label
-        self.progress_label.config(
+        self.__progress.set_text(
             text=Context.get_text('waiting_for_stopping')
         )
 
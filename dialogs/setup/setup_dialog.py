@@ -9,6 +9,7 @@ from tkinter import filedialog
 
 from libraries.constants.constants import Constants, Emulator, Media
 from libraries.context.context import Context
+from libraries.refresh.refresh_session import RefreshSession
 from libraries.ui.ui_helper import UIHelper
 
 # pylint: disable=attribute-defined-outside-init, too-many-locals
@@ -84,7 +85,7 @@ class SetupDialog:
         UIHelper.center_dialog(
             dialog=self.dialog,
             width=800,
-            height=900
+            height=1070
         )
 
     def __browse_folder(
@@ -108,7 +109,12 @@ class SetupDialog:
         # Retrieve general setup
         pinup_path = self.entry_pinup_path.get()
         simulated = self.simulation_boolean_var.get()
+        sync_with_hash = self.sync_with_hash_boolean_var.get()
+        deduplicated_store = self.deduplicated_store_boolean_var.get()
+        auto_refresh = self.auto_refresh_boolean_var.get()
         monitor = int(self.combo_monitor.get()) - 1
+        refresh_workers = int(self.combo_refresh_workers.get())
+        execution_workers = int(self.combo_execution_workers.get())
 
         # Retrieve emulators setup
         available_emulators = []
@@ -179,7 +185,12 @@ class SetupDialog:
             Constants.SETUP_LANG_CODE: self.__lang_code,
             Constants.SETUP_PINUP_PATH: pinup_path,
             Constants.SETUP_MONITOR: monitor,
+            Constants.SETUP_REFRESH_WORKERS: refresh_workers,
+            Constants.SETUP_EXECUTION_WORKERS: execution_workers,
             Constants.SETUP_SIMULATED: simulated,
+            Constants.SETUP_SYNC_WITH_HASH: sync_with_hash,
+            Constants.SETUP_DEDUPLICATED_STORE: deduplicated_store,
+            Constants.SETUP_AUTO_REFRESH: auto_refresh,
             Constants.SETUP_AVAILABLE_EMULATORS: available_emulators,
             Constants.SETUP_AVAILABLE_MEDIA: available_media,
             Constants.SETUP_SCREEN_NUMBER_BY_MEDIA: screen_number_by_media
@@ -210,6 +221,9 @@ class SetupDialog:
         # Update context from setup
         Context.update_context_from_setup()
 
+        # Forget scan results of previous paths
+        RefreshSession.invalidate()
+
         # Close the dialog after validation
         UIHelper.close_dialog(self.dialog)
 
@@ -458,6 +472,68 @@ class SetupDialog:
             self.__on_entry_changed
         )
 
+        # Create Combobox for refresh workers
+        refresh_workers_frame = tk.Frame(self.general_frame)
+        refresh_workers_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.label_refresh_workers = tk.Label(
+            refresh_workers_frame
+        )
+        self.label_refresh_workers.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_refresh_workers = ttk.Combobox(
+            refresh_workers_frame,
+            values=list(range(1, Constants.REFRESH_MAX_WORKERS + 1))
+        )
+        self.combo_refresh_workers.set(
+            Context.get_refresh_workers()
+        )
+        self.combo_refresh_workers.config(state="readonly")
+        self.combo_refresh_workers.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_refresh_workers.bind(
+            "<<ComboboxSelected>>",
+            self.__on_entry_changed
+        )
+
+        # Create Combobox for execution workers
+        execution_workers_frame = tk.Frame(self.general_frame)
+        execution_workers_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.label_execution_workers = tk.Label(
+            execution_workers_frame
+        )
+        self.label_execution_workers.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_execution_workers = ttk.Combobox(
+            execution_workers_frame,
+            values=list(range(1, Constants.EXECUTION_MAX_WORKERS + 1))
+        )
+        self.combo_execution_workers.set(
+            Context.get_execution_workers()
+        )
+        self.combo_execution_workers.config(state="readonly")
+        self.combo_execution_workers.pack(
+            side=tk.LEFT,
+            padx=Constants.UI_PAD_SMALL
+        )
+        self.combo_execution_workers.bind(
+            "<<ComboboxSelected>>",
+            self.__on_entry_changed
+        )
+
         # Create simulation checkbox
         simulation_frame = tk.Frame(self.general_frame)
         simulation_frame.pack(
@@ -492,6 +568,108 @@ class SetupDialog:
             lambda e: simulation_checkbox.invoke()
         )
 
+        # Create sync with hash checkbox
+        sync_with_hash_frame = tk.Frame(self.general_frame)
+        sync_with_hash_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.sync_with_hash_boolean_var = tk.BooleanVar()
+        self.sync_with_hash_boolean_var.trace_add(
+            "write",
+            self.__on_entry_changed
+        )
+        self.sync_with_hash_boolean_var.set(
+            Context.is_sync_with_hash()
+        )
+        sync_with_hash_checkbox = tk.Checkbutton(
+            sync_with_hash_frame,
+            variable=self.sync_with_hash_boolean_var
+        )
+        sync_with_hash_checkbox.pack(
+            side=tk.LEFT,
+        )
+        self.label_sync_with_hash = tk.Label(
+            sync_with_hash_frame
+        )
+        self.label_sync_with_hash.pack(
+            side=tk.LEFT
+        )
+        self.label_sync_with_hash.bind(
+            "<Button-1>",
+            lambda e: sync_with_hash_checkbox.invoke()
+        )
+
+        # Create deduplicated store checkbox
+        deduplicated_store_frame = tk.Frame(self.general_frame)
+        deduplicated_store_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.deduplicated_store_boolean_var = tk.BooleanVar()
+        self.deduplicated_store_boolean_var.trace_add(
+            "write",
+            self.__on_entry_changed
+        )
+        self.deduplicated_store_boolean_var.set(
+            Context.is_deduplicated_store()
+        )
+        deduplicated_store_checkbox = tk.Checkbutton(
+            deduplicated_store_frame,
+            variable=self.deduplicated_store_boolean_var
+        )
+        deduplicated_store_checkbox.pack(
+            side=tk.LEFT,
+        )
+        self.label_deduplicated_store = tk.Label(
+            deduplicated_store_frame
+        )
+        self.label_deduplicated_store.pack(
+            side=tk.LEFT
+        )
+        self.label_deduplicated_store.bind(
+            "<Button-1>",
+            lambda e: deduplicated_store_checkbox.invoke()
+        )
+
+        # Create auto refresh checkbox
+        auto_refresh_frame = tk.Frame(self.general_frame)
+        auto_refresh_frame.pack(
+            side=tk.TOP,
+            fill=tk.X,
+            padx=Constants.UI_PAD_SMALL,
+            pady=Constants.UI_PAD_SMALL
+        )
+        self.auto_refresh_boolean_var = tk.BooleanVar()
+        self.auto_refresh_boolean_var.trace_add(
+            "write",
+            self.__on_entry_changed
+        )
+        self.auto_refresh_boolean_var.set(
+            Context.is_auto_refresh()
+        )
+        auto_refresh_checkbox = tk.Checkbutton(
+            auto_refresh_frame,
+            variable=self.auto_refresh_boolean_var
+        )
+        auto_refresh_checkbox.pack(
+            side=tk.LEFT,
+        )
+        self.label_auto_refresh = tk.Label(
+            auto_refresh_frame
+        )
+        self.label_auto_refresh.pack(
+            side=tk.LEFT
+        )
+        self.label_auto_refresh.bind(
+            "<Button-1>",
+            lambda e: auto_refresh_checkbox.invoke()
+        )
+
     def __create_emulators_components(self):
         """Create emulators components"""
 
@@ -1498,6 +1676,20 @@ class SetupDialog:
             )
         )
 
+        self.label_refresh_workers.config(
+            text=Context.get_text(
+                'refresh_workers',
+                lang=self.__lang_code
+            )
+        )
+
+        self.label_execution_workers.config(
+            text=Context.get_text(
+                'execution_workers',
+                lang=self.__lang_code
+            )
+        )
+
         self.label_simulation.config(
             text=Context.get_text(
                 'simulation',
@@ -1505,6 +1697,25 @@ class SetupDialog:
             )
         )
 
+        self.label_sync_with_hash.config(
+            text=Context.get_text(
+                'sync_with_hash',
+                lang=self.__lang_code
+            )
+        )
+        self.label_deduplicated_store.config(
+            text=Context.get_text(
+                'deduplicated_store',
+                lang=self.__lang_code
+            )
+        )
+        self.label_auto_refresh.config(
+            text=Context.get_text(
+                'auto_refresh',
+                lang=self.__lang_code
+            )
+        )
+
         self.emulators_frame.config(
             text=Context.get_text(
                 'setup_emulators',
@@ -2,7 +2,6 @@
 """Dialog to wait for a process"""
 
 import threading
-import time
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
@@ -11,6 +10,7 @@ from libraries.constants.constants import Constants
 from libraries.context.context import Context
 from libraries.logging.logging_helper import LoggingHelper
 from libraries.ui.ui_helper import UIHelper
+from libraries.ui.ui_progress import UIProgress
 
 # pylint: disable=attribute-defined-outside-init
 
@@ -63,6 +63,10 @@ class WaitingDialog:
             pady=Constants.UI_PAD_BIG
         )
         self.__transform_progress.start(10)
+        self.__progress = UIProgress(
+            dialog=self.__dialog,
+            progress_bar=self.__transform_progress
+        )
 
         # Run process in a Thread to avoid blocking UI
         threading.Thread(
@@ -83,9 +87,6 @@ class WaitingDialog:
     def __run_process(self):
         """Run process"""
 
-        # Waiting 0.1 seconde to see the dialog if the process is quick
-        time.sleep(0.1)
-
         # Waiting for the process
         try:
             self.__process_function(
@@ -98,14 +99,21 @@ class WaitingDialog:
                 ),
                 exc=exc
             )
-            messagebox.showerror(
+            self.__progress.run_in_ui(
+                messagebox.showerror,
                 title=Context.get_text('error_title'),
                 message=Context.get_text('error_message'),
                 parent=self.__dialog
             )
 
-        # Close the dialog after process
-        UIHelper.close_dialog(self.__dialog)
+        # Keep the dialog visible a minimum time if the process is quick
+        self.__progress.wait_minimum_display()
+
+        # Close the dialog after process, from the Tk main loop
+        self.__progress.run_in_ui(
+            UIHelper.close_dialog,
+            dialog=self.__dialog
+        )
 
     def should_interrupt(self):
         """Return True if interruption has been requested"""
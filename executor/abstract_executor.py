@@ -2,15 +2,24 @@
 """Abstract Executor"""
 
 from abc import ABC, abstractmethod
-from datetime import datetime
-import os
-import threading
 import tkinter as tk
-from tkinter import ttk
 
-from libraries.constants.constants import Action, Category, Constants
+from executor.execution_checkpoint import ExecutionCheckpoint
+from executor.execution_copy import ExecutionCopy
+from executor.execution_plan import ExecutionPlan
+from executor.execution_planner import ExecutionPlanner
+from executor.execution_planning import ExecutionPlanning
+from executor.execution_progress import ExecutionProgress
+from executor.execution_report import ExecutionReport
+from executor.execution_scheduler import ExecutionScheduler
+from executor.execution_status import ExecutionStatus
+from libraries.constants.constants import Category, Constants
 from libraries.context.context import Context
+from libraries.file.file_copy_helper import FileCopyHelper
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
+from libraries.refresh.refresh_watcher import RefreshWatcher
+from libraries.ui.ui_progress import UIProgress
 
 
 class AbstractExecutor(ABC):
@@ -18,45 +27,196 @@ class AbstractExecutor(ABC):
 
     def __init__(
         self,
-        progress_bar: ttk.Progressbar,
-        progress_label: tk.Label,
+        progress: UIProgress,
         button_close: tk.Button
     ):
         """Initialize executor"""
 
-        self.__execution_finished: bool = False
-        self.__stop_execution = threading.Event()
-        self.__progress_bar = progress_bar
-        self.__progress_label = progress_label
-        self.__button_close = button_close
-        self.__ids_dones = []
-        self.__copy_folder_path = None
-        if Context.get_selected_action() == Action.COPY:
-            self.__copy_folder_path = os.path.join(
-                Context.get_selected_folder_path(),
-                f'copy_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+        self.__status = ExecutionStatus()
+        self.__progress = ExecutionProgress(
+            progress=progress,
+            button_close=button_close
+        )
+        self.__copy = ExecutionCopy()
+        self.__planning = ExecutionPlanning(
+            plan_item=self.__plan_item
+        )
+        self.__scheduler = ExecutionScheduler(
+            execute_item=self.__execute_item,
+            commit_item=self.__commit_item,
+            is_interrupted=self.__status.is_interrupted
+        )
+        self.__checkpoint = None
+        self.__report = None
+
+    def resume_execution(
+        self,
+        checkpoint: ExecutionCheckpoint
+    ):
+        """Resume an interrupted execution from its checkpoint"""
+
+        self.__checkpoint = checkpoint
+        if checkpoint.get_copy_folder_path() is not None:
+            self.__copy.set_folder_path(
+                folder_path=checkpoint.get_copy_folder_path()
             )
 
     def stop_execution(self):
         """Stop execution"""
 
-        self.__stop_execution.set()
+        self.__status.request_stop()
 
     def is_execution_finished(self) -> bool:
         """Specify if execution finished"""
 
-        return self.__execution_finished
+        return self.__status.is_finished()
+
+    def is_execution_failed(self) -> bool:
+        """Specify if execution failed on an item"""
+
+        return self.__status.is_failed()
 
     def get_copy_folder_path(self) -> str:
         """Get copy folder's path"""
 
-        return self.__copy_folder_path
+        return self.__copy.get_folder_path()
+
+    def copy_or_sync_file(
+        self,
+        source_file_path: str,
+        destination_file_path: str
+    ):
+        """Copy a file for COPY action (synchronize it if requested)"""
+
+        self.__copy.copy_or_sync_file(
+            source_file_path=source_file_path,
+            destination_file_path=destination_file_path
+        )
+
+    def copy_or_sync_folder(
+        self,
+        source_folder_path: str,
+        destination_folder_path: str
+    ):
+        """Copy a folder for COPY action (synchronize it if requested)"""
+
+        self.__copy.copy_or_sync_folder(
+            source_folder_path=source_folder_path,
+            destination_folder_path=destination_folder_path
+        )
+
+    def write_shared(
+        self,
+        write_function,
+        **kwargs
+    ):
+        """
+        Write shared data (database, shared files, registry) for the current item.
+
+        In concurrent execution, writes are done after the item by a single
+        writer, in the order of the items, otherwise they are done immediately.
+        """
+
+        self.__scheduler.write_shared(
+            write_function,
+            **kwargs
+        )
+
+    def read_shared(
+        self,
+        read_function,
+        **kwargs
+    ):
+        """Read shared data, never while the writer writes it"""
+
+        return self.__scheduler.read_shared(
+            read_function,
+            **kwargs
+        )
+
+    def __on_copy_progress(
+        self,
+        file_path: str,
+        copied_size: int,
+        total_size: int
+    ) -> bool:
+        """Called while a file is copied, return False to interrupt the copy"""
+
+        # Interrupt the copy if execution stopped
+        if self.__status.is_stop_requested():
+            return False
+
+        self.__progress.report_copy(
+            file_path=file_path,
+            copied_size=copied_size,
+            total_size=total_size
+        )
+
+        return True
+
+    def __create_checkpoint(
+        self,
+        rows: list
+    ):
+        """Journal a new execution, replacing the checkpoint of an interrupted one"""
+
+        # Files partially copied by an interrupted execution not resumed are useless
+        previous_checkpoint = ExecutionCheckpoint.load()
+        if previous_checkpoint is not None and \
+                previous_checkpoint.get_copy_folder_path() is not None:
+            FileCopyHelper.delete_partial_files(
+                folder_path=previous_checkpoint.get_copy_folder_path()
+            )
+
+        self.__checkpoint = ExecutionCheckpoint.create(
+            rows=rows,
+            copy_folder_path=self.__copy.get_folder_path()
+        )
 
     def execute(self):
         """Execute"""
 
+        # Report files copy progress
+        FileCopyHelper.set_progress_listener(
+            progress_listener=self.__on_copy_progress
+        )
+        self.__report = ExecutionReport()
+
+        # Changes of the execution are refreshed by its callback, not by the watcher
+        RefreshWatcher.pause()
+        try:
+            self.__execute()
+        finally:
+            RefreshWatcher.resume()
+            FileCopyHelper.set_progress_listener(
+                progress_listener=None
+            )
+            self.__write_report()
+
+    def __write_report(self):
+        """Write the metrics of the items, and show their summary"""
+
+        try:
+            self.__report.log_summary()
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'execution_report_written',
+                    file=self.__report.write_report()
+                )
+            )
+        except Exception as exc:
+            LoggingHelper.log_error(
+                Context.get_text(
+                    'error_unknown'
+                ),
+                exc
+            )
+
+    def __execute(self):
+        """Execute for all selected rows"""
+
         # Fix text Stop for button to close
-        self.__button_close.config(
+        self.__progress.set_button_text(
             text=Context.get_text('stop')
         )
 
@@ -88,85 +248,292 @@ class AbstractExecutor(ABC):
             case Category.CONFIGS:
                 rows = Context.get_selected_configs_rows()
 
-        # Initialize progress bar
-        self.__progress_bar.config(maximum=len(rows))
-
-        item_current_counter = 1
-        for row in rows:
-
-            # Continue if execution stopped
-            if self.__stop_execution.is_set():
-                return
-
-            # Increment progress bar
-            self.__progress_bar['value'] = item_current_counter
-            self.__progress_label.config(
-                text=Context.get_text(
-                    'execution_in_progress',
-                    item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
-                    item_current_counter=item_current_counter,
-                    item_total_counter=len(rows)
-                )
-            )
-
-            # Show execution line for the current item
+        # Skip items completed before the interruption, or journal a new execution
+        if self.__checkpoint is not None:
+            rows = self.__checkpoint.list_rows()
+            completed_ids = self.__checkpoint.list_completed_ids()
             LoggingHelper.log_info(
                 message=Context.get_text(
-                    'execution_in_progress',
-                    item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
-                    item_current_counter=item_current_counter,
-                    item_total_counter=len(rows)
+                    'execution_resumed',
+                    completed_count=len(completed_ids),
+                    total_count=len(rows)
                 )
             )
-
-            # Append id
-            self.__ids_dones.append(
-                row[Constants.UI_TABLE_KEY_COL_ID]
+            self.__status.add_ids_done(completed_ids)
+            rows = [
+                row
+                for row in rows
+                if row[Constants.UI_TABLE_KEY_COL_ID] not in completed_ids
+            ]
+        else:
+            self.__create_checkpoint(
+                rows=rows
             )
 
-            # Do execution for the current item
-            try:
-                self.do_execution(
-                    item_id=row[Constants.UI_TABLE_KEY_COL_ID]
-                )
-            except Exception as exc:
-                LoggingHelper.log_error(
-                    Context.get_text(
-                        'error_execution',
-                        item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
-                        error=str(exc)
-                    ),
-                    exc
-                )
+        # Initialize progress bar
+        self.__progress.start(len(rows))
 
-                # Stop execution if error
-                self.__execution_finished = True
-                return
+        # Plan items in background ahead of their execution
+        self.__planning.start(
+            rows=rows
+        )
+
+        # Execute items in a pipeline or by several workers
+        try:
+            failed_row, failed_error = self.__scheduler.execute(
+                rows=rows,
+                workers=Context.get_execution_workers()
+            )
+        finally:
+            self.__planning.stop()
+        if not self.__end_items_execution(
+            failed_row=failed_row,
+            failed_error=failed_error
+        ):
+            return
+
+        # Apply modifications batched for all items
+        self.__finalize_execution()
 
-            item_current_counter += 1
+        # Execution can't be resumed anymore
+        self.__checkpoint.delete()
 
         # Finish progression
-        self.__progress_bar['value'] = item_current_counter
-        self.__progress_label.config(
-            text=Context.get_text('execution_finished')
-        )
+        self.__progress.finish(len(rows))
+
+        # Show summary for synchronization
+        self.__copy.log_summary()
 
         # Show message for execution finished
         LoggingHelper.log_info(
             message=Context.get_text('execution_finished')
         )
-        self.__execution_finished = True
+        self.__status.set_finished()
 
         # Fix text Close for button to close
-        self.__button_close.config(
+        self.__progress.set_button_text(
             text=Context.get_text('close')
         )
 
+    def __plan_item(
+        self,
+        row: dict
+    ):
+        """Plan a row, return its plan (None if not planned) and its error"""
+
+        MetricsHelper.start_recording(
+            record=self.__report.get_record(row)
+        )
+        try:
+            return self.do_planning(
+                item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+            ), None
+        except Exception as exc:
+            return None, exc
+        finally:
+            MetricsHelper.stop_recording()
+
+    def __execute_plan(
+        self,
+        plan: ExecutionPlan
+    ):
+        """Execute operations of a plan in their order, except the ones completed before"""
+
+        completed_operations = self.__checkpoint.list_completed_operations(
+            item_id=plan.get_item_id()
+        )
+        try:
+            for operation in plan.list_operations():
+                if ExecutionPlan.is_write(operation):
+                    self.write_shared(
+                        operation['function'],
+                        **operation['kwargs']
+                    )
+                elif ExecutionCheckpoint.get_operation_key(
+                    operation=operation
+                ) not in completed_operations:
+                    operation['function'](**operation['kwargs'])
+
+                    # Stop item if execution stopped, as the operation may be interrupted
+                    if self.__status.is_stop_requested():
+                        return
+
+                    # Journal file operation, written data are journaled with the item
+                    self.__checkpoint.complete_operation(
+                        item_id=plan.get_item_id(),
+                        operation=operation
+                    )
+
+                # Increment progress bar by the size of the operation
+                self.__progress.add_planned_done_size(
+                    ExecutionPlanner.get_operation_size(
+                        operation=operation
+                    )
+                )
+        finally:
+            # Flush the operations journaled by the item once
+            self.__checkpoint.sync_operations()
+
+    def __execute_item(
+        self,
+        row: dict,
+        item_current_counter: int,
+        item_total_counter: int
+    ) -> Exception:
+        """Execute a row (its plan if planned, planned again if stale), return its error"""
+
+        plan, error = self.__planning.get_plan(
+            row=row
+        )
+
+        # Execute an item in conflict once the previous items are done, planned again if stale
+        if plan is not None and self.__planning.is_ordered(
+            row=row
+        ):
+            self.__scheduler.wait_committed_items(
+                items_count=item_current_counter - 1
+            )
+            plan, error = self.__planning.plan_again(
+                row=row,
+                plan=plan,
+                error=error
+            )
+
+        # The progress follows the bytes once items are planned
+        planner = self.__planning.get_planner()
+        if planner is not None:
+            self.__progress.set_planner(
+                planner=planner
+            )
+        self.__progress.start_item(
+            row=row,
+            item_current_counter=item_current_counter,
+            item_total_counter=item_total_counter
+        )
+        self.__status.add_ids_done([row[Constants.UI_TABLE_KEY_COL_ID]])
+
+        # Do execution for the current item, collecting its metrics
+        if error is None:
+            MetricsHelper.start_recording(
+                record=self.__report.get_record(row)
+            )
+            try:
+                if plan is None:
+                    self.do_execution(
+                        item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+                    )
+                else:
+                    self.__execute_plan(
+                        plan=plan
+                    )
+            except Exception as exc:
+                error = exc
+            finally:
+                MetricsHelper.stop_recording()
+
+        if error is not None:
+            self.__status.set_failed()
+
+        return error
+
+    def __commit_item(
+        self,
+        row: dict,
+        item_current_counter: int,
+        writes: list,
+        error: Exception
+    ) -> Exception:
+        """Write shared data of an executed row, return its error (or the one of the execution)"""
+
+        MetricsHelper.start_recording(
+            record=self.__report.get_record(row)
+        )
+        try:
+            self.__scheduler.write(
+                writes=writes
+            )
+        except Exception as exc:
+            self.__status.set_failed()
+            if error is None:
+                error = exc
+        finally:
+            MetricsHelper.stop_recording()
+
+        # Journal completed item after the finalization, not if maybe interrupted
+        if error is None and not self.__status.is_stop_requested():
+            self.__status.add_id_written(row[Constants.UI_TABLE_KEY_COL_ID])
+
+        # Increment progress bar
+        self.__progress.end_item(item_current_counter)
+
+        return error
+
+    def __end_items_execution(
+        self,
+        failed_row: dict,
+        failed_error: Exception
+    ) -> bool:
+        """End execution of rows, return False if stopped or failed"""
+
+        # Stop execution if error
+        if failed_error is not None:
+            LoggingHelper.log_error(
+                Context.get_text(
+                    'error_execution',
+                    item_name=failed_row[Constants.UI_TABLE_KEY_COL_NAME],
+                    error=str(failed_error)
+                ),
+                failed_error
+            )
+            self.__finalize_execution()
+            self.__status.set_finished()
+            return False
+
+        # Stop execution if requested
+        if self.__status.is_stop_requested():
+            self.__finalize_execution()
+            return False
+
+        return True
+
+    def __finalize_execution(self):
+        """Finalize execution for items done"""
+
+        MetricsHelper.start_recording(
+            record=self.__report.get_record(None)
+        )
+        try:
+            self.do_finalization()
+
+            # Items are completed only once their batched modifications are applied
+            self.__checkpoint.complete_items(
+                items_ids=self.__status.pop_ids_written()
+            )
+        except Exception as exc:
+            LoggingHelper.log_error(
+                Context.get_text(
+                    'error_unknown'
+                ),
+                exc
+            )
+        finally:
+            MetricsHelper.stop_recording()
+
     def get_ids_done(self) -> list:
         """Return ids done"""
 
-        return self.__ids_dones
+        return self.__status.list_ids_done()
 
     @abstractmethod
     def do_execution(self, item_id: str):
         """Do execution for an item"""
+
+    def do_planning(self, item_id: str) -> ExecutionPlan:
+        """Do planning for an item, None if not planned (executed by do_execution)"""
+
+        # pylint: disable=unused-argument
+
+        return None
+
+    def do_finalization(self):
+        """Do finalization after the execution of all items"""
@@ -72,7 +72,8 @@ class BDDTablesExecutor(AbstractExecutor):
         # Uninstall BDD Tables
         if Component.PINUP_DATABASE in Context.get_selected_components():
 
-            BddHelper.delete_items(
+            self.write_shared(
+                BddHelper.delete_items,
                 bdd_file_path=Context.get_pinup_bdd_path(),
                 bdd_table_name=bdd_table_name
             )
@@ -123,7 +124,8 @@ class BDDTablesExecutor(AbstractExecutor):
                 items.append(item)
 
             # Insert data
-            BddHelper.insert_items(
+            self.write_shared(
+                BddHelper.insert_items,
                 bdd_file_path=Context.get_pinup_bdd_path(),
                 bdd_table_name=bdd_table_name,
                 items=items
@@ -140,7 +142,8 @@ class BDDTablesExecutor(AbstractExecutor):
 
             # Retrieve data from items
             data = []
-            for item in BddHelper.list_items(
+            for item in self.read_shared(
+                BddHelper.list_items,
                 bdd_file_path=Context.get_pinup_bdd_path(),
                 table_name=bdd_table_name
             ):
@@ -7,6 +7,7 @@ from executor.abstract_executor import AbstractExecutor
 from libraries.constants.constants import Action, Component, Constants
 from libraries.context.context import Context
 from libraries.file.file_helper import FileHelper
+from libraries.file.file_sync_helper import FileSyncHelper
 from libraries.winreg.winreg_helper import WinRegHelper
 
 
@@ -15,12 +16,13 @@ class ConfigsExecutor(AbstractExecutor):
 
     def __execute_uninstall(
         self,
-        config: str
+        config: str,
+        with_files: bool = True
     ):
         """Execute uninstall"""
 
         # Uninstall FILES
-        if Component.FILES in Context.get_selected_components():
+        if with_files and Component.FILES in Context.get_selected_components():
             config_path = os.path.join(
                 Context.get_configs_path(),
                 config,
@@ -59,7 +61,8 @@ class ConfigsExecutor(AbstractExecutor):
                     if not key.startswith(Constants.REGEDIT_ROOT_KEY_NAME):
                         continue
 
-                    WinRegHelper.delete_user_key(
+                    self.write_shared(
+                        WinRegHelper.delete_user_key,
                         key=key[len(Constants.REGEDIT_ROOT_KEY_NAME) + 1:]
                     )
 
@@ -69,7 +72,7 @@ class ConfigsExecutor(AbstractExecutor):
     ):
         """Execute install"""
 
-        # Install FILES
+        # Install FILES, copying only missing or changed files
         if Component.FILES in Context.get_selected_components():
             config_path = os.path.join(
                 Context.get_configs_path(),
@@ -81,7 +84,7 @@ class ConfigsExecutor(AbstractExecutor):
                 file_name='*',
                 error_if_not_found=False
             ):
-                FileHelper.copy_file(
+                FileSyncHelper.sync_file(
                     source_file_path=os.path.join(
                         config_path,
                         relative_path
@@ -89,7 +92,8 @@ class ConfigsExecutor(AbstractExecutor):
                     destination_file_path=os.path.join(
                         str(Context.get_pinup_path().drive) + '\\',
                         relative_path
-                    )
+                    ),
+                    with_hash=Context.is_sync_with_hash()
                 )
 
         # Install REGISTRY
@@ -104,7 +108,8 @@ class ConfigsExecutor(AbstractExecutor):
                 file_name='*',
                 error_if_not_found=False
             ):
-                WinRegHelper.import_user_key(
+                self.write_shared(
+                    WinRegHelper.import_user_key,
                     extracted_file_path=os.path.join(
                         config_path,
                         relative_path
@@ -178,8 +183,10 @@ class ConfigsExecutor(AbstractExecutor):
                 )
 
             case Action.INSTALL:
+                # Files are all installed again, so only registry is uninstalled
                 self.__execute_uninstall(
-                    config=item_id
+                    config=item_id,
+                    with_files=False
                 )
                 self.__execute_install(
                     config=item_id
@@ -0,0 +1,279 @@
+#!/usr/bin/python3
+"""Execution Checkpoint"""
+
+import json
+import os
+import threading
+
+from libraries.constants.constants import Action, Category, Constants
+from libraries.context.context import Context
+
+
+class ExecutionCheckpoint:
+    """
+    Class to journal an execution in the cache, to resume it if interrupted.
+
+    The journal holds the selection and the items completed. It is written
+    again after the finalization for the items completed (their batched
+    modifications are only applied then). The file operations completed by
+    the items in progress are appended to a log beside it, flushed to the disk
+    once per item. Both are deleted when the execution is finished.
+    """
+
+    def __init__(
+        self,
+        journal: dict,
+        completed_operations: dict
+    ):
+        """Initialize checkpoint"""
+
+        self.__journal = journal
+        self.__completed_operations = completed_operations
+        self.__lock = threading.Lock()
+        self.__operations_lock = threading.Lock()
+
+    @staticmethod
+    def __get_checkpoint_path() -> str:
+        """Get checkpoint's path"""
+
+        return os.path.join(
+            Context.get_cache_path(),
+            Constants.EXECUTION_CHECKPOINT_FILE_NAME
+        )
+
+    @staticmethod
+    def __get_operations_log_path() -> str:
+        """Get path of the log of the completed operations"""
+
+        return os.path.join(
+            Context.get_cache_path(),
+            Constants.EXECUTION_CHECKPOINT_LOG_FILE_NAME
+        )
+
+    @staticmethod
+    def __get_selection() -> dict:
+        """Get the current selection, as saved in the journal"""
+
+        selection = {
+            'category': Context.get_selected_category().name,
+            'emulator': None,
+            'action': Context.get_selected_action().name,
+            'components': [
+                component.name
+                for component in Context.get_selected_components()
+            ],
+            'folder_path': None,
+            'copy_sync': False
+        }
+        if Context.get_selected_category() == Category.TABLES:
+            selection['emulator'] = Context.get_selected_emulator().name
+        if Context.get_selected_action() == Action.COPY:
+            selection['folder_path'] = str(Context.get_selected_folder_path())
+            selection['copy_sync'] = Context.is_selected_copy_sync()
+
+        return selection
+
+    @staticmethod
+    def get_operation_key(
+        operation: dict
+    ) -> str:
+        """Get the key of a planned operation in the journal"""
+
+        return f'{operation["type"]}:{operation["path"]}'
+
+    @staticmethod
+    def create(
+        rows: list,
+        copy_folder_path: str
+    ):
+        """Create the checkpoint of a new execution"""
+
+        journal = {
+            'selection': ExecutionCheckpoint.__get_selection(),
+            'copy_folder_path': copy_folder_path,
+            'rows': rows,
+            'completed_ids': []
+        }
+        ExecutionCheckpoint.__write_journal(
+            journal=journal
+        )
+
+        # Start an empty log of the completed operations
+        with open(
+            ExecutionCheckpoint.__get_operations_log_path(),
+            mode='w',
+            encoding='UTF-8'
+        ):
+            pass
+
+        return ExecutionCheckpoint(
+            journal=journal,
+            completed_operations={}
+        )
+
+    @staticmethod
+    def load():
+        """Load the checkpoint of an interrupted execution, None if not found"""
+
+        try:
+            with open(
+                ExecutionCheckpoint.__get_checkpoint_path(),
+                mode='r',
+                encoding='UTF-8'
+            ) as checkpoint_file:
+                journal = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return None
+
+        return ExecutionCheckpoint(
+            journal=journal,
+            completed_operations=ExecutionCheckpoint.__read_operations_log(
+                completed_ids=journal['completed_ids']
+            )
+        )
+
+    @staticmethod
+    def __read_operations_log(
+        completed_ids: list
+    ) -> dict:
+        """Read keys of the operations completed by the items in progress, by item id"""
+
+        completed_operations = {}
+        try:
+            with open(
+                ExecutionCheckpoint.__get_operations_log_path(),
+                mode='r',
+                encoding='UTF-8'
+            ) as log_file:
+                for line in log_file:
+                    try:
+                        item_id, operation_key = json.loads(line)
+                    except (TypeError, ValueError):
+                        # Last line cut by the interruption
+                        continue
+                    if item_id not in completed_ids:
+                        completed_operations.setdefault(item_id, []).append(operation_key)
+        except FileNotFoundError:
+            pass
+
+        return completed_operations
+
+    @staticmethod
+    def __write_journal(
+        journal: dict
+    ):
+        """Write a journal atomically, so a power loss keeps the previous one"""
+
+        checkpoint_path = ExecutionCheckpoint.__get_checkpoint_path()
+        partial_path = checkpoint_path + Constants.FILE_COPY_PARTIAL_EXTENSION
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        with open(
+            partial_path,
+            mode='w',
+            encoding='UTF-8'
+        ) as checkpoint_file:
+            json.dump(
+                journal,
+                checkpoint_file,
+                default=str
+            )
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(partial_path, checkpoint_path)
+
+    def __save(self):
+        """Save the journal"""
+
+        ExecutionCheckpoint.__write_journal(
+            journal=self.__journal
+        )
+
+    def delete(self):
+        """Delete the checkpoint of a finished execution"""
+
+        with self.__lock, self.__operations_lock:
+            for file_path in [
+                ExecutionCheckpoint.__get_checkpoint_path(),
+                ExecutionCheckpoint.__get_operations_log_path()
+            ]:
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+    def is_matching_selection(self) -> bool:
+        """Specify if the checkpoint was created for the current selection"""
+
+        return self.__journal.get('selection', None) == \
+            ExecutionCheckpoint.__get_selection()
+
+    def list_rows(self) -> list:
+        """List rows selected for the execution"""
+
+        return self.__journal['rows']
+
+    def get_copy_folder_path(self) -> str:
+        """Get copy folder's path of the execution"""
+
+        return self.__journal['copy_folder_path']
+
+    def list_completed_ids(self) -> list:
+        """List ids of completed items"""
+
+        return list(self.__journal['completed_ids'])
+
+    def list_completed_operations(
+        self,
+        item_id: str
+    ) -> list:
+        """List keys of the operations completed by an item in progress"""
+
+        with self.__operations_lock:
+            return list(self.__completed_operations.get(item_id, []))
+
+    def complete_operation(
+        self,
+        item_id: str,
+        operation: dict
+    ):
+        """Append an operation completed by an item in progress to the log"""
+
+        operation_key = ExecutionCheckpoint.get_operation_key(
+            operation=operation
+        )
+        with self.__operations_lock:
+            self.__completed_operations.setdefault(item_id, []).append(operation_key)
+            with open(
+                ExecutionCheckpoint.__get_operations_log_path(),
+                mode='a',
+                encoding='UTF-8'
+            ) as log_file:
+                log_file.write(json.dumps([item_id, operation_key], default=str) + '\n')
+
+    def sync_operations(self):
+        """Flush the log of the completed operations to the disk, once per item"""
+
+        with self.__operations_lock:
+            with open(
+                ExecutionCheckpoint.__get_operations_log_path(),
+                mode='a',
+                encoding='UTF-8'
+            ) as log_file:
+                os.fsync(log_file.fileno())
+
+    def complete_items(
+        self,
+        items_ids: list
+    ):
+        """Save completed items, once their batched modifications are applied"""
+
+        if len(items_ids) == 0:
+            return
+
+        with self.__operations_lock:
+            for item_id in items_ids:
+                self.__completed_operations.pop(item_id, None)
+
+        with self.__lock:
+            self.__journal['completed_ids'].extend(items_ids)
+            self.__save()
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""Execution Copy"""
+
+from datetime import datetime
+import os
+import threading
+
+from libraries.constants.constants import Action
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.file.file_sync_helper import FileSyncHelper
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class ExecutionCopy:
+    """
+    Class to copy the files of the items for COPY action.
+
+    Files are copied in a new folder, or synchronized directly in the selected
+    folder if requested, summing the sizes synchronized by all the items.
+    """
+
+    def __init__(self):
+        """Initialize copy for the selected action"""
+
+        self.__folder_path = None
+        self.__sync = False
+        self.__sync_summary = {
+            'copied_size': 0,
+            'skipped_size': 0,
+            'deleted_files_count': 0
+        }
+        self.__lock = threading.Lock()
+        if Context.get_selected_action() == Action.COPY:
+            if Context.is_selected_copy_sync():
+                # Synchronize directly the selected folder
+                self.__sync = True
+                self.__folder_path = Context.get_selected_folder_path()
+            else:
+                self.__folder_path = os.path.join(
+                    Context.get_selected_folder_path(),
+                    f'copy_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+                )
+
+    def get_folder_path(self) -> str:
+        """Get copy folder's path, None if not COPY action"""
+
+        return self.__folder_path
+
+    def set_folder_path(
+        self,
+        folder_path: str
+    ):
+        """Set copy folder's path, as the one of a resumed execution"""
+
+        self.__folder_path = folder_path
+
+    def copy_or_sync_file(
+        self,
+        source_file_path: str,
+        destination_file_path: str
+    ):
+        """Copy a file (synchronize it if requested)"""
+
+        if not self.__sync:
+            FileHelper.copy_file(
+                source_file_path=source_file_path,
+                destination_file_path=destination_file_path
+            )
+            return
+
+        if not os.path.exists(source_file_path):
+            return
+
+        file_size = os.path.getsize(source_file_path)
+        synchronized = FileSyncHelper.sync_file(
+            source_file_path=source_file_path,
+            destination_file_path=destination_file_path,
+            with_hash=Context.is_sync_with_hash()
+        )
+        with self.__lock:
+            if synchronized:
+                self.__sync_summary['copied_size'] += file_size
+            else:
+                self.__sync_summary['skipped_size'] += file_size
+
+    def copy_or_sync_folder(
+        self,
+        source_folder_path: str,
+        destination_folder_path: str
+    ):
+        """Copy a folder (synchronize it if requested)"""
+
+        if not self.__sync:
+            FileHelper.copy_folder(
+                source_folder_path=source_folder_path,
+                destination_folder_path=destination_folder_path
+            )
+            return
+
+        copied_size, skipped_size, deleted_files_count = FileSyncHelper.sync_folder(
+            source_folder_path=source_folder_path,
+            destination_folder_path=destination_folder_path,
+            delete_stale_files=Context.is_selected_copy_sync_delete(),
+            with_hash=Context.is_sync_with_hash()
+        )
+        with self.__lock:
+            self.__sync_summary['copied_size'] += copied_size
+            self.__sync_summary['skipped_size'] += skipped_size
+            self.__sync_summary['deleted_files_count'] += deleted_files_count
+
+    def log_summary(self):
+        """Show summary for synchronization"""
+
+        if not self.__sync:
+            return
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'sync_summary',
+                copied_size=self.__sync_summary['copied_size'] // (1024 * 1024),
+                skipped_size=self.__sync_summary['skipped_size'] // (1024 * 1024),
+                deleted_files_count=self.__sync_summary['deleted_files_count']
+            )
+        )
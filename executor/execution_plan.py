@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+"""Execution Plan"""
+
+import os
+
+from libraries.file.file_helper import FileHelper
+
+
+class ExecutionPlan:
+    """
+    Class to hold the operations planned for an item.
+
+    Folders are listed while planning, so the operations only have to move
+    bytes and write shared data when the plan is executed. Paths compared to
+    the installed files without operation are kept as checked, the plan is
+    stale if another item modifies them before it is executed.
+    """
+
+    # Types of operations
+    COPY = 'copy'
+    DELETE = 'delete'
+    DELETE_FOLDER = 'delete_folder'
+    WRITE = 'write'
+
+    # Types of writes of the database row of an item
+    INSERT_ROW = 'insert_row'
+    DELETE_ROW = 'delete_row'
+    WRITE_TYPES = [WRITE, INSERT_ROW, DELETE_ROW]
+
+    def __init__(
+        self,
+        item_id: str
+    ):
+        """Initialize plan"""
+
+        self.__item_id = item_id
+        self.__operations = []
+        self.__checked_paths = []
+
+    def get_item_id(self) -> str:
+        """Get id of the planned item"""
+
+        return self.__item_id
+
+    def __add_operation(
+        self,
+        operation_type: str,
+        operation_function,
+        kwargs: dict,
+        path: str = None,
+        size: int = 0
+    ):
+        """Add an operation"""
+
+        self.__operations.append({
+            'type': operation_type,
+            'function': operation_function,
+            'kwargs': kwargs,
+            'path': path,
+            'size': size
+        })
+
+    def add_copy(
+        self,
+        source_file_path: str,
+        destination_file_path: str,
+        force: bool = False
+    ):
+        """Plan a file copy, even if the destination has the same size if forced"""
+
+        size = 0
+        if os.path.isfile(source_file_path):
+            size = os.path.getsize(source_file_path)
+
+        self.__add_operation(
+            operation_type=ExecutionPlan.COPY,
+            operation_function=FileHelper.copy_file,
+            kwargs={
+                'source_file_path': source_file_path,
+                'destination_file_path': destination_file_path,
+                'force': force
+            },
+            path=destination_file_path,
+            size=size
+        )
+
+    def add_delete(
+        self,
+        file_path: str
+    ):
+        """Plan a file deletion"""
+
+        self.__add_operation(
+            operation_type=ExecutionPlan.DELETE,
+            operation_function=FileHelper.delete_file,
+            kwargs={
+                'file_path': file_path
+            },
+            path=file_path
+        )
+
+    def add_delete_folder(
+        self,
+        folder_path: str
+    ):
+        """Plan a folder deletion"""
+
+        self.__add_operation(
+            operation_type=ExecutionPlan.DELETE_FOLDER,
+            operation_function=FileHelper.delete_folder,
+            kwargs={
+                'folder_path': folder_path
+            },
+            path=folder_path
+        )
+
+    def add_write(
+        self,
+        write_function,
+        target: str = None,
+        write_type: str = WRITE,
+        **kwargs
+    ):
+        """Plan a write of shared data (database, shared files, registry) on a target"""
+
+        self.__add_operation(
+            operation_type=write_type,
+            operation_function=write_function,
+            kwargs=kwargs,
+            path=target
+        )
+
+    @staticmethod
+    def is_write(
+        operation: dict
+    ) -> bool:
+        """Specify if an operation writes shared data"""
+
+        return operation['type'] in ExecutionPlan.WRITE_TYPES
+
+    def add_checked_path(
+        self,
+        path: str
+    ):
+        """Keep a path compared to the installed files, without operation"""
+
+        self.__checked_paths.append(path)
+
+    def list_checked_paths(self) -> list:
+        """List paths compared to the installed files, without operation"""
+
+        return self.__checked_paths
+
+    def add_planned_operation(
+        self,
+        operation: dict
+    ):
+        """Add an operation planned in another plan"""
+
+        self.__operations.append(operation)
+
+    def list_operations(self) -> list:
+        """List operations in their order, as dicts of type, function, kwargs, path and size"""
+
+        return self.__operations
@@ -0,0 +1,360 @@
+#!/usr/bin/python3
+"""Execution Planner"""
+
+import datetime
+import os
+import threading
+import time
+
+from executor.execution_plan import ExecutionPlan
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class ExecutionPlanner:
+    """
+    Class to estimate and verify the plans of the items, as they are planned.
+
+    Operations are weighted by the bytes they copy, so the progress and the
+    remaining time follow the bytes instead of the items, the items not
+    planned yet being estimated from the planned ones. Plans are made ahead
+    of the execution: items depending on files modified by previous items
+    are planned again before being executed, and items in conflict with
+    previous items are executed once the previous items are done.
+    """
+
+    def __init__(
+        self,
+        items_count: int
+    ):
+        """Initialize planner for the items to plan"""
+
+        self.__counts = {
+            'items': items_count,
+            'planned_items': 0,
+            'plans': 0,
+            'files': 0
+        }
+        self.__planned_size = 0
+        self.__done_size = 0
+        self.__start_time = None
+        self.__paths = {
+            'operations': {},
+            'modified': set(),
+            'modified_parents': set()
+        }
+        self.__issues = {
+            'duplicates': {},
+            'conflicts': {},
+            'dependent_ids': [],
+            'ordered_ids': set()
+        }
+        self.__lock = threading.Lock()
+
+    def __add_plan_size(
+        self,
+        plan: ExecutionPlan,
+        sign: int
+    ):
+        """Add (or remove if negative sign) the size and the files of a plan"""
+
+        for operation in plan.list_operations():
+            self.__planned_size += sign * ExecutionPlanner.get_operation_size(
+                operation=operation
+            )
+            if operation['type'] in [ExecutionPlan.COPY, ExecutionPlan.DELETE]:
+                self.__counts['files'] += sign
+
+    def add_plan(
+        self,
+        plan: ExecutionPlan
+    ):
+        """Add the plan of the next item (None if not planned), verified against previous ones"""
+
+        with self.__lock:
+            self.__counts['planned_items'] += 1
+            if plan is None:
+                return
+
+            self.__counts['plans'] += 1
+            self.__add_plan_size(
+                plan=plan,
+                sign=1
+            )
+            if self.__is_dependent(
+                plan=plan
+            ):
+                self.__issues['dependent_ids'].append(plan.get_item_id())
+                self.__issues['ordered_ids'].add(plan.get_item_id())
+            if self.__is_conflicting(
+                plan=plan
+            ):
+                self.__issues['ordered_ids'].add(plan.get_item_id())
+
+    def replace_plan(
+        self,
+        previous_plan: ExecutionPlan,
+        plan: ExecutionPlan
+    ):
+        """Replace the estimation of a plan by the one of the plan made again"""
+
+        with self.__lock:
+            self.__add_plan_size(
+                plan=previous_plan,
+                sign=-1
+            )
+            self.__add_plan_size(
+                plan=plan,
+                sign=1
+            )
+
+    @staticmethod
+    def get_operation_size(
+        operation: dict
+    ) -> int:
+        """Get the size of an operation, weighted for the operations without bytes"""
+
+        return operation['size'] + Constants.EXECUTION_OPERATION_SIZE
+
+    def is_planned(self) -> bool:
+        """Specify if items are planned, so the progress can follow their bytes"""
+
+        return self.__counts['plans'] > 0
+
+    def get_total_size(self) -> int:
+        """Get the size of all operations, estimated from the planned ones for the other items"""
+
+        with self.__lock:
+            if self.__counts['planned_items'] == 0:
+                return self.__planned_size
+
+            return self.__planned_size + self.__planned_size * (
+                self.__counts['items'] - self.__counts['planned_items']
+            ) // self.__counts['planned_items']
+
+    def get_files_count(self) -> int:
+        """Get how many files are copied or deleted"""
+
+        return self.__counts['files']
+
+    @staticmethod
+    def __normalize_path(
+        path: str
+    ) -> str:
+        """Normalize a path to compare it with the others"""
+
+        return os.path.normcase(os.path.normpath(str(path)))
+
+    @staticmethod
+    def __list_parent_paths(
+        path: str
+    ) -> list:
+        """List the paths of the parent folders of a normalized path"""
+
+        parent_paths = []
+        parent_path = os.path.dirname(path)
+        while parent_path not in parent_paths and parent_path != path:
+            parent_paths.append(parent_path)
+            path = parent_path
+            parent_path = os.path.dirname(path)
+
+        return parent_paths
+
+    def __is_dependent(
+        self,
+        plan: ExecutionPlan
+    ) -> bool:
+        """
+        Specify if the checked paths of a plan are modified by previous items.
+
+        A checked path depends on a modified path if they are the same, or if
+        one is in the folder of the other.
+        """
+
+        dependent = False
+        for checked_path in plan.list_checked_paths():
+            path = ExecutionPlanner.__normalize_path(checked_path)
+            if path in self.__paths['modified'] or path in self.__paths['modified_parents'] or any(
+                parent_path in self.__paths['modified']
+                for parent_path in ExecutionPlanner.__list_parent_paths(path)
+            ):
+                dependent = True
+                break
+
+        for operation in plan.list_operations():
+            if operation['path'] is None or ExecutionPlan.is_write(operation):
+                continue
+            path = ExecutionPlanner.__normalize_path(operation['path'])
+            self.__paths['modified'].add(path)
+            self.__paths['modified_parents'].update(
+                ExecutionPlanner.__list_parent_paths(path)
+            )
+
+        return dependent
+
+    def list_dependent_ids(self) -> list:
+        """List ids of the items to plan again once the previous items are executed"""
+
+        with self.__lock:
+            return list(self.__issues['dependent_ids'])
+
+    def is_ordered(
+        self,
+        item_id: str
+    ) -> bool:
+        """Specify if an item has to be executed once the previous items are done"""
+
+        with self.__lock:
+            return item_id in self.__issues['ordered_ids']
+
+    def __is_conflicting(
+        self,
+        plan: ExecutionPlan
+    ) -> bool:
+        """Add the operations of a plan by path, specify if they conflict with previous items"""
+
+        paths = []
+        for operation in plan.list_operations():
+            if operation['path'] is None:
+                continue
+            path = str(operation['path'])
+            if not ExecutionPlan.is_write(operation):
+                path = ExecutionPlanner.__normalize_path(path)
+            self.__paths['operations'].setdefault(path, []).append(
+                (plan.get_item_id(), operation)
+            )
+            paths.append(path)
+
+        conflicting = False
+        for path in dict.fromkeys(paths):
+            issue = ExecutionPlanner.__get_path_issue(
+                operations=self.__paths['operations'][path]
+            )
+            if issue is None:
+                continue
+
+            issue_type, items_ids = issue
+            self.__issues[issue_type][path] = items_ids
+            if issue_type == 'conflicts' and \
+                    any(item_id != plan.get_item_id() for item_id in items_ids):
+                conflicting = True
+
+        return conflicting
+
+    @staticmethod
+    def __get_path_issue(
+        operations: list
+    ):
+        """Get the issue of the operations of a path (type and items ids), None if no issue"""
+
+        items_ids = list(dict.fromkeys(item_id for item_id, _ in operations))
+
+        # Shared data written by several items
+        if ExecutionPlan.is_write(operations[0][1]):
+            if len(items_ids) > 1:
+                return 'conflicts', items_ids
+            return None
+
+        # Same file copied several times, with different sizes if conflicting
+        copies = [
+            (item_id, operation)
+            for item_id, operation in operations
+            if operation['type'] == ExecutionPlan.COPY
+        ]
+        if len(copies) > 1:
+            copies_items_ids = list(dict.fromkeys(item_id for item_id, _ in copies))
+            if len(set(operation['size'] for _, operation in copies)) > 1:
+                return 'conflicts', copies_items_ids
+            return 'duplicates', copies_items_ids
+
+        # File copied by an item then deleted by another one
+        last_item_id, last_operation = operations[-1]
+        if last_operation['type'] != ExecutionPlan.COPY and \
+                any(item_id != last_item_id for item_id, _ in copies):
+            return 'conflicts', items_ids
+
+        return None
+
+    def log_report(self):
+        """Log the estimation, duplicated and conflicting operations, and the items planned again"""
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'execution_planned',
+                files_count=self.__counts['files'],
+                total_size=self.__planned_size // (1024 * 1024)
+            )
+        )
+
+        for path, items_ids in self.__issues['duplicates'].items():
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_execution_duplicate',
+                    path=path,
+                    items=', '.join(items_ids)
+                )
+            )
+        for path, items_ids in self.__issues['conflicts'].items():
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_execution_conflict',
+                    path=path,
+                    items=', '.join(items_ids)
+                )
+            )
+        if len(self.__issues['dependent_ids']) > 0:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'execution_dependent_items',
+                    items=', '.join(self.__issues['dependent_ids'])
+                )
+            )
+
+    def start(self):
+        """Start measuring the time of the operations"""
+
+        self.__start_time = time.monotonic()
+
+    def add_done_size(
+        self,
+        size: int
+    ):
+        """Add the size of a done operation"""
+
+        with self.__lock:
+            self.__done_size += size
+
+    def get_done_size(
+        self,
+        current_size: int = 0
+    ) -> int:
+        """Get the size of done operations, with the size done by the current one"""
+
+        return min(self.__done_size + current_size, self.get_total_size())
+
+    def get_progress_text(
+        self,
+        current_size: int = 0
+    ) -> str:
+        """Get the text of the progress by size, with the remaining time once estimated"""
+
+        total_size = self.get_total_size()
+        done_size = self.get_done_size(
+            current_size=current_size
+        )
+        if self.__start_time is None or done_size == 0:
+            return Context.get_text(
+                'execution_progress_size',
+                done_size=done_size // (1024 * 1024),
+                total_size=total_size // (1024 * 1024)
+            )
+
+        elapsed_time = time.monotonic() - self.__start_time
+        remaining_time = elapsed_time * (total_size - done_size) / done_size
+        return Context.get_text(
+            'execution_progress_eta',
+            done_size=done_size // (1024 * 1024),
+            total_size=total_size // (1024 * 1024),
+            remaining_time=str(datetime.timedelta(seconds=int(remaining_time)))
+        )
@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+"""Execution Planning"""
+
+import threading
+
+from executor.execution_plan import ExecutionPlan
+from executor.execution_planner import ExecutionPlanner
+from libraries.constants.constants import Constants
+
+
+class ExecutionPlanning:
+    """
+    Class to plan the items of an execution ahead of their execution.
+
+    Items are planned one after another in background, a bounded window
+    ahead of the executed items, so the planning of the next items overlaps
+    the copy of the current one. Their plans are estimated and verified by a
+    planner as they are planned. A plan made against files modified by the
+    previous items is made again just before its item is executed.
+    """
+
+    def __init__(
+        self,
+        plan_item: any
+    ):
+        """Initialize planning with the function planning a row, returning its plan and its error"""
+
+        self.__plan_item = plan_item
+        self.__plans = {}
+        self.__planner = None
+        self.__taken_count = 0
+        self.__stopped = False
+        self.__condition = threading.Condition()
+
+    def start(
+        self,
+        rows: list
+    ):
+        """Start planning rows in their order in background"""
+
+        self.__planner = ExecutionPlanner(
+            items_count=len(rows)
+        )
+        planning_thread = threading.Thread(
+            target=self.__plan_items,
+            kwargs={
+                'rows': rows
+            },
+            daemon=True
+        )
+        planning_thread.start()
+
+    def stop(self):
+        """Stop planning, once the items are executed or the execution interrupted"""
+
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify_all()
+
+    def __plan_items(
+        self,
+        rows: list
+    ):
+        """Plan rows one after another, a bounded window ahead of their execution"""
+
+        for row_index, row in enumerate(rows):
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda row_index=row_index: self.__stopped or
+                    row_index < self.__taken_count + Constants.EXECUTION_PLANNING_WINDOW_SIZE
+                )
+                if self.__stopped:
+                    return
+
+            plan, error = self.__plan_item(
+                row=row
+            )
+            self.__planner.add_plan(
+                plan=plan
+            )
+
+            with self.__condition:
+                self.__plans[row[Constants.UI_TABLE_KEY_COL_ID]] = (plan, error)
+                self.__condition.notify_all()
+
+        # Items executed by do_execution are not estimated
+        if self.__planner.is_planned():
+            self.__planner.log_report()
+
+    def get_planner(self) -> ExecutionPlanner:
+        """Get the planner of the plans, None until an item is planned"""
+
+        if self.__planner is None or not self.__planner.is_planned():
+            return None
+
+        return self.__planner
+
+    def get_plan(
+        self,
+        row: dict
+    ) -> tuple:
+        """Get the plan of a row planned ahead and its error, once planned"""
+
+        item_id = row[Constants.UI_TABLE_KEY_COL_ID]
+        with self.__condition:
+            self.__taken_count += 1
+            self.__condition.notify_all()
+            self.__condition.wait_for(
+                lambda: item_id in self.__plans
+            )
+
+            return self.__plans.pop(item_id)
+
+    def is_ordered(
+        self,
+        row: dict
+    ) -> bool:
+        """Specify if a planned row has to be executed once the previous rows are done"""
+
+        return self.__planner.is_ordered(
+            item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+        )
+
+    def plan_again(
+        self,
+        row: dict,
+        plan: ExecutionPlan,
+        error: Exception
+    ) -> tuple:
+        """Plan again a row made stale by the previous rows once done, return its plan and error"""
+
+        item_id = row[Constants.UI_TABLE_KEY_COL_ID]
+        if plan is None or item_id not in self.__planner.list_dependent_ids():
+            return plan, error
+
+        # Plan again against the files modified by the previous items
+        stale_plan = plan
+        plan, error = self.__plan_item(
+            row=row
+        )
+        if plan is not None:
+            self.__planner.replace_plan(
+                previous_plan=stale_plan,
+                plan=plan
+            )
+
+        return plan, error
@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+"""Execution Progress"""
+
+import os
+import tkinter as tk
+
+from executor.execution_planner import ExecutionPlanner
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.ui.ui_progress import UIProgress
+
+
+class ExecutionProgress:
+    """
+    Class to show the progress of an execution.
+
+    The progress follows the items, or the bytes of their operations once
+    planned, with the file being copied by the current item.
+    """
+
+    def __init__(
+        self,
+        progress: UIProgress,
+        button_close: tk.Button
+    ):
+        """Initialize progress"""
+
+        self.__progress = progress
+        self.__button_close = button_close
+        self.__item_text = ''
+        self.__copy_progress = None
+        self.__planner = None
+
+    def set_planner(
+        self,
+        planner: ExecutionPlanner
+    ):
+        """Follow the bytes of the planned operations, updating the maximum as items are planned"""
+
+        if self.__planner is None:
+            self.__planner = planner
+            self.__planner.start()
+        self.__progress.set_maximum(self.__planner.get_total_size())
+
+    def add_planned_done_size(
+        self,
+        done_size: int
+    ):
+        """Increment progress by the size of a planned operation"""
+
+        self.__planner.add_done_size(done_size)
+        self.__progress.set_value(self.__planner.get_done_size())
+
+    def set_button_text(
+        self,
+        text: str
+    ):
+        """Set text of the button to close"""
+
+        self.__progress.run_in_ui(
+            self.__button_close.config,
+            text=text
+        )
+
+    def start(
+        self,
+        items_count: int
+    ):
+        """Start the progress of the items"""
+
+        self.__progress.set_maximum(items_count)
+
+    def end_item(
+        self,
+        item_current_counter: int
+    ):
+        """Increment progress by an item, if not planned"""
+
+        if self.__planner is None:
+            self.__progress.set_value(item_current_counter)
+
+    def finish(
+        self,
+        items_count: int
+    ):
+        """Finish progression"""
+
+        if self.__planner is not None:
+            self.__progress.set_value(self.__planner.get_total_size())
+        else:
+            self.__progress.set_value(items_count + 1)
+        self.__progress.set_text(
+            text=Context.get_text('execution_finished')
+        )
+
+    def __get_item_text(
+        self,
+        current_size: int = 0
+    ) -> str:
+        """Get text of the current item, with the progress by size if planned"""
+
+        if self.__planner is None:
+            return self.__item_text
+
+        return self.__item_text + '\n' + self.__planner.get_progress_text(
+            current_size=current_size
+        )
+
+    def start_item(
+        self,
+        row: dict,
+        item_current_counter: int,
+        item_total_counter: int
+    ):
+        """Show the item in progress"""
+
+        self.__item_text = Context.get_text(
+            'execution_in_progress',
+            item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
+            item_current_counter=item_current_counter,
+            item_total_counter=item_total_counter
+        )
+        self.__progress.set_text(
+            text=self.__get_item_text()
+        )
+
+        # Show execution line for the current item
+        LoggingHelper.log_info(
+            message=self.__item_text
+        )
+
+    def report_copy(
+        self,
+        file_path: str,
+        copied_size: int,
+        total_size: int
+    ):
+        """Show the progress of a file copied by the current item"""
+
+        # Update progress label only when the file or its percentage changed
+        copy_progress = (
+            copied_size * 100 // total_size if total_size > 0 else 100,
+            file_path
+        )
+        if copy_progress == self.__copy_progress:
+            return
+        self.__copy_progress = copy_progress
+
+        # Follow the copied bytes if planned
+        if self.__planner is not None:
+            self.__progress.set_value(
+                self.__planner.get_done_size(
+                    current_size=copied_size
+                )
+            )
+
+        self.__progress.set_text(
+            text=Context.get_text(
+                'copy_file_progress',
+                item=self.__get_item_text(
+                    current_size=copied_size
+                ),
+                file=os.path.basename(file_path),
+                copied_size=copied_size // (1024 * 1024),
+                total_size=total_size // (1024 * 1024)
+            ).replace('\\n', '\n')
+        )
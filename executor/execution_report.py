@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+"""Execution Report"""
+
+from datetime import datetime
+import json
+import os
+import threading
+import time
+
+from libraries.constants.constants import Constants, Metric
+from libraries.context.context import Context
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
+
+
+class ExecutionReport:
+    """
+    Class to report the metrics of the items of an execution.
+
+    Each item has a record of its wall time, of the time spent in each kind
+    of I/O, of the bytes read and written and of the files touched. The
+    report is written in the logs folder, and summarized in the execution.
+    """
+
+    def __init__(self):
+        """Initialize report"""
+
+        self.__start_time = time.perf_counter()
+        self.__records = {}
+        self.__finalization_record = MetricsHelper.create_record()
+        self.__lock = threading.Lock()
+
+    def get_record(
+        self,
+        row: dict
+    ) -> dict:
+        """Get the record of a row, None for the finalization"""
+
+        if row is None:
+            return self.__finalization_record
+
+        with self.__lock:
+            record = self.__records.get(row[Constants.UI_TABLE_KEY_COL_ID], None)
+            if record is None:
+                record = MetricsHelper.create_record()
+                record['id'] = row[Constants.UI_TABLE_KEY_COL_ID]
+                record['name'] = row[Constants.UI_TABLE_KEY_COL_NAME]
+                self.__records[record['id']] = record
+
+            return record
+
+    def write_report(self) -> str:
+        """Write the report in the logs folder, return its path"""
+
+        report_path = os.path.join(
+            Context.get_logs_path(),
+            f'execution_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        )
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(
+            report_path,
+            mode='w',
+            encoding='UTF-8'
+        ) as report_file:
+            json.dump(
+                {
+                    'category': Context.get_selected_category().name,
+                    'action': Context.get_selected_action().name,
+                    'workers': Context.get_execution_workers(),
+                    'total_time': time.perf_counter() - self.__start_time,
+                    'items': list(self.__records.values()),
+                    'finalization': self.__finalization_record
+                },
+                report_file,
+                indent=2
+            )
+
+        return report_path
+
+    def log_summary(self):
+        """Log the throughput and the slowest items"""
+
+        total_time = time.perf_counter() - self.__start_time
+        records = list(self.__records.values())
+        written_size = sum(record['bytes_written'] for record in records) + \
+            self.__finalization_record['bytes_written']
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'execution_report_summary',
+                items_count=len(records),
+                total_time=int(total_time),
+                written_size=written_size // (1024 * 1024),
+                throughput=round(written_size / (1024 * 1024) / max(total_time, 0.001), 1),
+                files_count=sum(record['files_count'] for record in records)
+            )
+        )
+
+        for record in sorted(
+            records,
+            key=lambda record: record['wall_time'],
+            reverse=True
+        )[:Constants.EXECUTION_REPORT_SLOWEST_COUNT]:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'execution_report_slowest_item',
+                    item_name=record['name'],
+                    wall_time=round(record['wall_time'], 1),
+                    times=', '.join(
+                        f'{metric.name.lower()} {round(record[f"{metric.name.lower()}_time"], 1)} s'
+                        for metric in Metric
+                    )
+                )
+            )
@@ -0,0 +1,239 @@
+#!/usr/bin/python3
+"""Execution Scheduler"""
+
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+
+from libraries.constants.constants import Constants
+
+
+class ExecutionScheduler:
+    """
+    Class to execute the items of an execution in a pipeline or by several workers.
+
+    The shared data (database, shared files, registry) written by an item
+    are collected while it is executed, then written after it by a single
+    writer, in the order of the items. An item in conflict with the previous
+    items waits until they are written.
+    """
+
+    def __init__(
+        self,
+        execute_item: any,
+        commit_item: any,
+        is_interrupted: any
+    ):
+        """
+        Initialize scheduler.
+
+        :param execute_item: Function executing a row, returning its error (None if succeeded)
+        :param commit_item: Function writing the shared data of an executed row, returning its error
+        :param is_interrupted: Function specifying if the next items must be skipped
+        """
+
+        self.__execute_item = execute_item
+        self.__commit_item = commit_item
+        self.__is_interrupted = is_interrupted
+        self.__writer_lock = threading.Lock()
+        self.__item_writes = threading.local()
+        self.__committed_count = 0
+        self.__committed_condition = threading.Condition()
+
+    def write_shared(
+        self,
+        write_function,
+        **kwargs
+    ):
+        """Write shared data after the current item, immediately if not in an item"""
+
+        writes = getattr(self.__item_writes, 'writes', None)
+        if writes is None:
+            write_function(**kwargs)
+            return
+
+        writes.append((write_function, kwargs))
+
+    def read_shared(
+        self,
+        read_function,
+        **kwargs
+    ):
+        """Read shared data, never while the writer writes it"""
+
+        with self.__writer_lock:
+            return read_function(**kwargs)
+
+    def write(
+        self,
+        writes: list
+    ):
+        """Write shared data collected for an item, as the single writer"""
+
+        with self.__writer_lock:
+            for write_function, kwargs in writes:
+                write_function(**kwargs)
+
+    def __execute_item_writes(
+        self,
+        row: dict,
+        item_current_counter: int,
+        item_total_counter: int
+    ):
+        """Execute a row collecting its writes, return its writes and its error, None if skipped"""
+
+        # Skip item if execution stopped or failed
+        if self.__is_interrupted():
+            return None
+
+        self.__item_writes.writes = []
+        try:
+            error = self.__execute_item(
+                row=row,
+                item_current_counter=item_current_counter,
+                item_total_counter=item_total_counter
+            )
+        finally:
+            writes = self.__item_writes.writes
+            self.__item_writes.writes = None
+
+        return writes, error
+
+    def wait_committed_items(
+        self,
+        items_count: int
+    ):
+        """Wait until the first items are written (or skipped), to execute an item after them"""
+
+        with self.__committed_condition:
+            self.__committed_condition.wait_for(
+                lambda: self.__committed_count >= items_count
+            )
+
+    def __set_committed_count(
+        self,
+        items_count: int
+    ):
+        """Specify how many first items are written (or skipped)"""
+
+        with self.__committed_condition:
+            self.__committed_count = items_count
+            self.__committed_condition.notify_all()
+
+    def execute(
+        self,
+        rows: list,
+        workers: int
+    ) -> tuple:
+        """
+        Execute rows, in a pipeline if one worker.
+
+        :return: Failed row and its error (None if no item failed)
+        """
+
+        self.__set_committed_count(0)
+        if workers > 1 and len(rows) > 1:
+            results = self.__execute_concurrently(
+                rows=rows,
+                workers=workers
+            )
+        else:
+            results = self.__execute_pipelined(
+                rows=rows
+            )
+
+        # Commit stage: write shared data of items in their order
+        failed_row = None
+        failed_error = None
+        for item_current_counter, row, item_result in results:
+            # Skip items executed after a failed one
+            if item_result is not None and failed_error is None:
+                writes, error = item_result
+                error = self.__commit_item(
+                    row=row,
+                    item_current_counter=item_current_counter,
+                    writes=writes,
+                    error=error
+                )
+                if error is not None:
+                    failed_row = row
+                    failed_error = error
+
+            self.__set_committed_count(item_current_counter)
+
+        return failed_row, failed_error
+
+    def __execute_items(
+        self,
+        rows: list,
+        results: queue.Queue
+    ):
+        """Copy stage of the pipeline"""
+
+        try:
+            for item_current_counter, row in enumerate(rows, start=1):
+                if self.__is_interrupted():
+                    break
+
+                results.put((
+                    item_current_counter,
+                    row,
+                    self.__execute_item_writes(
+                        row=row,
+                        item_current_counter=item_current_counter,
+                        item_total_counter=len(rows)
+                    )
+                ))
+        finally:
+            results.put(None)
+
+    def __execute_pipelined(
+        self,
+        rows: list
+    ):
+        """
+        Execute rows one after another in a pipeline, yielding their results in their order.
+
+        The files of the item N are copied while the shared data of the item
+        N-1 are written, through a bounded queue.
+        """
+
+        results = queue.Queue(maxsize=Constants.EXECUTION_PIPELINE_QUEUE_SIZE)
+        copy_thread = threading.Thread(
+            target=self.__execute_items,
+            kwargs={
+                'rows': rows,
+                'results': results
+            },
+            daemon=True
+        )
+        copy_thread.start()
+        try:
+            while True:
+                result = results.get()
+                if result is None:
+                    break
+                yield result
+        finally:
+            copy_thread.join()
+
+    def __execute_concurrently(
+        self,
+        rows: list,
+        workers: int
+    ):
+        """Execute rows by several workers, yielding their results in their order"""
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.__execute_item_writes,
+                    row=row,
+                    item_current_counter=item_current_counter,
+                    item_total_counter=len(rows)
+                )
+                for item_current_counter, row in enumerate(rows, start=1)
+            ]
+
+            for item_current_counter, (row, future) in enumerate(zip(rows, futures), start=1):
+                yield item_current_counter, row, future.result()
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+"""Execution Status"""
+
+import threading
+
+
+class ExecutionStatus:
+    """
+    Class to follow the status of an execution, shared by its workers.
+
+    Items done are the ones executed (even if failed), items written are
+    the ones whose shared data are written, to journal once finalized.
+    """
+
+    def __init__(self):
+        """Initialize status"""
+
+        self.__stop_requested = threading.Event()
+        self.__failed = threading.Event()
+        self.__finished = False
+        self.__ids_done = []
+        self.__ids_written = []
+        self.__lock = threading.Lock()
+
+    def request_stop(self):
+        """Request the execution to stop"""
+
+        self.__stop_requested.set()
+
+    def is_stop_requested(self) -> bool:
+        """Specify if the execution must stop"""
+
+        return self.__stop_requested.is_set()
+
+    def set_failed(self):
+        """Specify the execution failed on an item"""
+
+        self.__failed.set()
+
+    def is_failed(self) -> bool:
+        """Specify if the execution failed on an item"""
+
+        return self.__failed.is_set()
+
+    def is_interrupted(self) -> bool:
+        """Specify if the next items must be skipped (stop requested or failed)"""
+
+        return self.is_stop_requested() or self.is_failed()
+
+    def set_finished(self):
+        """Specify the execution finished"""
+
+        self.__finished = True
+
+    def is_finished(self) -> bool:
+        """Specify if the execution finished"""
+
+        return self.__finished
+
+    def add_ids_done(
+        self,
+        items_ids: list
+    ):
+        """Add ids of items done"""
+
+        with self.__lock:
+            self.__ids_done.extend(items_ids)
+
+    def list_ids_done(self) -> list:
+        """List ids of items done"""
+
+        return self.__ids_done
+
+    def add_id_written(
+        self,
+        item_id: str
+    ):
+        """Add the id of an item whose shared data are written"""
+
+        with self.__lock:
+            self.__ids_written.append(item_id)
+
+    def pop_ids_written(self) -> list:
+        """Get ids of items written since the last call"""
+
+        with self.__lock:
+            ids_written = self.__ids_written
+            self.__ids_written = []
+
+        return ids_written
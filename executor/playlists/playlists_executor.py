@@ -20,12 +20,14 @@ class PlaylistsExecutor(AbstractExecutor):
         """List media cache paths"""
 
         result = []
-        for cache_file_name in Constants.CACHE_FILES_NAMES:
-            result.extend(FileHelper.list_relative_paths(
-                folder_path=Context.get_pinup_media_path(),
-                file_name=f'*{cache_file_name}*',
-                error_if_not_found=False
-            ))
+        for relative_paths in FileHelper.list_relative_paths_by_names(
+            folder_path=Context.get_pinup_media_path(),
+            file_names=[
+                f'*{cache_file_name}*'
+                for cache_file_name in Constants.CACHE_FILES_NAMES
+            ]
+        ).values():
+            result.extend(relative_paths)
         return result
 
     def __get_data_media_path(
@@ -58,7 +60,8 @@ class PlaylistsExecutor(AbstractExecutor):
         # Delete playlist
         if Component.EMULATOR_PLAYLIST in Context.get_selected_components():
 
-            BddHelper.delete_playlist(
+            self.write_shared(
+                BddHelper.delete_playlist,
                 bdd_file_path=Context.get_pinup_bdd_path(),
                 playlist=bdd_item
             )
@@ -115,7 +118,8 @@ class PlaylistsExecutor(AbstractExecutor):
         # Insert playlist
         if Component.EMULATOR_PLAYLIST in Context.get_selected_components():
 
-            BddHelper.insert_playlist(
+            self.write_shared(
+                BddHelper.insert_playlist,
                 bdd_file_path=Context.get_pinup_bdd_path(),
                 playlist_data=csv_item
             )
@@ -187,17 +191,28 @@ class PlaylistsExecutor(AbstractExecutor):
                 )
 
         # Write data in CSV
-        csv_playlists = ListHelper.replace_item(
-            a_list=CsvHelper.read_data(
-                file_path=Context.get_csv_path()
-            ),
+        self.write_shared(
+            self.__write_csv_item,
             item={
                 Constants.CSV_COL_AVAILABLE: Constants.CSV_YES_VALUE,
                 Constants.CSV_COL_VERSION: Constants.LATEST_PATH,
                 Constants.CSV_COL_NAME: playlist_name,
                 Constants.CSV_COL_ID: playlist_id,
                 Constants.CSV_COL_SQL: playlist_sql
-            },
+            }
+        )
+
+    def __write_csv_item(
+        self,
+        item: dict
+    ):
+        """Write an item in CSV"""
+
+        csv_playlists = ListHelper.replace_item(
+            a_list=CsvHelper.read_data(
+                file_path=Context.get_csv_path()
+            ),
+            item=item,
             id_column=Constants.CSV_COL_ID
         )
         CsvHelper.write_data(
@@ -253,7 +268,7 @@ class PlaylistsExecutor(AbstractExecutor):
                 playlist_id,
                 'media'
             )
-            FileHelper.copy_folder(
+            self.copy_or_sync_folder(
                 source_folder_path=source_folder_path,
                 destination_folder_path=destination_folder_path
             )
@@ -264,14 +279,16 @@ class PlaylistsExecutor(AbstractExecutor):
         # Retrieve CSV item
         csv_item = ListHelper.select_item(
             item_id=item_id,
-            a_list=CsvHelper.read_data(
+            a_list=self.read_shared(
+                CsvHelper.read_data,
                 file_path=Context.get_csv_path()
             ),
             id_column=Constants.CSV_COL_ID
         )
 
         # Retrieve bdd item
-        bdd_item = BddHelper.get_playlist(
+        bdd_item = self.read_shared(
+            BddHelper.get_playlist,
             bdd_file_path=Context.get_pinup_bdd_path(),
             playlist_id=item_id
         )
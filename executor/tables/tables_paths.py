@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""Tables Paths"""
+
+import os
+from pathlib import Path
+
+from libraries.constants.constants import Constants, Emulator
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+
+
+class TablesPaths:
+    """Class to get the paths of the tables, in their data and in the installation"""
+
+    @staticmethod
+    def get_data_emulator_path(
+        table_id: str,
+        table_version: str
+    ):
+        """Get data emulator path"""
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            'tables',
+            Context.get_selected_emulator().value,
+            table_id,
+            table_version,
+            'emulator'
+        ))
+
+    @staticmethod
+    def get_data_media_path(
+        table_id: str,
+        table_version: str
+    ):
+        """Get data media path"""
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            'tables',
+            Context.get_selected_emulator().value,
+            table_id,
+            table_version,
+            'media'
+        ))
+
+    @staticmethod
+    def get_data_xml_config_path(
+        table_id: str,
+        table_version: str
+    ):
+        """Get data XML config path"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+            return Path(os.path.join(
+                Context.get_working_path(),
+                'tables',
+                Emulator.VISUAL_PINBALL_X.value,
+                table_id,
+                table_version,
+                'config',
+                'B2STableSettings.xml'
+            ))
+
+        return None
+
+    @staticmethod
+    def get_data_pinup_videos_path(
+        table_id: str,
+        table_version: str,
+        table_videos_path: str
+    ):
+        """Get data pinup video path"""
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            'tables',
+            Context.get_selected_emulator().value,
+            table_id,
+            table_version,
+            'PUPVideos',
+            table_videos_path
+        ))
+
+    @staticmethod
+    def get_data_reg_file_path(
+        table_id: str,
+        table_version: str
+    ):
+        """Get data regedit file path"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+            return Path(os.path.join(
+                Context.get_working_path(),
+                'tables',
+                Emulator.VISUAL_PINBALL_X.value,
+                table_id,
+                table_version,
+                'config',
+                f'user_values{Constants.REGEDIT_FILE_EXTENSION}'
+            ))
+
+        return None
+
+    @staticmethod
+    def get_pinup_videos_path(
+        table_videos_path: str
+    ):
+        """Return the pinup video path"""
+
+        return Path(os.path.join(
+            Context.get_pinup_path(),
+            'PUPVideos',
+            table_videos_path
+        ))
+
+    @staticmethod
+    def get_xml_config_path():
+        """Get XML config path"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+            return Path(os.path.join(
+                Context.get_emulator_path(
+                    Context.get_selected_emulator()
+                ),
+                'Tables',
+                'B2STableSettings.xml'
+            ))
+
+        return None
+
+    @staticmethod
+    def get_extract_cmd(
+        table_alt_exe: str
+    ):
+        """Get command to extract script"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+            extract_exe_path = os.path.join(
+                Context.get_emulator_path(Emulator.VISUAL_PINBALL_X),
+                table_alt_exe
+            )
+            return f'"{extract_exe_path}" -Minimized -ExtractVBS'
+
+        return None
+
+    @staticmethod
+    def list_tables_relative_paths(
+        folder_path: str,
+        table_id: str
+    ):
+        """List relative paths for the specified table"""
+
+        relative_paths_by_names = FileHelper.list_relative_paths_by_names(
+            folder_path=folder_path,
+            file_names=[
+                table_id,
+                f'{table_id} Fulldmd',
+                f'{table_id}*(SCREEN*'
+            ]
+        )
+
+        relative_paths = []
+        for names_relative_paths in relative_paths_by_names.values():
+            relative_paths.extend(names_relative_paths)
+
+        return relative_paths
+
+    @staticmethod
+    def list_media_cache_relative_paths():
+        """List media cache paths"""
+
+        result = []
+        for relative_paths in FileHelper.list_relative_paths_by_names(
+            folder_path=Context.get_pinup_media_path(),
+            file_names=[
+                f'*{cache_file_name}*'
+                for cache_file_name in Constants.CACHE_FILES_NAMES
+            ]
+        ).values():
+            result.extend(relative_paths)
+        return result
@@ -0,0 +1,420 @@
+#!/usr/bin/python3
+"""Tables Planner"""
+
+import os
+
+from executor.execution_plan import ExecutionPlan
+from executor.tables.tables_paths import TablesPaths
+from libraries.bdd.bdd_helper import BddHelper
+from libraries.constants.constants import Component, Constants, Emulator
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.file.file_sync_helper import FileSyncHelper
+from libraries.list.list_helper import ListHelper
+from libraries.winreg.winreg_helper import WinRegHelper
+from libraries.xml.xml_batch import XmlBatch
+
+# pylint: disable=too-many-locals, too-many-statements, too-many-branches
+
+
+class TablesPlanner:
+    """
+    Class to plan the install and the uninstall of tables, as operations of their plans.
+
+    An install is planned as the difference between the installed table and
+    the target table, so only the files which differ are deleted and copied.
+    """
+
+    def __init__(
+        self,
+        xml_config_batch: XmlBatch
+    ):
+        """Initialize planner, with the modifications of XML config applied after all tables"""
+
+        self.__xml_config_batch = xml_config_batch
+
+    def plan_uninstall(
+        self,
+        plan: ExecutionPlan,
+        bdd_item: dict,
+        csv_item: dict
+    ):
+        """Plan uninstall"""
+
+        if bdd_item is None:
+            return
+
+        # Retrieve table's data
+        table_id = ListHelper.format_value(
+            bdd_item[Constants.BDD_COL_TABLE_ID]
+        )
+        table_version = csv_item.get(
+            Constants.CSV_COL_VERSION,
+            Constants.LATEST_PATH
+        )
+        table_rom = csv_item.get(
+            Constants.CSV_COL_ROM,
+            ListHelper.format_value(bdd_item[Constants.BDD_COL_TABLE_ROM])
+        )
+
+        # Delete table and its rom
+        if Component.EMULATOR_TABLE in Context.get_selected_components():
+            if BddHelper.is_not_null_dict_value(
+                row=bdd_item,
+                column_id=Constants.BDD_COL_TABLE_ROM
+            ):
+
+                emulator_path = Context.get_emulator_path(
+                    Context.get_selected_emulator()
+                )
+                relative_paths = TablesPaths.list_tables_relative_paths(
+                    folder_path=emulator_path,
+                    table_id=table_id
+                )
+                for relative_path in relative_paths:
+                    plan.add_delete(
+                        file_path=os.path.join(
+                            emulator_path,
+                            relative_path
+                        )
+                    )
+
+                relative_paths = FileHelper.list_relative_paths(
+                    folder_path=Context.get_emulator_path(
+                        Context.get_selected_emulator()
+                    ),
+                    file_name=bdd_item[Constants.BDD_COL_TABLE_ROM],
+                    error_if_not_found=False
+                )
+                for relative_path in relative_paths:
+                    plan.add_delete(
+                        file_path=os.path.join(
+                            Context.get_emulator_path(
+                                Context.get_selected_emulator()
+                            ),
+                            relative_path
+                        )
+                    )
+
+            plan.add_write(
+                BddHelper.delete_table,
+                write_type=ExecutionPlan.DELETE_ROW,
+                bdd_file_path=Context.get_pinup_bdd_path(),
+                table=bdd_item
+            )
+
+        # Delete XML config
+        xml_config_path = TablesPaths.get_xml_config_path()
+        if Component.CONFIG_XML in Context.get_selected_components() and \
+                Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X and \
+                xml_config_path is not None and \
+                xml_config_path.exists():
+
+            plan.add_write(
+                self.__xml_config_batch.delete_tags,
+                target=f'{xml_config_path}<{table_rom}>',
+                tags=[table_rom]
+            )
+
+        # Delete Regedit config
+        reg_file_path = TablesPaths.get_data_reg_file_path(
+            table_id=table_id,
+            table_version=table_version
+        )
+        if Component.CONFIG_REG in Context.get_selected_components() and \
+                Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X and \
+                reg_file_path is not None and \
+                reg_file_path.exists():
+
+            plan.add_write(
+                WinRegHelper.delete_user_key,
+                target=f'{Constants.VPINMAME_REG_KEY}\\{table_rom}',
+                key=f'{Constants.VPINMAME_REG_KEY}\\{table_rom}'
+            )
+
+        # Delete pup videos
+        if Component.PINUP_VIDEOS in Context.get_selected_components() and \
+            BddHelper.is_not_null_dict_value(
+            row=bdd_item,
+            column_id=Constants.BDD_COL_VIDEOS_PATH
+        ):
+
+            source_videos_folder_path = TablesPaths.get_pinup_videos_path(
+                table_videos_path=bdd_item[Constants.BDD_COL_VIDEOS_PATH]
+            )
+            plan.add_delete_folder(
+                folder_path=source_videos_folder_path
+            )
+
+        # Delete media files
+        if Component.PINUP_MEDIA in Context.get_selected_components():
+
+            relative_paths = TablesPaths.list_tables_relative_paths(
+                folder_path=Context.get_pinup_media_path(),
+                table_id=table_id
+            )
+            for relative_path in relative_paths:
+                plan.add_delete(
+                    file_path=os.path.join(
+                        Context.get_pinup_media_path(),
+                        relative_path
+                    )
+                )
+
+            # Delete pup cache files
+            relative_paths = TablesPaths.list_media_cache_relative_paths()
+            for relative_path in relative_paths:
+                plan.add_delete(
+                    file_path=os.path.join(
+                        Context.get_pinup_media_path(),
+                        relative_path
+                    )
+                )
+
+    def __plan_install(
+        self,
+        plan: ExecutionPlan,
+        csv_item: dict
+    ):
+        """Plan install"""
+
+        if csv_item is None:
+            return
+
+        # Retrieve table's data
+        table_id = csv_item[Constants.CSV_COL_ID]
+        table_version = csv_item[Constants.CSV_COL_VERSION]
+
+        # Insert table and its rom
+        if Component.EMULATOR_TABLE in Context.get_selected_components():
+            source_folder_path = TablesPaths.get_data_emulator_path(
+                table_id=table_id,
+                table_version=table_version
+            )
+            destination_folder_path = Context.get_emulator_path(
+                Context.get_selected_emulator()
+            )
+            relative_paths = FileHelper.list_relative_paths(
+                folder_path=source_folder_path,
+                file_name='*',
+                error_if_not_found=False
+            )
+            for relative_path in relative_paths:
+                plan.add_copy(
+                    source_file_path=os.path.join(
+                        source_folder_path,
+                        relative_path
+                    ),
+                    destination_file_path=os.path.join(
+                        destination_folder_path,
+                        relative_path
+                    )
+                )
+
+            plan.add_write(
+                BddHelper.insert_table,
+                write_type=ExecutionPlan.INSERT_ROW,
+                bdd_file_path=Context.get_pinup_bdd_path(),
+                table_data=csv_item,
+                emulator=Context.get_selected_emulator()
+            )
+
+        # Insert XML config
+        xml_config_path = TablesPaths.get_xml_config_path()
+        if Component.CONFIG_XML in Context.get_selected_components() and \
+                Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X and \
+                xml_config_path is not None and \
+                xml_config_path.exists():
+
+            plan.add_write(
+                self.__xml_config_batch.import_tags,
+                target=f'{xml_config_path}<{csv_item[Constants.CSV_COL_ROM]}>',
+                extracted_file_path=TablesPaths.get_data_xml_config_path(
+                    table_id=table_id,
+                    table_version=table_version
+                ),
+                parent_tag='B2STableSettings'
+            )
+
+        # Insert Regedit config
+        reg_file_path = TablesPaths.get_data_reg_file_path(
+            table_id=table_id,
+            table_version=table_version
+        )
+        if Component.CONFIG_REG in Context.get_selected_components() and \
+                Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X and \
+                reg_file_path is not None and \
+                reg_file_path.exists():
+
+            plan.add_write(
+                WinRegHelper.import_user_key,
+                target=f'{Constants.VPINMAME_REG_KEY}\\{csv_item[Constants.CSV_COL_ROM]}',
+                extracted_file_path=reg_file_path
+            )
+
+        # Insert pup videos
+        if Component.PINUP_VIDEOS in Context.get_selected_components() and \
+            BddHelper.is_not_null_dict_value(
+            row=csv_item,
+            column_id=Constants.CSV_COL_VIDEOS_PATH
+        ):
+
+            videos_path = csv_item[Constants.CSV_COL_VIDEOS_PATH]
+            source_folder_path = TablesPaths.get_data_pinup_videos_path(
+                table_id=table_id,
+                table_version=table_version,
+                table_videos_path=videos_path
+            )
+            destination_folder_path = TablesPaths.get_pinup_videos_path(
+                table_videos_path=videos_path
+            )
+            relative_paths = FileHelper.list_relative_paths(
+                folder_path=source_folder_path,
+                file_name='*'
+            )
+            for relative_path in relative_paths:
+                plan.add_copy(
+                    source_file_path=os.path.join(
+                        source_folder_path,
+                        relative_path
+                    ),
+                    destination_file_path=os.path.join(
+                        destination_folder_path,
+                        relative_path
+                    )
+                )
+
+        # Insert media files
+        if Component.PINUP_MEDIA in Context.get_selected_components():
+
+            source_folder_path = TablesPaths.get_data_media_path(
+                table_id=table_id,
+                table_version=table_version
+            )
+            destination_folder_path = Context.get_pinup_media_path()
+            relative_paths = TablesPaths.list_tables_relative_paths(
+                folder_path=source_folder_path,
+                table_id=table_id
+            )
+            for relative_path in relative_paths:
+                plan.add_copy(
+                    source_file_path=os.path.join(
+                        source_folder_path,
+                        relative_path
+                    ),
+                    destination_file_path=os.path.join(
+                        destination_folder_path,
+                        relative_path
+                    )
+                )
+
+    def plan_differential_install(
+        self,
+        plan: ExecutionPlan,
+        bdd_item: dict,
+        csv_item: dict
+    ):
+        """Plan install as the difference between the installed and the target tables"""
+
+        # Plan uninstall of the installed table and install of the target table
+        uninstall_plan = ExecutionPlan(
+            item_id=plan.get_item_id()
+        )
+        self.plan_uninstall(
+            plan=uninstall_plan,
+            bdd_item=bdd_item,
+            csv_item=csv_item
+        )
+        install_plan = ExecutionPlan(
+            item_id=plan.get_item_id()
+        )
+        self.__plan_install(
+            plan=install_plan,
+            csv_item=csv_item
+        )
+
+        # Files of the target table are never deleted
+        target_paths = set(
+            os.path.normcase(os.path.normpath(operation['path']))
+            for operation in install_plan.list_operations()
+            if operation['type'] == ExecutionPlan.COPY
+        )
+
+        for operation in uninstall_plan.list_operations():
+            match operation['type']:
+                case ExecutionPlan.DELETE:
+                    if os.path.normcase(os.path.normpath(operation['path'])) in target_paths:
+                        continue
+
+                case ExecutionPlan.DELETE_FOLDER:
+                    # Delete only files not in the target table if the folder is kept
+                    relative_paths = FileHelper.list_relative_paths(
+                        folder_path=operation['path'],
+                        file_name='*',
+                        error_if_not_found=False
+                    )
+                    files_paths = [
+                        os.path.join(
+                            operation['path'],
+                            relative_path
+                        )
+                        for relative_path in relative_paths
+                    ]
+                    if any(
+                        os.path.normcase(os.path.normpath(file_path)) in target_paths
+                        for file_path in files_paths
+                    ):
+                        plan.add_checked_path(
+                            path=operation['path']
+                        )
+                        for file_path in files_paths:
+                            if os.path.normcase(os.path.normpath(file_path)) not in target_paths:
+                                plan.add_delete(
+                                    file_path=file_path
+                                )
+                        continue
+
+                case ExecutionPlan.DELETE_ROW:
+                    # Table's row is updated in place
+                    if csv_item is not None:
+                        continue
+
+            plan.add_planned_operation(
+                operation=operation
+            )
+
+        for operation in install_plan.list_operations():
+            match operation['type']:
+                case ExecutionPlan.COPY:
+                    # Copy only missing or changed files, even changed with same size
+                    if not FileSyncHelper.is_file_synchronized(
+                        source_file_path=operation['kwargs']['source_file_path'],
+                        destination_file_path=operation['kwargs']['destination_file_path'],
+                        with_hash=Context.is_sync_with_hash()
+                    ):
+                        plan.add_copy(
+                            source_file_path=operation['kwargs']['source_file_path'],
+                            destination_file_path=operation['kwargs']['destination_file_path'],
+                            force=True
+                        )
+                    else:
+                        plan.add_checked_path(
+                            path=operation['path']
+                        )
+                    continue
+
+                case ExecutionPlan.INSERT_ROW:
+                    # Table's row is updated in place
+                    if bdd_item is not None:
+                        plan.add_write(
+                            BddHelper.update_table,
+                            bdd_file_path=Context.get_pinup_bdd_path(),
+                            table=bdd_item,
+                            table_data=csv_item,
+                            emulator=Context.get_selected_emulator()
+                        )
+                        continue
+
+            plan.add_planned_operation(
+                operation=operation
+            )
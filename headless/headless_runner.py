@@ -0,0 +1,365 @@
+#!/usr/bin/python3
+"""Headless Runner"""
+
+import argparse
+import threading
+
+from executor.bdd_tables.bdd_tables_executor import BDDTablesExecutor
+from executor.configs.configs_executor import ConfigsExecutor
+from executor.execution_checkpoint import ExecutionCheckpoint
+from executor.playlists.playlists_executor import PlaylistsExecutor
+from executor.tables.tables_executor import TablesExecutor
+from libraries.console.console_progress import ConsoleButton, ConsoleProgress
+from libraries.constants.constants import Action, Category, Component, Constants, Emulator
+from libraries.context.context import Context
+from libraries.csv.csv_helper import CsvHelper
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.refresh.refresh_builder import RefreshBuilder
+
+
+class HeadlessRunner:
+    """
+    Class to run a refresh or an execution from the command line, without UI.
+
+    The selection of the main window is given by arguments, the progress is
+    printed in the console and the result is returned as an exit status.
+    """
+
+    # Exit status
+    EXIT_SUCCESS = 0
+    EXIT_FAILURE = 1
+    EXIT_INVALID = 2
+
+    # Value of ids to select all rows
+    ALL_IDS = 'all'
+
+    def __init__(
+        self,
+        args: list
+    ):
+        """Initialize runner from command line arguments"""
+
+        self.__args = HeadlessRunner.__create_parser().parse_args(args)
+
+    @staticmethod
+    def __create_parser() -> argparse.ArgumentParser:
+        """Create parser of command line arguments"""
+
+        parser = argparse.ArgumentParser(
+            prog='pincab-manager.py --headless',
+            description='Refresh or execute a selection without UI.'
+        )
+        parser.add_argument(
+            '--headless',
+            action='store_true',
+            help='run without UI'
+        )
+        parser.add_argument(
+            '--category',
+            required=True,
+            choices=[category.name.lower() for category in Category],
+            help='selected category'
+        )
+        parser.add_argument(
+            '--emulator',
+            choices=[emulator.name.lower() for emulator in Emulator],
+            help='selected emulator (tables only)'
+        )
+        parser.add_argument(
+            '--action',
+            required=True,
+            choices=[action.name.lower() for action in Action if action != Action.EDIT],
+            help='selected action'
+        )
+        parser.add_argument(
+            '--components',
+            default='',
+            help='selected components, separated by commas'
+        )
+        parser.add_argument(
+            '--ids',
+            default='',
+            help=f'ids of the rows to execute, separated by commas, or {HeadlessRunner.ALL_IDS}'
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='refresh rows before execution'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='resume the interrupted execution of the same selection'
+        )
+        parser.add_argument(
+            '--folder',
+            help='folder of the copy'
+        )
+        parser.add_argument(
+            '--copy-sync',
+            action='store_true',
+            help='synchronize the folder of the copy'
+        )
+        parser.add_argument(
+            '--copy-sync-delete',
+            action='store_true',
+            help='delete stale files during synchronization'
+        )
+        parser.add_argument(
+            '--progress',
+            action='store_true',
+            help='print progress'
+        )
+        parser.add_argument(
+            '--quiet',
+            action='store_true',
+            help='do not print log'
+        )
+        return parser
+
+    def run(self) -> int:
+        """Run refresh and execution, return the exit status"""
+
+        LoggingHelper.set_log_console(
+            log_console=not self.__args.quiet
+        )
+
+        # Setup is done from the UI
+        if not Context.get_setup_file_path().exists():
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'error_headless_setup',
+                    setup_file=Context.get_setup_file_path()
+                )
+            )
+            return HeadlessRunner.EXIT_INVALID
+
+        if not self.__select():
+            return HeadlessRunner.EXIT_INVALID
+
+        # Refresh if asked or never done
+        rows = None
+        if self.__args.refresh or not Context.get_selected_rows_csv_path().exists():
+            rows = self.__refresh()
+            if rows is None:
+                return HeadlessRunner.EXIT_FAILURE
+
+        # Only refresh if no ids
+        if self.__args.ids == '':
+            return HeadlessRunner.EXIT_SUCCESS
+
+        if rows is None:
+            rows = CsvHelper.read_data(
+                file_path=Context.get_selected_rows_csv_path()
+            )
+        if not self.__select_rows(rows):
+            return HeadlessRunner.EXIT_INVALID
+
+        return self.__execute()
+
+    def __select(self) -> bool:
+        """Set the selection in context, return False if invalid"""
+
+        Context.set_selected_category(
+            Category[self.__args.category.upper()]
+        )
+        Context.set_selected_action(
+            Action[self.__args.action.upper()]
+        )
+
+        # Emulator is only selected for tables
+        if Context.get_selected_category() == Category.TABLES:
+            available_emulators = Context.list_available_emulators()
+            if self.__args.emulator is None or \
+                    Emulator[self.__args.emulator.upper()].value not in available_emulators:
+                LoggingHelper.log_warning(
+                    message=Context.get_text(
+                        'error_headless_emulator',
+                        emulator=self.__args.emulator,
+                        emulators=', '.join(available_emulators)
+                    )
+                )
+                return False
+            Context.set_selected_emulator(
+                Emulator[self.__args.emulator.upper()]
+            )
+
+        # Components are selected by their labels, as in the table of components
+        components_items = []
+        for component_name in filter(None, self.__args.components.split(',')):
+            if component_name.strip().upper() not in Component.__members__:
+                LoggingHelper.log_warning(
+                    message=Context.get_text(
+                        'error_headless_component',
+                        component=component_name
+                    )
+                )
+                return False
+            components_items.append({
+                Constants.UI_TABLE_KEY_COL_NAME: Context.get_text(
+                    Component[component_name.strip().upper()].value
+                )
+            })
+        Context.set_selected_components(components_items)
+
+        # Copy needs a folder
+        if Context.get_selected_action() == Action.COPY:
+            if self.__args.folder is None:
+                LoggingHelper.log_warning(
+                    message=Context.get_text('error_headless_folder')
+                )
+                return False
+            Context.set_selected_folder_path(
+                folder_path=self.__args.folder
+            )
+            Context.set_selected_copy_sync(
+                copy_sync=self.__args.copy_sync
+            )
+            Context.set_selected_copy_sync_delete(
+                copy_sync_delete=self.__args.copy_sync and self.__args.copy_sync_delete
+            )
+
+        return True
+
+    def __select_rows(
+        self,
+        rows: list
+    ) -> bool:
+        """Set the rows selected by ids in context, return False if an id is missing"""
+
+        if self.__args.ids.strip().lower() == HeadlessRunner.ALL_IDS:
+            selected_rows = rows
+        else:
+            rows_by_id = {
+                row[Constants.UI_TABLE_KEY_COL_ID]: row
+                for row in rows
+            }
+            selected_rows = []
+            for item_id in filter(None, self.__args.ids.split(',')):
+                if item_id.strip() not in rows_by_id:
+                    LoggingHelper.log_warning(
+                        message=Context.get_text(
+                            'error_headless_id',
+                            id=item_id
+                        )
+                    )
+                    return False
+                selected_rows.append(rows_by_id[item_id.strip()])
+
+        match(Context.get_selected_category()):
+            case Category.TABLES:
+                Context.set_selected_tables_rows(selected_rows)
+
+            case Category.PLAYLISTS:
+                Context.set_selected_playlists_rows(selected_rows)
+
+            case Category.BDD_TABLES:
+                Context.set_selected_bdd_tables_rows(selected_rows)
+
+            case Category.CONFIGS:
+                Context.set_selected_configs_rows(selected_rows)
+
+        return True
+
+    def __refresh(self) -> list:
+        """Refresh rows of the selection, return None if interrupted"""
+
+        builder = RefreshBuilder(
+            only_ids=None,
+            progress=ConsoleProgress(
+                quiet=not self.__args.progress
+            )
+        )
+        result = {}
+
+        def build_rows():
+            result['rows'] = builder.build()
+
+        # Build in a thread, to stop the refresh when interrupted
+        refresh_thread = threading.Thread(
+            target=build_rows
+        )
+        refresh_thread.start()
+        while refresh_thread.is_alive():
+            try:
+                refresh_thread.join(
+                    timeout=Constants.UI_PROGRESS_REFRESH_DELAY / 1000
+                )
+            except KeyboardInterrupt:
+                LoggingHelper.log_warning(
+                    message=Context.get_text('headless_interrupted')
+                )
+                builder.request_interruption()
+
+        rows = result.get('rows', None)
+        if rows is not None:
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'headless_refresh_finished',
+                    rows_count=len(rows)
+                )
+            )
+
+        return rows
+
+    def __execute(self) -> int:
+        """Execute the selection, return the exit status"""
+
+        progress = ConsoleProgress(
+            quiet=not self.__args.progress
+        )
+        button_close = ConsoleButton()
+
+        match(Context.get_selected_category()):
+            case Category.TABLES:
+                executor = TablesExecutor(
+                    progress=progress,
+                    button_close=button_close
+                )
+
+            case Category.PLAYLISTS:
+                executor = PlaylistsExecutor(
+                    progress=progress,
+                    button_close=button_close
+                )
+
+            case Category.BDD_TABLES:
+                executor = BDDTablesExecutor(
+                    progress=progress,
+                    button_close=button_close
+                )
+
+            case Category.CONFIGS:
+                executor = ConfigsExecutor(
+                    progress=progress,
+                    button_close=button_close
+                )
+
+        # Resume an interrupted execution of the same selection
+        if self.__args.resume:
+            checkpoint = ExecutionCheckpoint.load()
+            if checkpoint is not None and checkpoint.is_matching_selection():
+                executor.resume_execution(
+                    checkpoint=checkpoint
+                )
+
+        # Execute in a thread, to stop the execution when interrupted
+        execution_thread = threading.Thread(
+            target=executor.execute
+        )
+        execution_thread.start()
+        while execution_thread.is_alive():
+            try:
+                execution_thread.join(
+                    timeout=Constants.UI_PROGRESS_REFRESH_DELAY / 1000
+                )
+            except KeyboardInterrupt:
+                LoggingHelper.log_warning(
+                    message=Context.get_text('headless_interrupted')
+                )
+                executor.stop_execution()
+
+        if not executor.is_execution_finished() or executor.is_execution_failed():
+            return HeadlessRunner.EXIT_FAILURE
+
+        return HeadlessRunner.EXIT_SUCCESS
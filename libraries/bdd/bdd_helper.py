@@ -6,8 +6,9 @@ from datetime import datetime
 
 from libraries.context.context import Context
 from libraries.file.file_helper import FileHelper
-from libraries.constants.constants import Constants, Emulator
+from libraries.constants.constants import Constants, Emulator, Metric
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
 
 
 # pylint: disable=consider-using-max-builtin
@@ -28,6 +29,20 @@ class BddHelper:
         sql = f"INSERT INTO {table_name} ({columns}) VALUES ({values});"
         return sql
 
+    @staticmethod
+    def __generate_update_sql(
+        table_name: str,
+        row: dict,
+        id_column: str,
+        id_value: str
+    ):
+        """Generate UPDATE for SQL from a dictionary"""
+        values = ', '.join(f"{column} = \'{value}\'" if value !=
+                           'NULL' else f"{column} = {value}" for column, value in row.items())
+
+        sql = f"UPDATE {table_name} SET {values} WHERE {id_column} = \'{id_value}\';"
+        return sql
+
     @staticmethod
     def __get_current_datetime_formatted():
         """Get and format current datetime"""
@@ -37,6 +52,7 @@ class BddHelper:
         return formatted_datetime
 
     @staticmethod
+    @MetricsHelper.measured(Metric.DATABASE)
     def __execute_sql_command(
         bdd_file_path: str,
         sql_command: str
@@ -381,12 +397,11 @@ class BddHelper:
         return None
 
     @staticmethod
-    def insert_table(
-        bdd_file_path: str,
+    def __generate_table_values(
         table_data: dict,
         emulator: Emulator
     ):
-        """Insert table"""
+        """Generate values of a table's row coming from its CSV data"""
 
         match emulator:
             case Emulator.VISUAL_PINBALL_X:
@@ -413,16 +428,6 @@ class BddHelper:
                     emulator=emulator.value
                 ))
 
-        sequence = Constants.EMULATORS_IDS[emulator] * 1000
-        for table in BddHelper.list_tables(
-            bdd_file_path=bdd_file_path,
-            emulator=emulator
-        ):
-            table_sequence = table[Constants.BDD_COL_TABLE_SEQUENCE]
-            if sequence < table_sequence:
-                sequence = table_sequence
-        sequence += 1
-
         table_visible = '0'
         if table_data[Constants.CSV_COL_AVAILABLE] == Constants.CSV_YES_VALUE:
             table_visible = '1'
@@ -430,11 +435,7 @@ class BddHelper:
         file_name = table_data[Constants.CSV_COL_ID]
         file_name += '.'
         file_name += table_file_extension
-        row = {
-            Constants.BDD_COL_TABLE_SEQUENCE: sequence,
-            'EMUID': BddHelper.format_value(
-                value=Constants.EMULATORS_IDS[emulator]
-            ),
+        return {
             'GameName': BddHelper.format_value(
                 value=table_data[Constants.CSV_COL_ID]
             ),
@@ -444,16 +445,69 @@ class BddHelper:
             Constants.BDD_COL_TABLE_NAME: BddHelper.format_value(
                 value=table_data[Constants.CSV_COL_NAME]
             ),
-            'UseEmuDefaults': 'NULL',
             'Visible': BddHelper.format_value(
                 value=table_visible
             ),
-            'Notes': 'NULL',
-            'DateAdded': BddHelper.__get_current_datetime_formatted(),
-            'GameYear': 'NULL',
             Constants.BDD_COL_TABLE_ROM: BddHelper.format_value(
                 value=table_data[Constants.CSV_COL_ROM]
             ),
+            Constants.BDD_COL_TABLE_VERSION: BddHelper.format_value(
+                value=table_data[Constants.CSV_COL_VERSION]
+            ),
+            'ALTEXE': BddHelper.format_value(
+                value=table_data[Constants.CSV_COL_ALT_EXE]
+            ),
+            'AltRunMode': BddHelper.format_value(
+                value=table_data[Constants.CSV_COL_ALT_RUN_MODE]
+            ),
+            'WebLinkURL': BddHelper.format_value(
+                value=table_data[Constants.CSV_COL_WEBLINK_URL]
+            ),
+            'WebLink2URL': BddHelper.format_value(
+                value=table_data[Constants.CSV_COL_WEBLINK2_URL]
+            ),
+            Constants.BDD_COL_VIDEOS_PATH: BddHelper.format_value(
+                value=table_data[Constants.CSV_COL_VIDEOS_PATH]
+            )
+        }
+
+    @staticmethod
+    def insert_table(
+        bdd_file_path: str,
+        table_data: dict,
+        emulator: Emulator
+    ):
+        """Insert table"""
+
+        table_values = BddHelper.__generate_table_values(
+            table_data=table_data,
+            emulator=emulator
+        )
+
+        sequence = Constants.EMULATORS_IDS[emulator] * 1000
+        for table in BddHelper.list_tables(
+            bdd_file_path=bdd_file_path,
+            emulator=emulator
+        ):
+            table_sequence = table[Constants.BDD_COL_TABLE_SEQUENCE]
+            if sequence < table_sequence:
+                sequence = table_sequence
+        sequence += 1
+
+        row = {
+            Constants.BDD_COL_TABLE_SEQUENCE: sequence,
+            'EMUID': BddHelper.format_value(
+                value=Constants.EMULATORS_IDS[emulator]
+            ),
+            'GameName': table_values['GameName'],
+            Constants.BDD_COL_TABLE_GAME_FILE: table_values[Constants.BDD_COL_TABLE_GAME_FILE],
+            Constants.BDD_COL_TABLE_NAME: table_values[Constants.BDD_COL_TABLE_NAME],
+            'UseEmuDefaults': 'NULL',
+            'Visible': table_values['Visible'],
+            'Notes': 'NULL',
+            'DateAdded': BddHelper.__get_current_datetime_formatted(),
+            'GameYear': 'NULL',
+            Constants.BDD_COL_TABLE_ROM: table_values[Constants.BDD_COL_TABLE_ROM],
             'Manufact': 'NULL',
             'NumPlayers': 'NULL',
             'ResolutionX': 'NULL',
@@ -474,22 +528,14 @@ class BddHelper:
             'MediaSearch': 'NULL',
             'AudioChannels': 'NULL',
             'CUSTOM3': 'NULL',
-            Constants.BDD_COL_TABLE_VERSION: BddHelper.format_value(
-                value=table_data[Constants.CSV_COL_VERSION]
-            ),
-            'ALTEXE': BddHelper.format_value(
-                value=table_data[Constants.CSV_COL_ALT_EXE]
-            ),
+            Constants.BDD_COL_TABLE_VERSION: table_values[Constants.BDD_COL_TABLE_VERSION],
+            'ALTEXE': table_values['ALTEXE'],
             'IPDBNum': 'NULL',
             'DateUpdated': 'NULL',
             'DateFileUpdated': 'NULL',
             'AutoRecFlag': '0',
-            'AltRunMode': BddHelper.format_value(
-                value=table_data[Constants.CSV_COL_ALT_RUN_MODE]
-            ),
-            'WebLinkURL': BddHelper.format_value(
-                value=table_data[Constants.CSV_COL_WEBLINK_URL]
-            ),
+            'AltRunMode': table_values['AltRunMode'],
+            'WebLinkURL': table_values['WebLinkURL'],
             'DesignedBy': 'NULL',
             'CUSTOM4': 'NULL',
             'CUSTOM5': 'NULL',
@@ -501,13 +547,9 @@ class BddHelper:
             'FLAG3': '0',
             'gLog': 'NULL',
             'RatingWeb': 'NULL',
-            'WebLink2URL': BddHelper.format_value(
-                value=table_data[Constants.CSV_COL_WEBLINK2_URL]
-            ),
+            'WebLink2URL': table_values['WebLink2URL'],
             'TourneyID': 'NULL',
-            Constants.BDD_COL_VIDEOS_PATH: BddHelper.format_value(
-                value=table_data[Constants.CSV_COL_VIDEOS_PATH]
-            )
+            Constants.BDD_COL_VIDEOS_PATH: table_values[Constants.BDD_COL_VIDEOS_PATH]
         }
 
         sql_command = BddHelper.__generate_insert_sql(
@@ -536,6 +578,49 @@ class BddHelper:
             sql_command=sql_command
         )
 
+    @staticmethod
+    def update_table(
+        bdd_file_path: str,
+        table: dict,
+        table_data: dict,
+        emulator: Emulator
+    ):
+        """Update table in place, keeping its id, sequence and user's values"""
+
+        row = BddHelper.__generate_table_values(
+            table_data=table_data,
+            emulator=emulator
+        )
+        row['DateUpdated'] = BddHelper.__get_current_datetime_formatted()
+
+        sql_command = BddHelper.__generate_update_sql(
+            table_name='games',
+            row=row,
+            id_column='GameID',
+            id_value=table['GameID']
+        )
+
+        if Context.is_simulated():
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'update_table_simulation',
+                    table_name=table_data[Constants.CSV_COL_ID]
+                )
+            )
+            return
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'update_table_in_progress',
+                table_name=table_data[Constants.CSV_COL_ID]
+            )
+        )
+
+        BddHelper.__execute_sql_command(
+            bdd_file_path=bdd_file_path,
+            sql_command=sql_command
+        )
+
     @staticmethod
     def delete_table(
         bdd_file_path: str,
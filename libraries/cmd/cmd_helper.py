@@ -4,14 +4,17 @@
 import os
 import subprocess
 
+from libraries.constants.constants import Metric
 from libraries.context.context import Context
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
 
 
 class CmdHelper:
     """Class to help usage of Cmd"""
 
     @staticmethod
+    @MetricsHelper.measured(Metric.SUBPROCESS)
     def run(
         cmd: str,
         shell=True,
@@ -54,6 +57,7 @@ class CmdHelper:
         return True
 
     @staticmethod
+    @MetricsHelper.measured(Metric.SUBPROCESS)
     def retrieve_cmd_result(
         read_cmd: str,
         timeout=10*60,
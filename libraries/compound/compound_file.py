@@ -0,0 +1,357 @@
+#!/usr/bin/python3
+"""Compound File"""
+
+import mmap
+import struct
+
+from libraries.constants.constants import Metric
+from libraries.context.context import Context
+from libraries.metrics.metrics_helper import MetricsHelper
+
+
+class CompoundFile:
+    """
+    Class to read the streams of a compound file (OLE), as VPX and FPT tables.
+
+    The file is memory-mapped, its allocation tables and its directory are read
+    when opened, and a stream is read only when asked, by following its chain
+    of sectors (or of mini sectors for small streams).
+    """
+
+    # Signature of compound files
+    SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+    # Special sectors numbers
+    END_OF_CHAIN = 0xFFFFFFFE
+    NO_STREAM = 0xFFFFFFFF
+
+    # Types of directory entries
+    STORAGE = 1
+    STREAM = 2
+    ROOT_STORAGE = 5
+
+    # Sizes of header and directory entries
+    HEADER_SIZE = 512
+    DIRECTORY_ENTRY_SIZE = 128
+    HEADER_DIFAT_COUNT = 109
+
+    def __init__(
+        self,
+        file_path: str
+    ):
+        """Open a compound file"""
+
+        self.__file_path = str(file_path)
+
+        # The map keeps its own handle of the file
+        with open(self.__file_path, mode='rb') as file:
+            self.__data = mmap.mmap(
+                file.fileno(),
+                0,
+                access=mmap.ACCESS_READ
+            )
+        try:
+            self.__header = self.__read_header()
+            self.__fat = self.__read_fat()
+            entries = self.__read_directory()
+            self.__mini_fat = self.__read_mini_fat()
+            self.__mini_stream = self.__read_chain(
+                fat=self.__fat,
+                start_sector=entries[0]['start_sector'],
+                size=entries[0]['size']
+            )
+            self.__streams = {}
+            self.__list_streams(
+                entries=entries,
+                entry_id=entries[0]['child'],
+                parent_path=''
+            )
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        """Use compound file in a with statement"""
+
+        return self
+
+    def __exit__(self, *args):
+        """Close compound file at the end of a with statement"""
+
+        self.close()
+
+    def close(self):
+        """Close compound file"""
+
+        self.__data.close()
+
+    def __raise_invalid(self):
+        """Raise an error for an invalid compound file"""
+
+        raise Exception(Context.get_text(
+            'error_compound_file',
+            file=self.__file_path
+        ))
+
+    def __read_header(self) -> dict:
+        """Read header of the compound file, by field name"""
+
+        if len(self.__data) < CompoundFile.HEADER_SIZE or \
+                self.__data[:8] != CompoundFile.SIGNATURE:
+            self.__raise_invalid()
+
+        header = dict(zip(
+            [
+                'sector_shift',
+                'mini_sector_shift'
+            ],
+            struct.unpack_from('<HH', self.__data, 0x1E)
+        ))
+        header.update(zip(
+            [
+                'fat_sectors_count',
+                'first_directory_sector',
+                'transaction_signature',
+                'mini_stream_cutoff',
+                'first_mini_fat_sector',
+                'mini_fat_sectors_count',
+                'first_difat_sector',
+                'difat_sectors_count'
+            ],
+            struct.unpack_from('<IIIIIIII', self.__data, 0x2C)
+        ))
+        if header['sector_shift'] not in [9, 12]:
+            self.__raise_invalid()
+
+        header['sector_size'] = 1 << header['sector_shift']
+        header['mini_sector_size'] = 1 << header['mini_sector_shift']
+
+        # Sectors count, to detect chains going out of the file
+        header['sectors_count'] = (len(self.__data) - 1) // header['sector_size']
+
+        return header
+
+    def __read_sector(
+        self,
+        sector: int
+    ) -> bytes:
+        """Read a sector of the file"""
+
+        if sector >= self.__header['sectors_count']:
+            self.__raise_invalid()
+
+        offset = (sector + 1) << self.__header['sector_shift']
+        return self.__data[offset:offset + self.__header['sector_size']]
+
+    def __read_fat(self) -> list:
+        """Read allocation table of sectors, from sectors listed by DIFAT"""
+
+        fat_sectors = list(struct.unpack_from(
+            f'<{CompoundFile.HEADER_DIFAT_COUNT}I',
+            self.__data,
+            0x4C
+        ))
+
+        # Other FAT sectors are listed by a chain of DIFAT sectors
+        difat_sector = self.__header['first_difat_sector']
+        entries_count = self.__header['sector_size'] // 4
+        for _ in range(self.__header['difat_sectors_count']):
+            if difat_sector >= CompoundFile.END_OF_CHAIN:
+                break
+            difat = struct.unpack(
+                f'<{entries_count}I',
+                self.__read_sector(difat_sector)
+            )
+            fat_sectors.extend(difat[:-1])
+            difat_sector = difat[-1]
+
+        fat = []
+        for fat_sector in fat_sectors[:self.__header['fat_sectors_count']]:
+            fat.extend(struct.unpack(
+                f'<{entries_count}I',
+                self.__read_sector(fat_sector)
+            ))
+
+        return fat
+
+    def __list_chain(
+        self,
+        fat: list,
+        start_sector: int
+    ) -> list:
+        """List sectors of a chain, from its first sector"""
+
+        sectors = []
+        sector = start_sector
+        while sector < CompoundFile.END_OF_CHAIN:
+            # A chain can't be longer than the table (loop in a corrupted file)
+            if sector >= len(fat) or len(sectors) >= len(fat):
+                self.__raise_invalid()
+            sectors.append(sector)
+            sector = fat[sector]
+
+        return sectors
+
+    def __read_chain(
+        self,
+        fat: list,
+        start_sector: int,
+        size: int = None
+    ) -> bytes:
+        """Read data of a chain of sectors, truncated to its size if specified"""
+
+        data = b''.join(
+            self.__read_sector(sector)
+            for sector in self.__list_chain(
+                fat=fat,
+                start_sector=start_sector
+            )
+        )
+        if size is not None:
+            data = data[:size]
+
+        return data
+
+    def __read_mini_chain(
+        self,
+        start_sector: int,
+        size: int
+    ) -> bytes:
+        """Read data of a chain of mini sectors in the mini stream"""
+
+        mini_sector_size = self.__header['mini_sector_size']
+        data = b''.join(
+            self.__mini_stream[sector * mini_sector_size:(sector + 1) * mini_sector_size]
+            for sector in self.__list_chain(
+                fat=self.__mini_fat,
+                start_sector=start_sector
+            )
+        )
+
+        return data[:size]
+
+    def __read_directory(self) -> list:
+        """Read entries of the directory"""
+
+        directory = self.__read_chain(
+            fat=self.__fat,
+            start_sector=self.__header['first_directory_sector']
+        )
+
+        entries = []
+        for offset in range(0, len(directory), CompoundFile.DIRECTORY_ENTRY_SIZE):
+            name_size, entry_type = struct.unpack_from('<HB', directory, offset + 0x40)
+            left, right, child = struct.unpack_from('<III', directory, offset + 0x44)
+            start_sector, size = struct.unpack_from('<IQ', directory, offset + 0x74)
+
+            # Size is on 32 bits for sectors of 512 bytes
+            if self.__header['sector_size'] == 512:
+                size &= 0xFFFFFFFF
+
+            entries.append({
+                'name': directory[offset:offset + max(name_size - 2, 0)].decode(
+                    'utf-16-le',
+                    errors='replace'
+                ),
+                'type': entry_type,
+                'left': left,
+                'right': right,
+                'child': child,
+                'start_sector': start_sector,
+                'size': size
+            })
+
+        if len(entries) == 0 or entries[0]['type'] != CompoundFile.ROOT_STORAGE:
+            self.__raise_invalid()
+
+        return entries
+
+    def __read_mini_fat(self) -> list:
+        """Read allocation table of mini sectors"""
+
+        if self.__header['mini_fat_sectors_count'] == 0:
+            return []
+
+        mini_fat = self.__read_chain(
+            fat=self.__fat,
+            start_sector=self.__header['first_mini_fat_sector']
+        )
+        return list(struct.unpack(f'<{len(mini_fat) // 4}I', mini_fat))
+
+    def __list_streams(
+        self,
+        entries: list,
+        entry_id: int,
+        parent_path: str
+    ):
+        """List streams of a storage, from the tree of its children"""
+
+        # Tree of siblings, walked without recursion on siblings
+        entries_ids = [entry_id]
+        visited_ids = set()
+        while len(entries_ids) > 0:
+            entry_id = entries_ids.pop()
+            if entry_id == CompoundFile.NO_STREAM or entry_id in visited_ids:
+                continue
+            if entry_id >= len(entries):
+                self.__raise_invalid()
+            visited_ids.add(entry_id)
+
+            entry = entries[entry_id]
+            entries_ids.extend([entry['left'], entry['right']])
+
+            path = f'{parent_path}{entry["name"]}'
+            if entry['type'] == CompoundFile.STREAM:
+                self.__streams[path] = entry
+            elif entry['type'] == CompoundFile.STORAGE:
+                self.__list_streams(
+                    entries=entries,
+                    entry_id=entry['child'],
+                    parent_path=f'{path}/'
+                )
+
+    def list_streams(self) -> list:
+        """List paths of the streams (storages separated by /)"""
+
+        return sorted(self.__streams)
+
+    def is_stream(
+        self,
+        stream_path: str
+    ) -> bool:
+        """Specify if a stream exists"""
+
+        return stream_path in self.__streams
+
+    @MetricsHelper.measured(Metric.FILESYSTEM)
+    def read_stream(
+        self,
+        stream_path: str
+    ) -> bytes:
+        """Read data of a stream"""
+
+        entry = self.__streams.get(stream_path, None)
+        if entry is None:
+            raise Exception(Context.get_text(
+                'error_compound_stream',
+                file=self.__file_path,
+                stream=stream_path
+            ))
+
+        if entry['size'] < self.__header['mini_stream_cutoff']:
+            data = self.__read_mini_chain(
+                start_sector=entry['start_sector'],
+                size=entry['size']
+            )
+        else:
+            data = self.__read_chain(
+                fat=self.__fat,
+                start_sector=entry['start_sector'],
+                size=entry['size']
+            )
+
+        MetricsHelper.add_io(
+            read_size=len(data)
+        )
+
+        return data
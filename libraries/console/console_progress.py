@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""Console Progress"""
+
+import threading
+
+
+class ConsoleProgress:
+    """
+    Class for console progress, standing in for UIProgress without UI.
+
+    Texts are printed with the percentage of the progress when they change,
+    nothing is printed if quiet.
+    """
+
+    def __init__(
+        self,
+        quiet: bool = False
+    ):
+        """Initialize progress"""
+
+        self.__quiet = quiet
+        self.__maximum = 0
+        self.__value = 0
+        self.__text = None
+        self.__lock = threading.Lock()
+
+    def set_maximum(
+        self,
+        maximum: int
+    ):
+        """Set progress' maximum"""
+
+        self.__maximum = maximum
+
+    def set_value(
+        self,
+        value: int
+    ):
+        """Set progress' value"""
+
+        self.__value = value
+
+    def set_text(
+        self,
+        text: str
+    ):
+        """Print progress' text if changed"""
+
+        if self.__quiet:
+            return
+
+        text = text.replace('\n', ' - ')
+        with self.__lock:
+            if text == self.__text:
+                return
+            self.__text = text
+
+            percentage = 0
+            if self.__maximum > 0:
+                percentage = min(self.__value * 100 // self.__maximum, 100)
+            print(f'[{percentage:3d}%] {text}', flush=True)
+
+    def run_in_ui(
+        self,
+        function: any,
+        **kwargs
+    ):
+        """Run a function directly without UI"""
+
+        function(**kwargs)
+
+    def wait_minimum_display(self):
+        """Nothing to wait without UI"""
+
+
+class ConsoleButton:
+    """Class standing in for the button to close an execution without UI"""
+
+    def config(self, **kwargs):
+        """Ignore configuration of the button"""
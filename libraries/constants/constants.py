@@ -53,6 +53,16 @@ class Media(Enum):
     WHEEL_IMAGE = 'media_wheel_image'
 
 
+class Metric(Enum):
+    """Metric (time spent in a kind of I/O)"""
+
+    FILESYSTEM = 'filesystem'
+    DATABASE = 'database'
+    XML = 'xml'
+    REGISTRY = 'registry'
+    SUBPROCESS = 'subprocess'
+
+
 class Emulator(Enum):
     """Emulator"""
 
@@ -84,6 +94,42 @@ class Constants:
     RESOURCES_PATH = 'resources'
     COMMON_PATH = 'common'
 
+    # Constants for files copy (by chunks of 8 MB)
+    FILE_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+    FILE_COPY_PARTIAL_EXTENSION = '.part'
+    FILE_COPY_LOCKS_COUNT = 64
+
+    # Constants for files synchronization (FAT drives store mtime by 2 seconds)
+    FILE_SYNC_MTIME_TOLERANCE = 2
+
+    # Constants for folders walk (parallel listings hide network shares latency)
+    FILE_WALK_WORKERS = 8
+
+    # Constants for deduplicated store (only big files are shared by hard links)
+    STORE_FOLDER_NAME = 'store'
+    STORE_MIN_FILE_SIZE = 1024 * 1024
+
+    # Constants for versions manifests
+    MANIFEST_FILE_NAME = '.manifest.csv'
+    MANIFEST_COL_PATH = 'PATH'
+    MANIFEST_COL_SIZE = 'SIZE'
+
+    # Constants for refresh fingerprints
+    FINGERPRINTS_COL_ID = 'ID'
+    FINGERPRINTS_COL_FINGERPRINT = 'FINGERPRINT'
+
+    # Constants for scripts metadata (cached by table file, extracted in parallel of copies)
+    SCRIPT_METADATA_FILE_NAME = 'scripts_metadata.csv'
+    SCRIPT_METADATA_COL_FILE = 'FILE'
+    SCRIPT_METADATA_COL_SIZE = 'SIZE'
+    SCRIPT_METADATA_COL_MTIME = 'MTIME'
+    SCRIPT_METADATA_COL_HASH = 'HASH'
+    SCRIPT_METADATA_COL_ROM = 'ROM'
+    SCRIPT_METADATA_COL_PUP_PACK = 'PUP_PACK'
+    SCRIPT_METADATA_COL_SCRIPT_HASH = 'SCRIPT_HASH'
+    SCRIPT_CACHE_FOLDER_NAME = 'scripts'
+    SCRIPT_EXTRACTION_WORKERS = 2
+
     # Constants for cache
     CACHE_FILES_NAMES = [
         'thumb',
@@ -91,9 +137,45 @@ class Constants:
         'Thumbs'
     ]
 
+    # Constants for refresh (verifications are I/O bound, done by several workers)
+    REFRESH_DEFAULT_WORKERS = 4
+    REFRESH_MAX_WORKERS = 16
+
+    # Constants for execution (items files copied by several workers, shared data written by one)
+    EXECUTION_DEFAULT_WORKERS = 1
+    EXECUTION_MAX_WORKERS = 16
+
+    # Constants for execution pipeline (items planned or copied ahead of their writes)
+    EXECUTION_PIPELINE_QUEUE_SIZE = 2
+
+    # Constants for execution planning (items planned ahead of the executed items)
+    EXECUTION_PLANNING_WINDOW_SIZE = 4
+
+    # Constants for execution checkpoint (journal of an execution, to resume it if interrupted)
+    EXECUTION_CHECKPOINT_FILE_NAME = 'execution_checkpoint.json'
+    EXECUTION_CHECKPOINT_LOG_FILE_NAME = 'execution_checkpoint.log'
+
+    # Constants for execution report (slowest items shown at the end of the execution)
+    EXECUTION_REPORT_SLOWEST_COUNT = 5
+
+    # Constants for execution planner (bytes counted for an operation, besides its copied bytes)
+    EXECUTION_OPERATION_SIZE = 64 * 1024
+
+    # Constants for refresh sessions (scan results shared by actions, in seconds)
+    REFRESH_SESSION_TTL = 30
+
+    # Constants for auto refresh (folders scanned for changes, in seconds)
+    REFRESH_WATCH_INTERVAL = 10
+
+    # Count of scans between two full scans (files modified without their folder)
+    REFRESH_WATCH_FULL_SCAN_COUNT = 30
+
     # Constants for UI
     UI_PAD_SMALL = 5
     UI_PAD_BIG = 10
+    UI_PROGRESS_REFRESH_DELAY = 50
+    UI_PROGRESS_MIN_DISPLAY_TIME = 0.5
+    UI_REFRESH_WATCHER_DELAY = 1000
     UI_TABLE_KEY_COL_SELECTION = 'column_title_selection'
     UI_TABLE_KEY_COL_ID = 'column_title_id'
     UI_TABLE_KEY_COL_NAME = 'column_title_name'
@@ -109,6 +191,11 @@ class Constants:
     SETUP_STEAM_PATH = 'steam_path'
     SETUP_MONITOR = 'monitor'
     SETUP_SIMULATED = 'simulated'
+    SETUP_SYNC_WITH_HASH = 'sync_with_hash'
+    SETUP_DEDUPLICATED_STORE = 'deduplicated_store'
+    SETUP_AUTO_REFRESH = 'auto_refresh'
+    SETUP_REFRESH_WORKERS = 'refresh_workers'
+    SETUP_EXECUTION_WORKERS = 'execution_workers'
     SETUP_AVAILABLE_EMULATORS = 'available_emulators'
     SETUP_AVAILABLE_MEDIA = 'available_media'
     SETUP_SCREEN_NUMBER_BY_MEDIA = 'screen_number_by_media'
@@ -199,3 +286,10 @@ class Constants:
     # VPX constants
     VPX_DEFAULT_EXE = 'VPinballX.exe'
     VPX_UNINSTALL_FILE_NAME = 'uninstall'
+    VPX_GAME_DATA_STREAM = 'GameStg/GameData'
+    VPX_TABLE_INFO_STORAGE = 'TableInfo'
+    VPX_TABLE_INFO_STREAMS = [
+        'TableName',
+        'AuthorName',
+        'TableVersion'
+    ]
@@ -28,6 +28,8 @@ class Context:
     __app_version: str = None
     __lang_code: str = None
     __monitor: int = None
+    __refresh_workers: int = None
+    __execution_workers: int = None
     __texts_by_lang_code = {}
     __pinup_path: Path = None
     __steam_path: Path = None
@@ -41,13 +43,19 @@ class Context:
     __selected_bdd_tables_rows = []
     __selected_configs_rows = []
     __selected_folder_path = None
+    __selected_copy_sync: bool = False
+    __selected_copy_sync_delete: bool = False
     __simulated: bool = False
+    __sync_with_hash: bool = False
+    __deduplicated_store: bool = False
+    __auto_refresh: bool = False
     __vpx_executables = []
     __available_emulators = []
     __available_media = []
     __screen_number_by_media = {}
     __selenium_web_browser = None
     __working_path = None
+    __registry_file_path = None
     __base_path = None
     __packaged = False
 
@@ -70,6 +78,11 @@ class Context:
         else:
             Context.__working_path = os.getcwd()
 
+        # Define registry file read instead of the Windows Registry
+        registry_file_path = os.getenv("PINCAB_MANAGER_REGISTRY_FILE")
+        if registry_file_path is not None:
+            Context.__registry_file_path = Path(registry_file_path)
+
         # Define base path depending on DEV or package
         try:
             Context.__base_path = sys._MEIPASS
@@ -117,9 +130,24 @@ class Context:
         # Initialize monitor
         Context.__monitor = 0
 
+        # Initialize refresh workers
+        Context.__refresh_workers = Constants.REFRESH_DEFAULT_WORKERS
+
+        # Initialize execution workers
+        Context.__execution_workers = Constants.EXECUTION_DEFAULT_WORKERS
+
         # Initialize boolean simulated
         Context.__simulated = False
 
+        # Initialize boolean sync with hash
+        Context.__sync_with_hash = False
+
+        # Initialize boolean deduplicated store
+        Context.__deduplicated_store = False
+
+        # Initialize boolean auto refresh
+        Context.__auto_refresh = False
+
         # Specify that context is initialized
         Context.__initialized = True
 
@@ -174,6 +202,15 @@ class Context:
 
         return Context.__working_path
 
+    @staticmethod
+    def get_registry_file_path() -> Path:
+        """Get .reg file read instead of the Windows Registry, None if not defined"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__registry_file_path
+
     @staticmethod
     def get_base_path() -> str:
         """Get base path"""
@@ -386,6 +423,42 @@ class Context:
 
         Context.__selected_folder_path = folder_path
 
+    @staticmethod
+    def is_selected_copy_sync() -> bool:
+        """Specify if the selected folder is synchronized during a copy"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__selected_copy_sync
+
+    @staticmethod
+    def set_selected_copy_sync(copy_sync: bool):
+        """Set if the selected folder is synchronized during a copy"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        Context.__selected_copy_sync = copy_sync
+
+    @staticmethod
+    def is_selected_copy_sync_delete() -> bool:
+        """Specify if stale files are deleted during a synchronization"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__selected_copy_sync_delete
+
+    @staticmethod
+    def set_selected_copy_sync_delete(copy_sync_delete: bool):
+        """Set if stale files are deleted during a synchronization"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        Context.__selected_copy_sync_delete = copy_sync_delete
+
     @staticmethod
     def get_selected_rows_csv_path():
         """Get CSV path describing rows for selection"""
@@ -403,6 +476,15 @@ class Context:
             f'{file_name}.csv'
         ))
 
+    @staticmethod
+    def get_selected_fingerprints_csv_path():
+        """Get CSV path describing fingerprints of rows for selection"""
+
+        rows_csv_path = Context.get_selected_rows_csv_path()
+        return rows_csv_path.with_name(
+            rows_csv_path.name.replace('rows_', 'fingerprints_', 1)
+        )
+
     @staticmethod
     def get_pinup_path() -> Path:
         """Get PINUP path"""
@@ -453,6 +535,24 @@ class Context:
 
         return Context.__monitor
 
+    @staticmethod
+    def get_refresh_workers() -> int:
+        """Get how many workers verify items during a refresh"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__refresh_workers
+
+    @staticmethod
+    def get_execution_workers() -> int:
+        """Get how many workers execute items during an execution"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__execution_workers
+
     @staticmethod
     def get_setup_file_path() -> Path:
         """Get setup file path"""
@@ -490,6 +590,18 @@ class Context:
             'cache'
         ))
 
+    @staticmethod
+    def get_store_path() -> Path:
+        """Get deduplicated store path"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Path(os.path.join(
+            Context.get_working_path(),
+            Constants.STORE_FOLDER_NAME
+        ))
+
     @staticmethod
     def get_bdd_path():
         """Get database path"""
@@ -616,6 +728,33 @@ class Context:
 
         return Context.__simulated
 
+    @staticmethod
+    def is_sync_with_hash() -> bool:
+        """Specify if files are compared with their hash during a synchronization"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__sync_with_hash
+
+    @staticmethod
+    def is_deduplicated_store() -> bool:
+        """Specify if versions files are shared through the deduplicated store"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__deduplicated_store
+
+    @staticmethod
+    def is_auto_refresh() -> bool:
+        """Specify if rows are refreshed in background when folders change"""
+
+        if not Context.__initialized:
+            Context.init()
+
+        return Context.__auto_refresh
+
     @staticmethod
     def list_available_emulators() -> list:
         """List available emulators"""
@@ -678,6 +817,16 @@ class Context:
                     Constants.SETUP_MONITOR
                 ])
 
+            if Constants.SETUP_REFRESH_WORKERS in setup_items:
+                Context.__refresh_workers = int(setup_items[
+                    Constants.SETUP_REFRESH_WORKERS
+                ])
+
+            if Constants.SETUP_EXECUTION_WORKERS in setup_items:
+                Context.__execution_workers = int(setup_items[
+                    Constants.SETUP_EXECUTION_WORKERS
+                ])
+
             if Constants.SETUP_PINUP_PATH in setup_items:
                 Context.__pinup_path = Path(setup_items[
                     Constants.SETUP_PINUP_PATH
@@ -731,6 +880,21 @@ class Context:
                     Constants.SETUP_SIMULATED
                 ] == 'True'
 
+            if Constants.SETUP_SYNC_WITH_HASH in setup_items:
+                Context.__sync_with_hash = setup_items[
+                    Constants.SETUP_SYNC_WITH_HASH
+                ] == 'True'
+
+            if Constants.SETUP_DEDUPLICATED_STORE in setup_items:
+                Context.__deduplicated_store = setup_items[
+                    Constants.SETUP_DEDUPLICATED_STORE
+                ] == 'True'
+
+            if Constants.SETUP_AUTO_REFRESH in setup_items:
+                Context.__auto_refresh = setup_items[
+                    Constants.SETUP_AUTO_REFRESH
+                ] == 'True'
+
             if Constants.SETUP_AVAILABLE_EMULATORS in setup_items:
                 Context.__available_emulators = []
                 for emulator in Emulator:
@@ -20,9 +20,10 @@ class CsvHelper:
     def write_data(
         file_path: str,
         data: list,
-        sort_column_id=Constants.CSV_COL_NAME
+        sort_column_id=Constants.CSV_COL_NAME,
+        format_values=True
     ):
-        """Write data in a CSV file"""
+        """Write data in a CSV file (values written as is if not formatted, None as empty)"""
 
         if Context.is_simulated():
             LoggingHelper.log_info(
@@ -76,6 +77,9 @@ class CsvHelper:
                 for key in header:
                     if key not in data_row:
                         data_row[key] = None
+                    if not format_values:
+                        row[key] = '' if data_row[key] is None else str(data_row[key])
+                        continue
                     row[key] = str(ListHelper.format_value(
                         value=str(data_row[key])
                     ))
@@ -0,0 +1,289 @@
+#!/usr/bin/python3
+"""File Copy Helper"""
+
+import os
+import shutil
+import stat
+import threading
+
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+
+
+class FileCopyHelper:
+    """
+    Class to copy files by chunks, with resume and progress reporting.
+
+    A file is copied in a temporary '.part' file renamed at the end, so an
+    interrupted copy never leaves a half-written destination and is resumed
+    by the next copy of the same file.
+    """
+
+    # Listeners called while copying (none or one)
+    __progress_listeners = []
+
+    # Locks of destination files, so a file is copied by one worker at a time
+    __copy_locks = [threading.Lock() for _ in range(Constants.FILE_COPY_LOCKS_COUNT)]
+
+    @staticmethod
+    def set_progress_listener(progress_listener: any):
+        """
+        Set a listener called while copying a file by chunks (None to remove it).
+
+        The listener receives (file_path, copied_size, total_size) and
+        returns False to interrupt the copy.
+        """
+
+        FileCopyHelper.__progress_listeners = [] if progress_listener is None \
+            else [progress_listener]
+
+    @staticmethod
+    def make_writable(
+        file_path: str
+    ):
+        """Make a file writable, the files linked to blobs of the store being read-only"""
+
+        file_mode = os.stat(file_path).st_mode
+        if not file_mode & stat.S_IWUSR:
+            os.chmod(file_path, file_mode | stat.S_IWUSR)
+
+    @staticmethod
+    def replace_file(
+        file_path: str,
+        destination_file_path: str
+    ):
+        """Replace a destination file by a file, even if the destination is read-only"""
+
+        try:
+            os.replace(file_path, destination_file_path)
+        except PermissionError:
+            # Windows doesn't replace read-only files
+            if not os.path.exists(destination_file_path):
+                raise
+            FileCopyHelper.make_writable(
+                file_path=destination_file_path
+            )
+            os.replace(file_path, destination_file_path)
+
+    @staticmethod
+    def __get_partial_file_path(
+        file_path: str
+    ) -> str:
+        """Get the temporary path used while a file is copied"""
+
+        return f'{file_path}{Constants.FILE_COPY_PARTIAL_EXTENSION}'
+
+    @staticmethod
+    def __get_resume_position(
+        source_file,
+        partial_file,
+        source_stat: os.stat_result
+    ) -> int:
+        """
+        Get the position to resume a copy from the last verified chunk.
+
+        The temporary file is marked with the modification time of its source
+        when created, then written after it, so it is resumed only if not
+        older than its source and not larger.
+        """
+
+        chunk_size = Constants.FILE_COPY_CHUNK_SIZE
+        partial_stat = os.fstat(partial_file.fileno())
+        if partial_stat.st_size > source_stat.st_size or \
+                partial_stat.st_mtime_ns < source_stat.st_mtime_ns:
+            return 0
+
+        # Only keep complete chunks
+        position = partial_stat.st_size - partial_stat.st_size % chunk_size
+        if position == 0:
+            return 0
+
+        # Verify the last complete chunk against the source
+        source_file.seek(position - chunk_size)
+        partial_file.seek(position - chunk_size)
+        if source_file.read(chunk_size) != partial_file.read(chunk_size):
+            return 0
+
+        return position
+
+    @staticmethod
+    def __notify_progress(
+        destination_file_path: str,
+        copied_size: int,
+        total_size: int
+    ):
+        """Report progress to the listener, and interrupt the copy if requested"""
+
+        for progress_listener in FileCopyHelper.__progress_listeners:
+            if progress_listener(
+                destination_file_path,
+                copied_size,
+                total_size
+            ) is False:
+                raise InterruptedError(Context.get_text(
+                    'copy_file_interrupted',
+                    file=str(destination_file_path)
+                ))
+
+    @staticmethod
+    def copy_file_by_chunks(
+        source_file_path: str,
+        destination_file_path: str
+    ):
+        """
+        Copy a file by chunks in a temporary file renamed at the end.
+
+        If the temporary file already exists (interrupted copy), the copy
+        resumes from its last verified chunk. InterruptedError is raised if
+        the listener interrupts the copy.
+        """
+
+        partial_file_path = FileCopyHelper.__get_partial_file_path(
+            file_path=destination_file_path
+        )
+        copy_lock = FileCopyHelper.__copy_locks[
+            hash(os.path.normcase(str(destination_file_path))) % Constants.FILE_COPY_LOCKS_COUNT
+        ]
+        source_stat = os.stat(source_file_path)
+
+        with copy_lock:
+
+            # Mark a new temporary file with the modification time of the source
+            if not os.path.exists(partial_file_path):
+                with open(partial_file_path, mode='wb'):
+                    pass
+                os.utime(
+                    partial_file_path,
+                    ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns)
+                )
+
+            FileCopyHelper.__copy_chunks(
+                source_file_path=source_file_path,
+                partial_file_path=partial_file_path,
+                destination_file_path=destination_file_path,
+                source_stat=source_stat
+            )
+
+        # A copy of a file linked to the store is not read-only
+        shutil.copystat(source_file_path, partial_file_path)
+        FileCopyHelper.make_writable(
+            file_path=partial_file_path
+        )
+        FileCopyHelper.replace_file(
+            file_path=partial_file_path,
+            destination_file_path=destination_file_path
+        )
+
+        return destination_file_path
+
+    @staticmethod
+    def __copy_chunks(
+        source_file_path: str,
+        partial_file_path: str,
+        destination_file_path: str,
+        source_stat: os.stat_result
+    ):
+        """Copy the chunks of a file not yet in its temporary file"""
+
+        chunk_size = Constants.FILE_COPY_CHUNK_SIZE
+        with open(source_file_path, mode='rb') as source_file, open(
+            partial_file_path,
+            mode='r+b'
+        ) as partial_file:
+
+            # Resume from the last verified chunk
+            position = FileCopyHelper.__get_resume_position(
+                source_file=source_file,
+                partial_file=partial_file,
+                source_stat=source_stat
+            )
+            source_file.seek(position)
+            partial_file.seek(position)
+            partial_file.truncate(position)
+
+            buffer = bytearray(chunk_size)
+            view = memoryview(buffer)
+            while True:
+                read_size = source_file.readinto(buffer)
+                if not read_size:
+                    break
+                partial_file.write(view[:read_size])
+                position += read_size
+
+                FileCopyHelper.__notify_progress(
+                    destination_file_path=destination_file_path,
+                    copied_size=position,
+                    total_size=source_stat.st_size
+                )
+
+    @staticmethod
+    def __is_copied(
+        source_file_path: str,
+        destination_file_path: str
+    ) -> bool:
+        """Specify if a file was already copied (same size and modification time)"""
+
+        try:
+            destination_stat = os.stat(destination_file_path)
+        except FileNotFoundError:
+            return False
+
+        source_stat = os.stat(source_file_path)
+        return source_stat.st_size == destination_stat.st_size and \
+            abs(source_stat.st_mtime - destination_stat.st_mtime) <= \
+            Constants.FILE_SYNC_MTIME_TOLERANCE
+
+    @staticmethod
+    def copy_tree_by_chunks(
+        source_folder_path: str,
+        destination_folder_path: str
+    ):
+        """
+        Copy the files of a folder by chunks, in an existing destination folder.
+
+        Files already copied are skipped, so an interrupted copy resumes where
+        it stopped. An interruption stops the whole copy (shutil.copytree would
+        ignore it as the OSError of a file).
+        """
+
+        if not os.path.isdir(source_folder_path):
+            raise FileNotFoundError(source_folder_path)
+
+        for root, _, files in os.walk(source_folder_path):
+            destination_root = os.path.normpath(os.path.join(
+                destination_folder_path,
+                os.path.relpath(root, source_folder_path)
+            ))
+            os.makedirs(destination_root, exist_ok=True)
+            for file in files:
+                if file.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION):
+                    continue
+                source_file_path = os.path.join(root, file)
+                destination_file_path = os.path.join(destination_root, file)
+                if FileCopyHelper.__is_copied(
+                    source_file_path=source_file_path,
+                    destination_file_path=destination_file_path
+                ):
+                    continue
+                FileCopyHelper.copy_file_by_chunks(
+                    source_file_path=source_file_path,
+                    destination_file_path=destination_file_path
+                )
+            shutil.copystat(root, destination_root)
+
+    @staticmethod
+    def delete_partial_files(
+        folder_path: str
+    ):
+        """Delete files partially copied in a folder (copy interrupted and not resumed)"""
+
+        if Context.is_simulated() or not os.path.isdir(folder_path):
+            return
+
+        for root, _, files in os.walk(folder_path):
+            for file in files:
+                if file.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION):
+                    try:
+                        os.remove(os.path.join(root, file))
+                    except OSError:
+                        pass
@@ -1,12 +1,17 @@
 #!/usr/bin/python3
 """File Helper"""
 
+from concurrent.futures import ThreadPoolExecutor
 import os
-import fnmatch
+import hashlib
 import shutil
 
+from libraries.constants.constants import Constants, Metric
 from libraries.context.context import Context
+from libraries.file.file_copy_helper import FileCopyHelper
+from libraries.file.file_name_matcher import FileNameMatcher
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
 
 
 class FileHelper:
@@ -20,6 +25,7 @@ class FileHelper:
         return os.path.isdir(folder_path)
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def delete_folder(
         folder_path: str
     ) -> bool:
@@ -48,7 +54,16 @@ class FileHelper:
                 folder=str(folder_path)
             )
         )
-        shutil.rmtree(folder_path)
+        try:
+            shutil.rmtree(folder_path)
+        except PermissionError:
+            # Windows doesn't delete read-only files (linked to the store)
+            for root, _, files in os.walk(folder_path):
+                for file in files:
+                    FileCopyHelper.make_writable(
+                        file_path=os.path.join(root, file)
+                    )
+            shutil.rmtree(folder_path)
 
         return True
 
@@ -80,6 +95,40 @@ class FileHelper:
         size_file2 = os.path.getsize(file2_path)
         return size_file1 == size_file2
 
+    @staticmethod
+    def compare_file_size(
+        file_path: str,
+        file_size: int
+    ):
+        """Compare the size of a file with an expected size"""
+        if not FileHelper.is_file_exists(
+            file_path=file_path
+        ):
+            return False
+
+        return os.path.getsize(file_path) == file_size
+
+    @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
+    def compute_file_hash(
+        file_path: str
+    ) -> str:
+        """Compute the hash of a file by chunks"""
+
+        file_hash = hashlib.sha256()
+        with open(file_path, mode='rb') as file:
+            while True:
+                chunk = file.read(Constants.FILE_COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                file_hash.update(chunk)
+
+        MetricsHelper.add_io(
+            read_size=os.path.getsize(file_path)
+        )
+
+        return file_hash.hexdigest()
+
     @staticmethod
     def list_files_and_folders(
         folder_path: str
@@ -95,32 +144,169 @@ class FileHelper:
             return ([], [])
 
         # List files and folders for the specified path
-        files_or_folders = os.listdir(folder_path)
+        folders, files = FileHelper.__scan_folder(folder_path)
 
         # List files
         files = [
-            item for item in files_or_folders
-            if not os.path.isdir(os.path.join(folder_path, item))
-            and not item.startswith(".")
+            item for item in files
+            if not item.startswith(".")
         ]
 
         # List folders
         folders = [
-            item for item in files_or_folders
-            if os.path.isdir(os.path.join(folder_path, item))
-            and not item.startswith(".")
+            item for item in folders
+            if not item.startswith(".")
         ]
 
         return (files, folders)
 
     @staticmethod
+    def __scan_folder(
+        folder_path: str
+    ):
+        """List sub folders and files of a folder, sorted by name"""
+
+        folders = []
+        files = []
+
+        # Entries types come with the listing, no extra call per entry
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        folders.append(entry.name)
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            pass
+
+        return (sorted(folders), sorted(files))
+
+    @staticmethod
+    def walk_folder(
+        folder_path: str
+    ):
+        """
+        Walk a folder like os.walk, listing the folders of a same depth in parallel.
+
+        Results are yielded level by level in a deterministic order and, as with
+        os.walk, sub folders removed from the yielded list are not walked.
+        """
+
+        with ThreadPoolExecutor(
+            max_workers=Constants.FILE_WALK_WORKERS
+        ) as executor:
+            roots = [folder_path]
+            while len(roots) > 0:
+                next_roots = []
+                for root, (folders, files) in zip(
+                    roots,
+                    executor.map(FileHelper.__scan_folder, roots)
+                ):
+                    yield (root, folders, files)
+                    next_roots.extend(
+                        os.path.join(root, folder) for folder in folders
+                    )
+                roots = next_roots
+
+    @staticmethod
+    def __scan_folder_sizes(
+        folder_path: str
+    ):
+        """List sub folders and files sizes of a folder, ignoring hidden and partial files"""
+
+        folders = []
+        files_sizes = {}
+
+        # Sizes come with the listing on Windows, no extra call per entry
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        folders.append(entry.name)
+                    elif not entry.name.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION):
+                        files_sizes[entry.name] = entry.stat().st_size
+        except OSError:
+            pass
+
+        return (folders, files_sizes)
+
+    @staticmethod
+    def index_folder(
+        folder_path: str
+    ) -> dict:
+        """
+        Index recursively the files of a folder with their size.
+
+        Hidden and partially copied files are ignored, as when listing paths.
+
+        :return: Dict of sizes by path relative to the folder
+        """
+
+        index = {}
+
+        with ThreadPoolExecutor(
+            max_workers=Constants.FILE_WALK_WORKERS
+        ) as executor:
+            roots = ['']
+            while len(roots) > 0:
+                next_roots = []
+                for root, (folders, files_sizes) in zip(
+                    roots,
+                    executor.map(
+                        FileHelper.__scan_folder_sizes,
+                        [os.path.join(folder_path, root) for root in roots]
+                    )
+                ):
+                    for file, file_size in files_sizes.items():
+                        index[os.path.join(root, file)] = file_size
+                    next_roots.extend(
+                        os.path.join(root, folder) for folder in folders
+                    )
+                roots = next_roots
+
+        return index
+
+    @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def list_relative_paths(
         folder_path: str,
         file_name: str,
         error_if_not_found=True
     ):
         """List recursively relative paths for the specified name"""
-        result = []
+
+        result = FileHelper.list_relative_paths_by_names(
+            folder_path=folder_path,
+            file_names=[file_name]
+        )[file_name]
+
+        if error_if_not_found and len(result) == 0:
+            raise Exception(Context.get_text(
+                'error_missing_file',
+                file=file_name,
+                folder=str(folder_path)
+            ))
+
+        return result
+
+    @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
+    def list_relative_paths_by_names(
+        folder_path: str,
+        file_names: list
+    ) -> dict:
+        """List recursively relative paths for several names in one walk, by name"""
+
+        matcher = FileNameMatcher(
+            file_names=file_names
+        )
+        result = {
+            file_name: []
+            for file_name in matcher.list_file_names()
+        }
 
         if not os.path.isdir(folder_path):
             LoggingHelper.log_warning(
@@ -129,15 +315,21 @@ class FileHelper:
                     folder=str(folder_path)
                 )
             )
-            return []
+            return result
 
-        for root, dirs, files in os.walk(folder_path):
+        for root, dirs, files in FileHelper.walk_folder(folder_path):
             # Ignore hidden folders/files (.DS_Store, .git, etc.)
             dirs[:] = [d for d in dirs if not d.startswith(".")]
             files = [f for f in files if not f.startswith(".")]
 
+            # Ignore files partially copied
+            files = [
+                f for f in files
+                if not f.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION)
+            ]
+
             # If a folder exists with the name of the file, add sub files
-            if file_name in dirs:
+            for file_name in matcher.match_folders(dirs):
                 sub_folder_path = os.path.join(
                     root,
                     file_name
@@ -150,36 +342,34 @@ class FileHelper:
                 for file_path in sub_files:
                     full_path = os.path.join(sub_folder_path, file_path)
                     relative_path = os.path.relpath(full_path, folder_path)
-                    result.append(relative_path)
+                    result[file_name].append(relative_path)
             # Try to find files
             for file_path in files:
-                if file_path == file_name or fnmatch.fnmatch(file_path, f'{file_name}.*'):
-                    full_path = os.path.join(root, file_path)
-                    relative_path = os.path.relpath(full_path, folder_path)
-                    if file_path == 'Thumbs.db':
-                        # Delete Thumbs.db
-                        FileHelper.delete_file(
-                            file_path=file_path
-                        )
-                        continue
-                    result.append(relative_path)
-
-        if error_if_not_found and len(result) == 0:
-            raise Exception(Context.get_text(
-                'error_missing_file',
-                file=file_name,
-                folder=str(folder_path)
-            ))
+                matched_file_names = matcher.match(file_path)
+                if len(matched_file_names) == 0:
+                    continue
+                full_path = os.path.join(root, file_path)
+                relative_path = os.path.relpath(full_path, folder_path)
+                if file_path == 'Thumbs.db':
+                    # Delete Thumbs.db
+                    FileHelper.delete_file(
+                        file_path=file_path
+                    )
+                    continue
+                for file_name in matched_file_names:
+                    result[file_name].append(relative_path)
 
         return result
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def copy_file(
         source_file_path: str,
-        destination_file_path: str
+        destination_file_path: str,
+        force: bool = False
     ) -> bool:
-        """Copy a file from source to destination"""
-        if os.path.exists(destination_file_path):
+        """Copy a file from source to destination, even if of same size if forced"""
+        if not force and os.path.exists(destination_file_path):
             if FileHelper.compare_files(source_file_path, destination_file_path):
                 return False
 
@@ -203,7 +393,20 @@ class FileHelper:
 
         try:
             os.makedirs(os.path.dirname(destination_file_path), exist_ok=True)
-            shutil.copy2(source_file_path, destination_file_path)
+            FileCopyHelper.copy_file_by_chunks(
+                source_file_path=source_file_path,
+                destination_file_path=destination_file_path
+            )
+            MetricsHelper.add_io(
+                read_size=os.path.getsize(destination_file_path),
+                written_size=os.path.getsize(destination_file_path),
+                files_count=1
+            )
+        except InterruptedError as exc:
+            LoggingHelper.log_warning(
+                message=str(exc)
+            )
+            return False
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -218,6 +421,7 @@ class FileHelper:
         return True
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def move_file(
         source_file_path: str,
         destination_file_path: str
@@ -244,6 +448,9 @@ class FileHelper:
 
         try:
             shutil.move(source_file_path, destination_file_path)
+            MetricsHelper.add_io(
+                files_count=1
+            )
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -258,6 +465,7 @@ class FileHelper:
         return True
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def copy_folder(
         source_folder_path: str,
         destination_folder_path: str
@@ -283,9 +491,15 @@ class FileHelper:
         )
 
         try:
-            os.makedirs(os.path.dirname(
-                destination_folder_path), exist_ok=True)
-            shutil.copytree(source_folder_path, destination_folder_path)
+            FileCopyHelper.copy_tree_by_chunks(
+                source_folder_path=source_folder_path,
+                destination_folder_path=destination_folder_path
+            )
+        except InterruptedError as exc:
+            LoggingHelper.log_warning(
+                message=str(exc)
+            )
+            return False
         except Exception as exc:
             LoggingHelper.log_error(
                 message=Context.get_text(
@@ -300,6 +514,7 @@ class FileHelper:
         return True
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def move_folder(
         source_folder_path: str,
         destination_folder_path: str
@@ -375,6 +590,22 @@ class FileHelper:
         os.startfile(folder_path)
 
     @staticmethod
+    def __remove_file(
+        file_path: str
+    ):
+        """Remove a file, even if read-only (linked to the store)"""
+
+        try:
+            os.remove(file_path)
+        except PermissionError:
+            # Windows doesn't remove read-only files
+            FileCopyHelper.make_writable(
+                file_path=file_path
+            )
+            os.remove(file_path)
+
+    @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def delete_file(
         file_path: str
     ) -> bool:
@@ -399,11 +630,22 @@ class FileHelper:
                 file=str(file_path)
             )
         )
-        os.remove(file_path)
+        try:
+            FileHelper.__remove_file(
+                file_path=file_path
+            )
+        except FileNotFoundError:
+            # Already deleted by another worker
+            return False
+
+        MetricsHelper.add_io(
+            files_count=1
+        )
 
         return True
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def read_file(
         file_path: str,
         encoding='UTF-8'
@@ -419,15 +661,23 @@ class FileHelper:
             mode='r',
             encoding=encoding
         ) as file:
-            return file.read()
+            content = file.read()
+
+        MetricsHelper.add_io(
+            read_size=len(content)
+        )
+
+        return content
 
     @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
     def write_file(
         file_path: str,
         content: str,
-        encoding='UTF-8'
+        encoding='UTF-8',
+        atomic: bool = False
     ):
-        """Write content in a file"""
+        """Write content in a file (in a partial file replacing it if atomic)"""
 
         if Context.is_simulated():
             LoggingHelper.log_info(
@@ -445,12 +695,33 @@ class FileHelper:
             )
         )
 
+        # Break a link to a blob of the deduplicated store before writing
+        if os.path.exists(file_path) and os.stat(file_path).st_nlink > 1:
+            FileHelper.__remove_file(
+                file_path=file_path
+            )
+
+        written_file_path = file_path
+        if atomic:
+            written_file_path = str(file_path) + Constants.FILE_COPY_PARTIAL_EXTENSION
+
         with open(
-            file_path,
+            written_file_path,
             mode='w',
             newline='\n',
             encoding=encoding
         ) as file:
             file.write(content)
 
+        MetricsHelper.add_io(
+            written_size=len(content),
+            files_count=1
+        )
+
+        if atomic:
+            FileCopyHelper.replace_file(
+                file_path=written_file_path,
+                destination_file_path=file_path
+            )
+
         return True
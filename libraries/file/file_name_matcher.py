@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""File Name Matcher"""
+
+import fnmatch
+import os
+import re
+
+
+class FileNameMatcher:
+    """
+    Class to match files names against several names at once.
+
+    A file matches a name if it is the name, or the name (with wildcards)
+    followed by an extension, as fnmatch with 'name.*'. All names are compiled
+    in one regular expression, so a file is tested once whatever the count of
+    names, and only the files matching it are tested name by name.
+    """
+
+    def __init__(
+        self,
+        file_names: list
+    ):
+        """Initialize matcher"""
+
+        self.__file_names = list(dict.fromkeys(file_names))
+        self.__patterns = [
+            re.compile(fnmatch.translate(os.path.normcase(f'{file_name}.*')))
+            for file_name in self.__file_names
+        ]
+        self.__pattern = re.compile('|'.join(
+            f'(?:{pattern.pattern})'
+            for pattern in self.__patterns
+        ))
+
+    def list_file_names(self) -> list:
+        """List matched names, in their order"""
+
+        return self.__file_names
+
+    def match(
+        self,
+        file: str
+    ) -> list:
+        """List names matched by a file"""
+
+        normalized_file = os.path.normcase(file)
+        if file not in self.__file_names and \
+                self.__pattern.match(normalized_file) is None:
+            return []
+
+        return [
+            file_name
+            for file_name, pattern in zip(self.__file_names, self.__patterns)
+            if file == file_name or pattern.match(normalized_file) is not None
+        ]
+
+    def match_folders(
+        self,
+        folders: list
+    ) -> list:
+        """List names which are the names of folders"""
+
+        return [
+            file_name
+            for file_name in self.__file_names
+            if file_name in folders
+        ]
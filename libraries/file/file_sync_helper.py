@@ -0,0 +1,188 @@
+#!/usr/bin/python3
+"""File Sync Helper"""
+
+import os
+
+from libraries.constants.constants import Constants, Metric
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
+
+
+class FileSyncHelper:
+    """Class to synchronize files and folders, copying only new or changed files"""
+
+    @staticmethod
+    def is_file_synchronized(
+        source_file_path: str,
+        destination_file_path: str,
+        with_hash=False
+    ) -> bool:
+        """Specify if destination file is identical to source (size, mtime and optional hash)"""
+
+        if not FileHelper.is_file_exists(
+            file_path=destination_file_path
+        ):
+            return False
+
+        source_stat = os.stat(source_file_path)
+        destination_stat = os.stat(destination_file_path)
+        if source_stat.st_size != destination_stat.st_size:
+            return False
+
+        if abs(source_stat.st_mtime - destination_stat.st_mtime) > \
+                Constants.FILE_SYNC_MTIME_TOLERANCE:
+            return False
+
+        if with_hash:
+            return FileHelper.compute_file_hash(
+                file_path=source_file_path
+            ) == FileHelper.compute_file_hash(
+                file_path=destination_file_path
+            )
+
+        return True
+
+    @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
+    def sync_file(
+        source_file_path: str,
+        destination_file_path: str,
+        with_hash=False
+    ) -> bool:
+        """Copy a file from source to destination only if new or changed"""
+
+        if FileSyncHelper.is_file_synchronized(
+            source_file_path=source_file_path,
+            destination_file_path=destination_file_path,
+            with_hash=with_hash
+        ):
+            return False
+
+        # Changed file is replaced at the end of the copy, even with the same size
+        return FileHelper.copy_file(
+            source_file_path=source_file_path,
+            destination_file_path=destination_file_path,
+            force=True
+        )
+
+    @staticmethod
+    @MetricsHelper.measured(Metric.FILESYSTEM)
+    def sync_folder(
+        source_folder_path: str,
+        destination_folder_path: str,
+        delete_stale_files=False,
+        with_hash=False
+    ):
+        """
+        Synchronize a folder from source to destination.
+
+        Only new or changed files are copied and, if requested, files missing
+        from the source are deleted from the destination.
+
+        :return: Tuple (copied size, skipped size, deleted files count)
+        """
+
+        copied_size = 0
+        skipped_size = 0
+        deleted_files_count = 0
+
+        if not os.path.isdir(source_folder_path):
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_not_found_folder',
+                    folder=str(source_folder_path)
+                )
+            )
+            return (copied_size, skipped_size, deleted_files_count)
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'sync_folder_in_progress',
+                source_folder=str(source_folder_path),
+                destination_folder=str(destination_folder_path)
+            )
+        )
+
+        source_relative_paths = FileSyncHelper.__list_all_relative_paths(
+            folder_path=source_folder_path
+        )
+        for relative_path in source_relative_paths:
+            source_file_path = os.path.join(
+                source_folder_path,
+                relative_path
+            )
+            file_size = os.path.getsize(source_file_path)
+            if FileSyncHelper.sync_file(
+                source_file_path=source_file_path,
+                destination_file_path=os.path.join(
+                    destination_folder_path,
+                    relative_path
+                ),
+                with_hash=with_hash
+            ):
+                copied_size += file_size
+            else:
+                skipped_size += file_size
+
+        # Delete stale files
+        if delete_stale_files:
+            source_relative_paths = set(source_relative_paths)
+            for relative_path in FileSyncHelper.__list_all_relative_paths(
+                folder_path=destination_folder_path
+            ):
+                if relative_path in source_relative_paths:
+                    continue
+                if FileHelper.delete_file(
+                    file_path=os.path.join(
+                        destination_folder_path,
+                        relative_path
+                    )
+                ):
+                    deleted_files_count += 1
+            FileSyncHelper.__delete_empty_folders(
+                source_folder_path=source_folder_path,
+                destination_folder_path=destination_folder_path
+            )
+
+        return (copied_size, skipped_size, deleted_files_count)
+
+    @staticmethod
+    def __delete_empty_folders(
+        source_folder_path: str,
+        destination_folder_path: str
+    ):
+        """Delete folders of destination left empty and missing from source"""
+
+        for root, folders, files in os.walk(destination_folder_path, topdown=False):
+            if root == destination_folder_path or len(files) > 0:
+                continue
+            if any(os.path.isdir(os.path.join(root, folder)) for folder in folders):
+                continue
+            if os.path.isdir(os.path.join(
+                source_folder_path,
+                os.path.relpath(root, destination_folder_path)
+            )):
+                continue
+            FileHelper.delete_folder(
+                folder_path=root
+            )
+
+    @staticmethod
+    def __list_all_relative_paths(
+        folder_path: str
+    ) -> list[str]:
+        """List recursively relative paths for all files of a folder"""
+
+        result = []
+        for root, _, files in FileHelper.walk_folder(folder_path):
+            for file_name in files:
+                if file_name.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION):
+                    continue
+                result.append(os.path.relpath(
+                    os.path.join(root, file_name),
+                    folder_path
+                ))
+
+        return result
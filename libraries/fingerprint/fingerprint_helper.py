@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+"""Fingerprint Helper"""
+
+import hashlib
+import json
+import os
+
+from libraries.constants.constants import Constants
+from libraries.csv.csv_helper import CsvHelper
+from libraries.file.file_helper import FileHelper
+
+
+class FingerprintHelper:
+    """
+    Class to help usage of refresh fingerprints.
+
+    A fingerprint summarizes everything a verification depends on, so an
+    item with the same fingerprint as the previous refresh is not verified again.
+    """
+
+    @staticmethod
+    def compute_fingerprint(
+        *values
+    ) -> str:
+        """Compute a fingerprint from values"""
+
+        return hashlib.sha1(
+            json.dumps(
+                values,
+                sort_keys=True,
+                default=str
+            ).encode('UTF-8')
+        ).hexdigest()
+
+    @staticmethod
+    def get_path_mtime(
+        path: str
+    ):
+        """Get modification time of a path, None if not found"""
+
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def get_folder_mtimes(
+        folder_path: str
+    ) -> list:
+        """
+        Get modification times of a folder and of all its sub folders.
+
+        Adding, deleting or replacing a file changes the modification time of
+        its folder, manifests are also included as they are rewritten in place.
+        """
+
+        if not os.path.isdir(folder_path):
+            return []
+
+        mtimes = []
+        for root, _, files in FileHelper.walk_folder(folder_path):
+            mtimes.append((
+                os.path.relpath(root, folder_path),
+                FingerprintHelper.get_path_mtime(root)
+            ))
+            if Constants.MANIFEST_FILE_NAME in files:
+                mtimes.append((
+                    os.path.relpath(
+                        os.path.join(root, Constants.MANIFEST_FILE_NAME),
+                        folder_path
+                    ),
+                    FingerprintHelper.get_path_mtime(
+                        os.path.join(root, Constants.MANIFEST_FILE_NAME)
+                    )
+                ))
+
+        return mtimes
+
+    @staticmethod
+    def read_fingerprints(
+        file_path: str
+    ) -> dict:
+        """Read fingerprints by id from a CSV file"""
+
+        return {
+            row[Constants.FINGERPRINTS_COL_ID]: row[Constants.FINGERPRINTS_COL_FINGERPRINT]
+            for row in CsvHelper.read_data(
+                file_path=file_path
+            )
+        }
+
+    @staticmethod
+    def write_fingerprints(
+        file_path: str,
+        fingerprints: dict
+    ):
+        """Write fingerprints by id in a CSV file"""
+
+        CsvHelper.write_data(
+            file_path=file_path,
+            data=[
+                {
+                    Constants.FINGERPRINTS_COL_ID: item_id,
+                    Constants.FINGERPRINTS_COL_FINGERPRINT: fingerprint
+                }
+                for item_id, fingerprint in fingerprints.items()
+            ],
+            sort_column_id=Constants.FINGERPRINTS_COL_ID
+        )
@@ -3,6 +3,7 @@
 
 import logging
 import os
+import sys
 import tkinter as tk
 
 from logging.handlers import TimedRotatingFileHandler
@@ -18,6 +19,7 @@ class LoggingHelper:
     __warning_logger: logging.Logger = None
     __info_logger: logging.Logger = None
     __log_ui: tk.Text = None
+    __log_console: bool = False
 
     @staticmethod
     def __init_info_logger():
@@ -106,6 +108,12 @@ class LoggingHelper:
 
         LoggingHelper.__log_ui = log_ui
 
+    @staticmethod
+    def set_log_console(log_console: bool):
+        """Set if log is shown in the console"""
+
+        LoggingHelper.__log_console = log_console
+
     @staticmethod
     def log_info(message):
         """Log an informational message"""
@@ -119,6 +127,9 @@ class LoggingHelper:
             LoggingHelper.__log_ui.config(state=tk.DISABLED)
             LoggingHelper.__log_ui.see('end')
 
+        if LoggingHelper.__log_console:
+            print(message, flush=True)
+
         LoggingHelper.__info_logger.info(message)
 
     @staticmethod
@@ -134,6 +145,9 @@ class LoggingHelper:
             LoggingHelper.__log_ui.config(state=tk.DISABLED)
             LoggingHelper.__log_ui.see('end')
 
+        if LoggingHelper.__log_console:
+            print(message, flush=True)
+
         LoggingHelper.__warning_logger.warning(message)
 
     @staticmethod
@@ -149,4 +163,7 @@ class LoggingHelper:
             LoggingHelper.__log_ui.config(state=tk.DISABLED)
             LoggingHelper.__log_ui.see('end')
 
+        if LoggingHelper.__log_console:
+            print(f'{message}: {exc}', file=sys.stderr, flush=True)
+
         LoggingHelper.__error_logger.error(message, exc_info=exc)
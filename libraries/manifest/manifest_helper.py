@@ -0,0 +1,231 @@
+#!/usr/bin/python3
+"""Manifest Helper"""
+
+import os
+
+from libraries.constants.constants import Constants
+from libraries.csv.csv_helper import CsvHelper
+from libraries.file.file_helper import FileHelper
+
+
+class ManifestHelper:
+    """
+    Class to help usage of versions manifests.
+
+    A manifest lists the files of a version folder with their size, so
+    verifications read it instead of walking the version folder. A sub folder
+    is walked instead (and the manifest rewritten by the next refresh) once
+    files were added or removed in its folders. A file overwritten in place
+    does not change its folder, so its size stays the one of the manifest.
+    """
+
+    # Manifests already read, by path: (manifest's mtime, files sizes, folders listed)
+    __manifests_cache = {}
+
+    @staticmethod
+    def __get_manifest_path(
+        version_folder_path: str
+    ) -> str:
+        """Get manifest's path of a version folder"""
+
+        return os.path.join(
+            version_folder_path,
+            Constants.MANIFEST_FILE_NAME
+        )
+
+    @staticmethod
+    def write_manifest(
+        version_folder_path: str
+    ):
+        """Write the manifest of a version folder"""
+
+        if not os.path.isdir(version_folder_path):
+            return
+
+        data = [
+            {
+                Constants.MANIFEST_COL_PATH: relative_path,
+                Constants.MANIFEST_COL_SIZE: os.path.getsize(
+                    os.path.join(version_folder_path, relative_path)
+                )
+            }
+            for relative_path in FileHelper.list_relative_paths(
+                folder_path=version_folder_path,
+                file_name='*',
+                error_if_not_found=False
+            )
+        ]
+
+        # Written last, so the manifest is newer than the folders it lists
+        CsvHelper.write_data(
+            file_path=ManifestHelper.__get_manifest_path(
+                version_folder_path=version_folder_path
+            ),
+            data=data,
+            sort_column_id=Constants.MANIFEST_COL_PATH if len(data) > 0 else '',
+            format_values=False
+        )
+
+    @staticmethod
+    def write_item_manifests(
+        item_folder_path: str,
+        only_stale=False
+    ):
+        """Write the manifests of all versions of an item (only missing or stale ones if asked)"""
+
+        if not os.path.isdir(item_folder_path):
+            return
+
+        _, folders = FileHelper.list_files_and_folders(
+            folder_path=item_folder_path
+        )
+        for folder in folders:
+            version_folder_path = os.path.join(
+                item_folder_path,
+                folder
+            )
+            if only_stale:
+                manifest = ManifestHelper.__read_manifest(
+                    version_folder_path=version_folder_path
+                )
+                if manifest is not None and not ManifestHelper.__is_manifest_stale(
+                    version_folder_path=version_folder_path,
+                    manifest_mtime=manifest[0],
+                    folders_paths=manifest[2]
+                ):
+                    continue
+
+            ManifestHelper.write_manifest(
+                version_folder_path=version_folder_path
+            )
+
+    @staticmethod
+    def __list_folders_paths(
+        files_sizes: dict
+    ) -> set:
+        """List the folders of the files of a manifest, the version folder included"""
+
+        folders_paths = {''}
+        for relative_path in files_sizes:
+            folder_path = os.path.dirname(relative_path)
+            while folder_path not in folders_paths:
+                folders_paths.add(folder_path)
+                folder_path = os.path.dirname(folder_path)
+
+        return folders_paths
+
+    @staticmethod
+    def __is_manifest_stale(
+        version_folder_path: str,
+        manifest_mtime: int,
+        folders_paths: set
+    ) -> bool:
+        """
+        Specify if files were added or removed in folders since the manifest was written.
+
+        Adding, removing or replacing a file updates the modification time of
+        its folder, so the manifest is stale if one of the folders is newer
+        than it.
+        """
+
+        for folder_path in folders_paths:
+            try:
+                if os.stat(os.path.join(
+                    version_folder_path,
+                    folder_path
+                )).st_mtime_ns > manifest_mtime:
+                    return True
+            except OSError:
+                return True
+
+        return False
+
+    @staticmethod
+    def __read_manifest(
+        version_folder_path: str
+    ) -> tuple:
+        """Read the manifest of a version folder with its mtime and folders, None if no manifest"""
+
+        manifest_path = ManifestHelper.__get_manifest_path(
+            version_folder_path=version_folder_path
+        )
+
+        try:
+            manifest_mtime = os.stat(manifest_path).st_mtime_ns
+        except OSError:
+            return None
+
+        # Use the manifest already read if not changed since
+        cached_manifest = ManifestHelper.__manifests_cache.get(manifest_path)
+        if cached_manifest is not None and cached_manifest[0] == manifest_mtime:
+            return cached_manifest
+
+        files_sizes = {
+            row[Constants.MANIFEST_COL_PATH]: int(row[Constants.MANIFEST_COL_SIZE])
+            for row in CsvHelper.read_data(
+                file_path=manifest_path
+            )
+        }
+        cached_manifest = (
+            manifest_mtime,
+            files_sizes,
+            ManifestHelper.__list_folders_paths(
+                files_sizes=files_sizes
+            )
+        )
+        ManifestHelper.__manifests_cache[manifest_path] = cached_manifest
+
+        return cached_manifest
+
+    @staticmethod
+    def list_files(
+        version_folder_path: str,
+        sub_folder_path: str
+    ) -> dict:
+        """
+        List files of a sub folder of a version with their size.
+
+        The manifest is used if it exists and the sub folder (with the version
+        folder) was not modified since, otherwise the sub folder is walked.
+        Only the folders of the sub folder are compared with the manifest.
+
+        :return: Dict of sizes by path relative to the sub folder
+        """
+
+        prefix = os.path.join(sub_folder_path, '')
+        manifest = ManifestHelper.__read_manifest(
+            version_folder_path=version_folder_path
+        )
+
+        if manifest is None or ManifestHelper.__is_manifest_stale(
+            version_folder_path=version_folder_path,
+            manifest_mtime=manifest[0],
+            folders_paths={'', sub_folder_path}.union(
+                folder_path
+                for folder_path in manifest[2]
+                if folder_path.startswith(prefix)
+            )
+        ):
+            folder_path = os.path.join(
+                version_folder_path,
+                sub_folder_path
+            )
+            if not os.path.isdir(folder_path):
+                return {}
+
+            return {
+                relative_path: os.path.getsize(
+                    os.path.join(folder_path, relative_path)
+                )
+                for relative_path in FileHelper.list_relative_paths(
+                    folder_path=folder_path,
+                    file_name='*',
+                    error_if_not_found=False
+                )
+            }
+
+        return {
+            path[len(prefix):]: size
+            for path, size in manifest[1].items()
+            if path.startswith(prefix)
+        }
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""Metrics Helper"""
+
+import functools
+import threading
+import time
+
+from libraries.constants.constants import Metric
+
+
+class MetricsHelper:
+    """
+    Class to help measuring the I/O of the current item.
+
+    An executor records the metrics of an item in its thread, and helpers
+    measure their calls. Nested calls are timed once, in the outermost one.
+    """
+
+    # Record of the current thread
+    __local = threading.local()
+    __lock = threading.Lock()
+
+    @staticmethod
+    def create_record() -> dict:
+        """Create an empty record of metrics"""
+
+        record = {
+            'wall_time': 0.0,
+            'bytes_read': 0,
+            'bytes_written': 0,
+            'files_count': 0
+        }
+        for metric in Metric:
+            record[f'{metric.name.lower()}_time'] = 0.0
+
+        return record
+
+    @staticmethod
+    def start_recording(
+        record: dict
+    ):
+        """Record metrics of the current thread in a record"""
+
+        MetricsHelper.__local.record = record
+        MetricsHelper.__local.depth = 0
+        MetricsHelper.__local.start_time = time.perf_counter()
+
+    @staticmethod
+    def stop_recording():
+        """Stop recording metrics of the current thread, adding its wall time"""
+
+        record = getattr(MetricsHelper.__local, 'record', None)
+        if record is None:
+            return
+
+        with MetricsHelper.__lock:
+            record['wall_time'] += time.perf_counter() - MetricsHelper.__local.start_time
+        MetricsHelper.__local.record = None
+
+    @staticmethod
+    def measured(
+        metric: Metric
+    ):
+        """Decorate a function to add its time to the record of the current thread"""
+
+        def decorator(function):
+            @functools.wraps(function)
+            def measured_function(*args, **kwargs):
+                record = getattr(MetricsHelper.__local, 'record', None)
+                if record is None or MetricsHelper.__local.depth > 0:
+                    return function(*args, **kwargs)
+
+                MetricsHelper.__local.depth += 1
+                start_time = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    MetricsHelper.__local.depth -= 1
+                    with MetricsHelper.__lock:
+                        record[f'{metric.name.lower()}_time'] += time.perf_counter() - start_time
+
+            return measured_function
+
+        return decorator
+
+    @staticmethod
+    def add_io(
+        read_size: int = 0,
+        written_size: int = 0,
+        files_count: int = 0
+    ):
+        """Add bytes read and written, and files touched, to the record of the current thread"""
+
+        record = getattr(MetricsHelper.__local, 'record', None)
+        if record is None:
+            return
+
+        with MetricsHelper.__lock:
+            record['bytes_read'] += read_size
+            record['bytes_written'] += written_size
+            record['files_count'] += files_count
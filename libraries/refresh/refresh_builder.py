@@ -0,0 +1,1261 @@
+#!/usr/bin/python3
+"""Refresh Builder"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+
+from libraries.constants.constants import Action, Category, Component, Constants, Emulator
+from libraries.context.context import Context
+from libraries.csv.csv_helper import CsvHelper
+from libraries.file.file_helper import FileHelper
+from libraries.fingerprint.fingerprint_helper import FingerprintHelper
+from libraries.list.list_helper import ListHelper
+from libraries.manifest.manifest_helper import ManifestHelper
+from libraries.refresh.refresh_rows import RefreshRows
+from libraries.refresh.refresh_session import RefreshSession
+from libraries.refresh.refresh_watcher import RefreshWatcher
+from libraries.verifier.verifier import Verifier
+
+# pylint: disable=too-many-branches, too-many-statements
+# pylint: disable=line-too-long, too-many-locals, too-many-lines
+# pylint: disable=too-many-return-statements
+
+
+class RefreshBuilder:
+    """
+    Class to build the rows of the selection, without UI.
+
+    Progress is reported to a progress (UIProgress or ConsoleProgress) and
+    rows can be received one by one as they are verified. Rows are written
+    for the next refreshes and executions, in a thread not waited for.
+    """
+
+    # Thread writing rows of the last refresh
+    __rows_writing_thread = None
+
+    def __init__(
+        self,
+        only_ids: list[str],
+        progress: any,
+        on_row: any = None
+    ):
+        """Initialize builder"""
+
+        self.__only_ids = only_ids
+        self.__progress = progress
+        self.__on_row = on_row
+        self.__interruption_requested = False
+
+    def request_interruption(self):
+        """Request the build to stop as soon as possible"""
+
+        self.__interruption_requested = True
+
+    def build(self) -> list:
+        """
+        Build sorted rows of the selection, completing the previous rows if with only ids.
+
+        :return: Rows built, None if interruption requested
+        """
+
+        # Wait rows of the previous refresh to be written
+        if RefreshBuilder.__rows_writing_thread is not None:
+            RefreshBuilder.__rows_writing_thread.join()
+
+        # Share scan results with previous refreshes, except after modifications
+        if self.__only_ids is not None:
+            RefreshSession.invalidate()
+        session = RefreshSession.get()
+
+        # Create rows for table top
+        table_top_rows = []
+        match(Context.get_selected_category()):
+            case Category.TABLES:
+                # Rebuild manifests of the tables to refresh, only the missing or stale ones if all
+                tables_folder_path = os.path.join(
+                    Context.get_working_path(),
+                    'tables',
+                    Context.get_selected_emulator().value
+                )
+                if self.__is_with_only_ids():
+                    tables_ids = self.__only_ids
+                else:
+                    _, tables_ids = FileHelper.list_files_and_folders(
+                        folder_path=tables_folder_path
+                    )
+                RefreshWatcher.pause()
+                try:
+                    for table_id in tables_ids:
+                        ManifestHelper.write_item_manifests(
+                            item_folder_path=os.path.join(
+                                tables_folder_path,
+                                table_id
+                            ),
+                            only_stale=not self.__is_with_only_ids()
+                        )
+                finally:
+                    RefreshWatcher.resume()
+
+                # Append row for each table
+                csv_tables = session.get_csv_items()
+                bdd_tables = session.get_bdd_items()
+
+                # Verify tables against indexes of installation folders
+                batch_verifier = session.get_batch_verifier()
+
+                match(Context.get_selected_action()):
+                    case Action.INSTALL:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=csv_tables
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Verify installed files of the tables to build at once
+                        verifications = {}
+
+                        def verify_table_install_rows(csv_tables_to_build):
+                            verifications.update(batch_verifier.verify_rows(
+                                csv_rows=csv_tables_to_build,
+                                bdd_rows=bdd_tables
+                            ))
+
+                        # Retrieve tables from CSV
+                        def build_table_install_row(csv_table):
+                            csv_table_id = csv_table[Constants.CSV_COL_ID]
+                            csv_table_name = csv_table[Constants.CSV_COL_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(csv_table_id):
+                                return None
+
+                            # Retrieve CSV table's data
+                            csv_table_version = csv_table[Constants.CSV_COL_VERSION]
+                            csv_table_rom = csv_table[Constants.CSV_COL_ROM]
+
+                            # Retrieve BDD Table
+                            bdd_table = ListHelper.select_item(
+                                item_id=csv_table_id,
+                                a_list=bdd_tables,
+                                id_column=Constants.BDD_COL_TABLE_ID
+                            )
+
+                            # Retrieve BDD table's data
+                            bdd_table_version = bdd_table.get(
+                                Constants.BDD_COL_TABLE_VERSION,
+                                None
+                            )
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = csv_table_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = csv_table_name
+                            row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION] = Verifier.verify_csv_bdd_version(
+                                csv_version=csv_table_version,
+                                bdd_version=bdd_table_version
+                            )
+                            if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+                                row[Component.EMULATOR_TABLE.value] = verifications[csv_table_id][Component.EMULATOR_TABLE.value]
+                            else:
+                                row[Component.EMULATOR_TABLE.value] = row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION]
+
+                            row[Component.PINUP_MEDIA.value] = verifications[csv_table_id][Component.PINUP_MEDIA.value]
+                            row[Component.PINUP_VIDEOS.value] = verifications[csv_table_id][Component.PINUP_VIDEOS.value]
+                            if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+                                row[Component.CONFIG_XML.value] = Verifier.verify_table_xml_config_install(
+                                    csv_table_id=csv_table_id,
+                                    csv_table_version=csv_table_version,
+                                    csv_table_rom=csv_table_rom
+                                )
+                                row[Component.CONFIG_REG.value] = batch_verifier.verify_table_reg_config_install(
+                                    csv_table_id=csv_table_id,
+                                    csv_table_version=csv_table_version,
+                                    csv_table_rom=csv_table_rom
+                                )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=csv_tables,
+                                build_row=build_table_install_row,
+                                id_column=Constants.CSV_COL_ID,
+                                get_fingerprint=session.get_table_fingerprint,
+                                verify_items=verify_table_install_rows
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.UNINSTALL:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=bdd_tables
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Verify installed files of the tables to build at once
+                        verifications = {}
+
+                        def verify_table_uninstall_rows(bdd_tables_to_build):
+                            verifications.update(batch_verifier.verify_rows(
+                                csv_rows=csv_tables,
+                                bdd_rows=bdd_tables_to_build
+                            ))
+
+                        # Retrieve tables from BDD
+                        def build_table_uninstall_row(bdd_table):
+                            bdd_table_id = bdd_table[Constants.BDD_COL_TABLE_ID]
+                            bdd_table_name = bdd_table[Constants.BDD_COL_TABLE_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_table_id):
+                                return None
+
+                            # Retrieve BDD table's data
+                            bdd_table_version = bdd_table[Constants.BDD_COL_TABLE_VERSION]
+                            bdd_table_rom = bdd_table[Constants.BDD_COL_TABLE_ROM]
+
+                            if Verifier.verify_none_value(bdd_table_version):
+                                bdd_table_version = 'latest'
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_table_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = bdd_table_name
+                            if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+                                row[Component.EMULATOR_TABLE.value] = verifications[bdd_table_id][Component.EMULATOR_TABLE.value]
+                            else:
+                                row[Component.EMULATOR_TABLE.value] = True
+                            row[Component.PINUP_MEDIA.value] = verifications[bdd_table_id][Component.PINUP_MEDIA.value]
+                            row[Component.PINUP_VIDEOS.value] = verifications[bdd_table_id][Component.PINUP_VIDEOS.value]
+                            if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+                                row[Component.CONFIG_XML.value] = Verifier.verify_table_xml_config_uninstall(
+                                    bdd_table_id=bdd_table_id,
+                                    bdd_table_version=bdd_table_version,
+                                    bdd_table_rom=bdd_table_rom
+                                )
+                                row[Component.CONFIG_REG.value] = batch_verifier.verify_table_reg_config_uninstall(
+                                    bdd_table_id=bdd_table_id,
+                                    bdd_table_version=bdd_table_version,
+                                    bdd_table_rom=bdd_table_rom
+                                )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=bdd_tables,
+                                build_row=build_table_uninstall_row,
+                                id_column=Constants.BDD_COL_TABLE_ID,
+                                get_fingerprint=session.get_table_fingerprint,
+                                verify_items=verify_table_uninstall_rows
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.EXPORT:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=bdd_tables
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve tables from BDD
+                        def build_table_export_row(bdd_table):
+                            bdd_table_id = bdd_table[Constants.BDD_COL_TABLE_ID]
+                            bdd_table_name = bdd_table[Constants.BDD_COL_TABLE_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_table_id):
+                                return None
+
+                            # Retrieve BDD table's data
+                            bdd_table_version = bdd_table[Constants.BDD_COL_TABLE_VERSION]
+                            bdd_table_rom = bdd_table[Constants.BDD_COL_TABLE_ROM]
+
+                            if Verifier.verify_none_value(bdd_table_version):
+                                bdd_table_version = 'latest'
+
+                            # Retrieve CSV Table
+                            csv_table = ListHelper.select_item(
+                                item_id=bdd_table_id,
+                                a_list=csv_tables,
+                                id_column=Constants.CSV_COL_ID
+                            )
+                            csv_table_videos_path = csv_table.get(
+                                Constants.CSV_COL_VIDEOS_PATH,
+                                None
+                            )
+
+                            # Retrieve CSV table's data
+                            csv_table_version = csv_table.get(
+                                Constants.CSV_COL_VERSION,
+                                None
+                            )
+                            csv_table_rom = csv_table.get(
+                                Constants.CSV_COL_ROM,
+                                None
+                            )
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_table_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = bdd_table_name
+                            row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION] = Verifier.verify_csv_bdd_version(
+                                csv_version=csv_table_version,
+                                bdd_version=bdd_table_version
+                            )
+                            if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+                                row[Component.EMULATOR_TABLE.value] = batch_verifier.verify_table_emulator_export(
+                                    bdd_table_id=bdd_table_id,
+                                    bdd_table_version=bdd_table_version,
+                                    csv_table_rom=csv_table_rom
+                                )
+                            else:
+                                row[Component.EMULATOR_TABLE.value] = row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION]
+                            row[Component.PINUP_MEDIA.value] = batch_verifier.verify_table_pinup_media_export(
+                                bdd_table_id=bdd_table_id,
+                                bdd_table_version=bdd_table_version
+                            )
+                            row[Component.PINUP_VIDEOS.value] = batch_verifier.verify_table_pinup_videos_export(
+                                csv_table_videos_path=csv_table_videos_path,
+                                bdd_table_id=bdd_table_id,
+                                bdd_table_version=bdd_table_version
+                            )
+                            if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+                                row[Component.CONFIG_XML.value] = Verifier.verify_table_xml_config_export(
+                                    bdd_table_id=bdd_table_id,
+                                    bdd_table_version=bdd_table_version,
+                                    bdd_table_rom=bdd_table_rom
+                                )
+                                row[Component.CONFIG_REG.value] = batch_verifier.verify_table_reg_config_export(
+                                    bdd_table_id=bdd_table_id,
+                                    bdd_table_version=bdd_table_version,
+                                    bdd_table_rom=bdd_table_rom
+                                )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=bdd_tables,
+                                build_row=build_table_export_row,
+                                id_column=Constants.BDD_COL_TABLE_ID,
+                                get_fingerprint=session.get_table_fingerprint
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.COPY:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=csv_tables
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve tables from CSV
+                        def build_table_copy_row(csv_table):
+                            csv_table_id = csv_table[Constants.CSV_COL_ID]
+                            csv_table_name = csv_table[Constants.CSV_COL_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(csv_table_id):
+                                return None
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = csv_table_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = csv_table_name
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=csv_tables,
+                                build_row=build_table_copy_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.EDIT:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=csv_tables
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve tables from CSV
+                        def build_table_edit_row(csv_table):
+                            csv_table_id = csv_table[Constants.CSV_COL_ID]
+                            csv_table_name = csv_table[Constants.CSV_COL_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(csv_table_id):
+                                return None
+
+                            # Retrieve CSV table's data
+                            csv_table_version = csv_table[Constants.CSV_COL_VERSION]
+                            csv_table_videos_path = csv_table[Constants.CSV_COL_VIDEOS_PATH]
+                            csv_table_weblink_url = csv_table[Constants.CSV_COL_WEBLINK_URL]
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = csv_table_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = csv_table_name
+                            (row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION],
+                             row[Constants.UI_TABLE_KEY_COL_UNIQUE_VERSION]) = Verifier.verify_table_versions(
+                                csv_table_id=csv_table_id,
+                                csv_table_weblink_url=csv_table_weblink_url
+                            )
+                            row[Component.PINUP_MEDIA.value] = Verifier.verify_table_pinup_media_edit(
+                                csv_table_id=csv_table_id,
+                                csv_table_version=csv_table_version
+                            )
+                            row[Component.PINUP_VIDEOS.value] = Verifier.verify_table_pinup_videos_edit(
+                                csv_table_videos_path=csv_table_videos_path,
+                                csv_table_id=csv_table_id,
+                                csv_table_version=csv_table_version
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=csv_tables,
+                                build_row=build_table_edit_row,
+                                # Selenium Web Browser is not shared between threads
+                                workers=1
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+
+                            # Destroy Selenium Web Browser
+                            Context.destroy_selenium_web_browser()
+
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                        # Destroy Selenium Web Browser
+                        Context.destroy_selenium_web_browser()
+
+            case Category.PLAYLISTS:
+                # Append row for each playlist
+                csv_playlists = session.get_csv_items()
+                bdd_playlists = session.get_bdd_items()
+
+                match(Context.get_selected_action()):
+                    case Action.INSTALL:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=csv_playlists
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve playlists from CSV
+                        def build_playlist_install_row(csv_playlist):
+                            csv_playlist_id = csv_playlist[Constants.CSV_COL_ID]
+                            csv_playlist_name = csv_playlist[Constants.CSV_COL_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(csv_playlist_id):
+                                return None
+
+                            # Retrieve CSV playlist's data
+                            csv_playlist_version = csv_playlist[Constants.CSV_COL_VERSION]
+
+                            # Retrieve BDD Playlist
+                            bdd_playlist = ListHelper.select_item(
+                                item_id=csv_playlist_id,
+                                a_list=bdd_playlists,
+                                id_column=Constants.BDD_COL_PLAYLIST_ID
+                            )
+
+                            # Retrieve BDD playlist's data
+                            bdd_playlist_version = bdd_playlist.get(
+                                Constants.BDD_COL_PLAYLIST_VERSION,
+                                None
+                            )
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = csv_playlist_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = csv_playlist_name
+                            row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION] = Verifier.verify_csv_bdd_version(
+                                csv_version=csv_playlist_version,
+                                bdd_version=bdd_playlist_version
+                            )
+                            row[Component.EMULATOR_PLAYLIST.value] = not Verifier.verify_none_value(
+                                bdd_playlist_version
+                            )
+                            row[Component.PINUP_MEDIA.value] = Verifier.verify_playlist_pinup_media_install(
+                                csv_playlist_id=csv_playlist_id
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=csv_playlists,
+                                build_row=build_playlist_install_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.UNINSTALL:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=bdd_playlists
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve playlists from BDD
+                        def build_playlist_uninstall_row(bdd_playlist):
+                            bdd_playlist_id = bdd_playlist[Constants.BDD_COL_PLAYLIST_ID]
+                            bdd_playlist_name = bdd_playlist[Constants.BDD_COL_PLAYLIST_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_playlist_id):
+                                return None
+
+                            # Retrieve BDD playlist's data
+                            bdd_playlist_version = bdd_playlist[Constants.BDD_COL_PLAYLIST_VERSION]
+
+                            if Verifier.verify_none_value(bdd_playlist_version):
+                                bdd_playlist_version = 'latest'
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_playlist_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = bdd_playlist_name
+                            row[Component.EMULATOR_PLAYLIST.value] = Verifier.verify_none_value(
+                                bdd_playlist_version
+                            )
+                            row[Component.PINUP_MEDIA.value] = Verifier.verify_playlist_pinup_media_uninstall(
+                                bdd_playlist_id=bdd_playlist_id
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=bdd_playlists,
+                                build_row=build_playlist_uninstall_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.EXPORT:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=bdd_playlists
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve playlists from BDD
+                        def build_playlist_export_row(bdd_playlist):
+                            bdd_playlist_id = bdd_playlist[Constants.BDD_COL_PLAYLIST_ID]
+                            bdd_playlist_name = bdd_playlist[Constants.BDD_COL_PLAYLIST_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_playlist_id):
+                                return None
+
+                            # Retrieve BDD playlist's data
+                            bdd_playlist_version = bdd_playlist[Constants.BDD_COL_PLAYLIST_VERSION]
+
+                            if Verifier.verify_none_value(bdd_playlist_version):
+                                bdd_playlist_version = 'latest'
+
+                            # Retrieve CSV Playlist
+                            csv_playlist = ListHelper.select_item(
+                                item_id=bdd_playlist_id,
+                                a_list=csv_playlists,
+                                id_column=Constants.CSV_COL_ID
+                            )
+
+                            # Retrieve BDD playlist's data
+                            csv_playlist_version = csv_playlist.get(
+                                Constants.CSV_COL_VERSION,
+                                None
+                            )
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_playlist_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = bdd_playlist_name
+                            row[Constants.UI_TABLE_KEY_COL_LATEST_VERSION] = Verifier.verify_csv_bdd_version(
+                                csv_version=csv_playlist_version,
+                                bdd_version=bdd_playlist_version
+                            )
+                            row[Component.EMULATOR_PLAYLIST.value] = Verifier.verify_playlist_emulator_export(
+                                bdd_playlist_id=bdd_playlist_id,
+                                bdd_playlist_version=bdd_playlist_version
+                            )
+                            row[Component.PINUP_MEDIA.value] = Verifier.verify_playlist_pinup_media_export(
+                                bdd_playlist_id=bdd_playlist_id,
+                                bdd_playlist_version=bdd_playlist_version
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=bdd_playlists,
+                                build_row=build_playlist_export_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.COPY:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=csv_playlists
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve playlists from CSV
+                        def build_playlist_copy_row(csv_playlist):
+                            csv_playlist_id = csv_playlist[Constants.CSV_COL_ID]
+                            csv_playlist_name = csv_playlist[Constants.CSV_COL_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(csv_playlist_id):
+                                return None
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = csv_playlist_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = csv_playlist_name
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=csv_playlists,
+                                build_row=build_playlist_copy_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.EDIT:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=csv_playlists
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        # Retrieve playlists from CSV
+                        def build_playlist_edit_row(csv_playlist):
+                            csv_playlist_id = csv_playlist[Constants.CSV_COL_ID]
+                            csv_playlist_name = csv_playlist[Constants.CSV_COL_NAME]
+
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(csv_playlist_id):
+                                return None
+
+                            # Retrieve CSV playlist's data
+                            csv_playlist_version = csv_playlist[Constants.CSV_COL_VERSION]
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = csv_playlist_id
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = csv_playlist_name
+                            row[Constants.UI_TABLE_KEY_COL_UNIQUE_VERSION] = Verifier.verify_playlist_version(
+                                csv_playlist_id=csv_playlist_id
+                            )
+                            row[Component.PINUP_MEDIA.value] = Verifier.verify_playlist_pinup_media_edit(
+                                csv_playlist_id=csv_playlist_id,
+                                csv_playlist_version=csv_playlist_version
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=csv_playlists,
+                                build_row=build_playlist_edit_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+            case Category.BDD_TABLES:
+                bdd_tables = session.get_bdd_items()
+
+                match(Context.get_selected_action()):
+                    case Action.INSTALL:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=Constants.PINUP_BDD_TABLES
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        def build_bdd_table_install_row(bdd_table):
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_table):
+                                return None
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_table
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = row[Constants.UI_TABLE_KEY_COL_ID]
+                            row[Component.PINUP_DATABASE.value] = Verifier.verify_bdd_table(
+                                bdd_tables=bdd_tables,
+                                bdd_table=bdd_table
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=Constants.PINUP_BDD_TABLES,
+                                build_row=build_bdd_table_install_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.UNINSTALL:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=Constants.PINUP_BDD_TABLES
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        def build_bdd_table_uninstall_row(bdd_table):
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_table):
+                                return None
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_table
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = row[Constants.UI_TABLE_KEY_COL_ID]
+                            row[Component.PINUP_DATABASE.value] = not Verifier.verify_bdd_table(
+                                bdd_tables=bdd_tables,
+                                bdd_table=bdd_table
+                            )
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=Constants.PINUP_BDD_TABLES,
+                                build_row=build_bdd_table_uninstall_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+                    case Action.EXPORT:
+
+                        # Initialize progress bar
+                        item_total_counter = self.__count_items_to_refresh(
+                            items=Constants.PINUP_BDD_TABLES
+                        )
+                        self.__progress.set_maximum(
+                            maximum=item_total_counter
+                        )
+
+                        def build_bdd_table_export_row(bdd_table):
+                            # Ignore item to refresh if requested
+                            if not self.__is_item_to_refresh(bdd_table):
+                                return None
+
+                            # Build row
+                            row = {}
+                            row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                            row[Constants.UI_TABLE_KEY_COL_ID] = bdd_table
+                            row[Constants.UI_TABLE_KEY_COL_NAME] = row[Constants.UI_TABLE_KEY_COL_ID]
+                            row[Component.PINUP_DATABASE.value] = True
+
+                            # Retrieve color
+                            row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                                row=row
+                            )
+
+                            return row
+
+                        rows = self.__build_rows(
+                            RefreshRows(
+                                items=Constants.PINUP_BDD_TABLES,
+                                build_row=build_bdd_table_export_row
+                            )
+                        )
+
+                        # Interrupt process if requested
+                        if rows is None:
+                            return None
+
+                        table_top_rows.extend(rows)
+
+            case Category.CONFIGS:
+                # Create the configs directory if it doesn't exist
+                if not os.path.exists(Context.get_configs_path()):
+                    os.makedirs(Context.get_configs_path())
+
+                _, folders = FileHelper.list_files_and_folders(
+                    folder_path=Context.get_configs_path()
+                )
+
+                # Initialize progress bar
+                item_total_counter = self.__count_items_to_refresh(
+                    items=folders
+                )
+                self.__progress.set_maximum(
+                    maximum=item_total_counter
+                )
+
+                def build_config_row(config):
+                    # Ignore item to refresh if requested
+                    if not self.__is_item_to_refresh(config):
+                        return None
+
+                    # Build row
+                    row = {}
+                    row[Constants.UI_TABLE_KEY_COL_SELECTION] = False
+                    row[Constants.UI_TABLE_KEY_COL_ID] = config
+                    row[Constants.UI_TABLE_KEY_COL_NAME] = config
+
+                    match(Context.get_selected_action()):
+                        case Action.INSTALL:
+                            row[Component.FILES.value] = Verifier.verify_config_files_install(
+                                config=config
+                            )
+                            row[Component.REGISTRY.value] = Verifier.verify_config_registry_install(
+                                config=config
+                            )
+
+                        case Action.UNINSTALL:
+                            row[Component.FILES.value] = Verifier.verify_config_files_uninstall(
+                                config=config
+                            )
+                            row[Component.REGISTRY.value] = Verifier.verify_config_registry_uninstall(
+                                config=config
+                            )
+
+                        case Action.EXPORT:
+                            row[Component.FILES.value] = Verifier.verify_config_files_export(
+                                config=config
+                            )
+                            row[Component.REGISTRY.value] = Verifier.verify_config_registry_export(
+                                config=config
+                            )
+
+                        case Action.EDIT:
+                            row[Component.FILES.value] = Verifier.verify_config_files_edit(
+                                config=config
+                            )
+                            row[Component.REGISTRY.value] = Verifier.verify_config_registry_edit(
+                                config=config
+                            )
+
+                    # Retrieve color
+                    row[Constants.UI_TABLE_KEY_COLOR] = Verifier.retrieve_verified_row_color(
+                        row=row
+                    )
+
+                    return row
+
+                rows = self.__build_rows(
+                    RefreshRows(
+                        items=folders,
+                        build_row=build_config_row
+                    )
+                )
+
+                # Interrupt process if requested
+                if rows is None:
+                    return None
+
+                table_top_rows.extend(rows)
+
+        # Create refresh file path if missing
+        refresh_file_path = Context.get_selected_rows_csv_path()
+        refresh_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # If with only ids, add rows not refreshed from CSV rows
+        if self.__is_with_only_ids():
+            for row in CsvHelper.read_data(
+                file_path=refresh_file_path,
+            ):
+                if self.__is_item_to_refresh(
+                    item_id=row[Constants.UI_TABLE_KEY_COL_ID]
+                ):
+                    continue
+
+                table_top_rows.append(row)
+
+        # Sort rows depending on UI_TABLE_KEY_COLOR (desc) and Constants.UI_TABLE_KEY_COL_NAME (asc)
+        sorted_rows = sorted(
+            table_top_rows,
+            key=lambda x: (-ord(
+                x[Constants.UI_TABLE_KEY_COLOR][0]),
+                x[Constants.UI_TABLE_KEY_COL_NAME]
+            )
+        )
+
+        # Write data in a CSV file
+        csv_rows = []
+        for row in sorted_rows:
+            csv_row = {}
+            for key, value in row.items():
+                if isinstance(value, bool):
+                    if value:
+                        csv_row[key] = Constants.CSV_YES_VALUE
+                    else:
+                        csv_row[key] = Constants.CSV_NO_VALUE
+                else:
+                    csv_row[key] = value
+            csv_rows.append(csv_row)
+
+        # Write data in a CSV file, without waiting for it
+        RefreshBuilder.__rows_writing_thread = threading.Thread(
+            target=CsvHelper.write_data,
+            kwargs={
+                'file_path': refresh_file_path,
+                'data': csv_rows,
+                'sort_column_id': ''
+            }
+        )
+        RefreshBuilder.__rows_writing_thread.start()
+
+        # Finish progression
+        if item_total_counter > 0:
+            self.__progress.set_value(item_total_counter)
+        else:
+            self.__progress.set_maximum(1)
+            self.__progress.set_value(1)
+        self.__progress.set_text(
+            text=Context.get_text('refresh_finished')
+        )
+
+        return sorted_rows
+
+    def __build_rows(
+        self,
+        refresh_rows: RefreshRows
+    ):
+        """
+        Build rows of items in parallel, keeping items' order.
+
+        :return: Rows built, None if interruption requested
+        """
+
+        # Retrieve fingerprints and rows of the previous refresh
+        fingerprints_file_path = Context.get_selected_fingerprints_csv_path()
+        previous_fingerprints = {}
+        previous_rows = {}
+        if refresh_rows.is_fingerprinted():
+            previous_fingerprints = FingerprintHelper.read_fingerprints(
+                file_path=fingerprints_file_path
+            )
+
+            # Targeted refreshes always verify items again
+            if not self.__is_with_only_ids():
+                previous_rows = {
+                    row[Constants.UI_TABLE_KEY_COL_ID]: row
+                    for row in CsvHelper.read_data(
+                        file_path=Context.get_selected_rows_csv_path()
+                    )
+                }
+        fingerprints = {}
+
+        def fingerprint_if_not_interrupted(item):
+            if self.__interruption_requested or not refresh_rows.is_fingerprinted():
+                return None
+
+            item_id = refresh_rows.get_item_id(item)
+            if not self.__is_item_to_refresh(item_id):
+                return None
+
+            return refresh_rows.get_fingerprint(item_id)
+
+        def is_row_reused(item, fingerprint):
+            if not refresh_rows.is_fingerprinted():
+                return False
+
+            # Reuse previous row if nothing changed since
+            item_id = refresh_rows.get_item_id(item)
+            return item_id in previous_rows and \
+                previous_fingerprints.get(item_id, None) == fingerprint
+
+        def build_row_if_not_interrupted(item, fingerprint):
+            if self.__interruption_requested:
+                return None
+
+            if not refresh_rows.is_fingerprinted():
+                return refresh_rows.build_row(item)
+
+            item_id = refresh_rows.get_item_id(item)
+            if not self.__is_item_to_refresh(item_id):
+                return None
+
+            if is_row_reused(item, fingerprint):
+                row = previous_rows[item_id]
+            else:
+                row = refresh_rows.build_row(item)
+
+            if row is not None:
+                fingerprints[item_id] = fingerprint
+
+            return row
+
+        items = refresh_rows.list_items()
+        item_total_counter = self.__count_items_to_refresh(
+            items=items
+        )
+        workers = refresh_rows.get_workers()
+        if workers is None:
+            workers = Context.get_refresh_workers()
+
+        rows = []
+        item_current_counter = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            items_fingerprints = list(executor.map(fingerprint_if_not_interrupted, items))
+
+            # Interrupt process if requested
+            if self.__interruption_requested:
+                return None
+
+            # Verify at once the items whose rows are not reused
+            refresh_rows.verify_items([
+                item
+                for item, fingerprint in zip(items, items_fingerprints)
+                if not refresh_rows.is_fingerprinted() or
+                (fingerprint is not None and not is_row_reused(item, fingerprint))
+            ])
+
+            for row in executor.map(build_row_if_not_interrupted, items, items_fingerprints):
+
+                # Interrupt process if requested
+                if self.__interruption_requested:
+                    executor.shutdown(cancel_futures=True)
+                    return None
+
+                if row is None:
+                    continue
+
+                # Increment progress bar
+                item_current_counter += 1
+                self.__progress.set_value(item_current_counter)
+                self.__progress.set_text(
+                    text=Context.get_text(
+                        'refresh_in_progress',
+                        item_name=row[Constants.UI_TABLE_KEY_COL_NAME],
+                        item_current_counter=item_current_counter,
+                        item_total_counter=item_total_counter
+                    )
+                )
+
+                rows.append(row)
+
+                # Stream row
+                if self.__on_row is not None:
+                    self.__on_row(row)
+
+        # Write fingerprints, keeping the ones of items not refreshed
+        if refresh_rows.is_fingerprinted():
+            if self.__is_with_only_ids():
+                previous_fingerprints.update(fingerprints)
+                fingerprints = previous_fingerprints
+            FingerprintHelper.write_fingerprints(
+                file_path=fingerprints_file_path,
+                fingerprints=fingerprints
+            )
+
+        return rows
+
+    def __is_with_only_ids(
+        self
+    ):
+        """Specify if with only ids"""
+
+        return self.__only_ids is not None and \
+            len(self.__only_ids) > 0
+
+    def __is_item_to_refresh(
+        self,
+        item_id: str
+    ):
+        """Specify if the id has to be refreshed"""
+
+        if self.__is_with_only_ids():
+            return item_id in self.__only_ids
+
+        return True
+
+    def __count_items_to_refresh(
+        self,
+        items: list
+    ):
+        """Count how many items to refresh"""
+
+        if self.__is_with_only_ids():
+            return len(self.__only_ids)
+
+        return len(items)
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""Refresh Rows"""
+
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-positional-arguments
+
+
+class RefreshRows:
+    """
+    Class to describe how a refresh builds the rows of its items.
+
+    The function to build a row returns None for an item not to refresh. If a
+    function to get the fingerprint of an item id is specified, rows of items
+    with the same fingerprint as the previous refresh are reused. If a
+    function to verify items is specified, the items whose rows are built
+    are verified at once before their rows are built.
+    """
+
+    def __init__(
+        self,
+        items: list,
+        build_row: any,
+        id_column: str = None,
+        get_fingerprint: any = None,
+        verify_items: any = None,
+        workers: int = None
+    ):
+        """Initialize rows to build"""
+
+        self.__items = items
+        self.__build_row = build_row
+        self.__id_column = id_column
+        self.__get_fingerprint = get_fingerprint
+        self.__verify_items = verify_items
+        self.__workers = workers
+
+    def list_items(self) -> list:
+        """List items to build rows for"""
+
+        return self.__items
+
+    def build_row(
+        self,
+        item
+    ) -> dict:
+        """Build the row of an item, None if not to refresh"""
+
+        return self.__build_row(item)
+
+    def get_item_id(
+        self,
+        item
+    ) -> str:
+        """Get the id of an item"""
+
+        return item[self.__id_column]
+
+    def is_fingerprinted(self) -> bool:
+        """Specify if rows are reused while the fingerprints of their items are unchanged"""
+
+        return self.__get_fingerprint is not None
+
+    def get_fingerprint(
+        self,
+        item_id: str
+    ) -> str:
+        """Get the fingerprint of an item"""
+
+        return self.__get_fingerprint(item_id)
+
+    def verify_items(
+        self,
+        items: list
+    ):
+        """Verify at once the items whose rows are built"""
+
+        if self.__verify_items is not None:
+            self.__verify_items(items)
+
+    def get_workers(self) -> int:
+        """Get how many workers build rows, None for the default"""
+
+        return self.__workers
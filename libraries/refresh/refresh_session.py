@@ -0,0 +1,314 @@
+#!/usr/bin/python3
+"""Refresh Session"""
+
+import os
+import threading
+import time
+
+from libraries.bdd.bdd_helper import BddHelper
+from libraries.constants.constants import Category, Constants
+from libraries.context.context import Context
+from libraries.csv.csv_helper import CsvHelper
+from libraries.file.file_helper import FileHelper
+from libraries.fingerprint.fingerprint_helper import FingerprintHelper
+from libraries.verifier.batch_verifier import BatchVerifier
+from libraries.verifier.verifier import Verifier
+from libraries.xml.xml_index import XmlIndex
+
+
+class RefreshSession:
+    """
+    Class to share scan results between refreshes of a category.
+
+    CSV and BDD data, folders indexes and the registry are read once and
+    reused by the refreshes of every action during a short time.
+    """
+
+    # Sessions by (category, emulator)
+    __sessions = {}
+    __sessions_lock = threading.Lock()
+
+    def __init__(
+        self,
+        category: Category,
+        emulator
+    ):
+        """Initialize session"""
+
+        self.__category = category
+        self.__emulator = emulator
+        self.__creation_time = time.monotonic()
+        self.__lock = threading.Lock()
+        self.__batch_verifier = None
+
+        # Data read once by the refreshes, by name
+        self.__data = {}
+
+    @staticmethod
+    def get():
+        """Get the session of the selected category, a new one if expired"""
+
+        category = Context.get_selected_category()
+        emulator = None
+        if category == Category.TABLES:
+            emulator = Context.get_selected_emulator()
+
+        with RefreshSession.__sessions_lock:
+            session = RefreshSession.__sessions.get((category, emulator), None)
+            if session is None or session.is_expired():
+                session = RefreshSession(
+                    category=category,
+                    emulator=emulator
+                )
+                RefreshSession.__sessions[(category, emulator)] = session
+
+            return session
+
+    @staticmethod
+    def invalidate():
+        """Invalidate all sessions, to call after modifications"""
+
+        with RefreshSession.__sessions_lock:
+            RefreshSession.__sessions.clear()
+
+    def is_expired(self) -> bool:
+        """Specify if the session is expired"""
+
+        return time.monotonic() - self.__creation_time > Constants.REFRESH_SESSION_TTL
+
+    def get_csv_items(self) -> list:
+        """Get items of the CSV"""
+
+        with self.__lock:
+            if 'csv_items' not in self.__data:
+                self.__data['csv_items'] = CsvHelper.read_data(
+                    file_path=Context.get_csv_path()
+                )
+
+            return self.__data['csv_items']
+
+    def get_bdd_items(self) -> list:
+        """Get items of the BDD"""
+
+        with self.__lock:
+            if 'bdd_items' not in self.__data:
+                match(self.__category):
+                    case Category.TABLES:
+                        bdd_items = BddHelper.list_tables(
+                            bdd_file_path=Context.get_pinup_bdd_path(),
+                            emulator=self.__emulator
+                        )
+                    case Category.PLAYLISTS:
+                        bdd_items = BddHelper.list_playlists(
+                            bdd_file_path=Context.get_pinup_bdd_path()
+                        )
+                    case Category.BDD_TABLES:
+                        bdd_items = BddHelper.list_bdd_tables(
+                            bdd_file_path=Context.get_pinup_bdd_path()
+                        )
+                    case _:
+                        bdd_items = []
+                self.__data['bdd_items'] = bdd_items
+
+            return self.__data['bdd_items']
+
+    def get_batch_verifier(self) -> BatchVerifier:
+        """Get batch verifier, keeping its folders indexes"""
+
+        with self.__lock:
+            if self.__batch_verifier is None:
+                self.__batch_verifier = BatchVerifier()
+
+            return self.__batch_verifier
+
+    def __get_tables_by_id(self) -> tuple:
+        """Get CSV and BDD tables by id"""
+
+        csv_tables = self.get_csv_items()
+        bdd_tables = self.get_bdd_items()
+
+        with self.__lock:
+            if 'tables_by_id' not in self.__data:
+                self.__data['tables_by_id'] = (
+                    {
+                        csv_table[Constants.CSV_COL_ID]: csv_table
+                        for csv_table in csv_tables
+                    },
+                    {
+                        bdd_table[Constants.BDD_COL_TABLE_ID]: bdd_table
+                        for bdd_table in bdd_tables
+                    }
+                )
+
+            return self.__data['tables_by_id']
+
+    @staticmethod
+    def __list_values(
+        *values
+    ) -> list:
+        """List distinct values, sorted and without the none values"""
+
+        return sorted(set(
+            str(value)
+            for value in values
+            if not Verifier.verify_none_value(value)
+        ))
+
+    def __get_rom_xml_config(
+        self,
+        rom: str
+    ) -> list:
+        """Get lines of the XML config of a ROM in the emulator, None if not found"""
+
+        xml_file_path = os.path.join(
+            Context.get_emulator_path(
+                self.__emulator
+            ),
+            'Tables',
+            'B2STableSettings.xml'
+        )
+        if not os.path.isfile(xml_file_path):
+            return None
+
+        return XmlIndex.get(
+            xml_file_path=xml_file_path
+        ).get_tag_lines(
+            tag=rom
+        )
+
+    def get_table_fingerprint(
+        self,
+        table_id: str
+    ) -> str:
+        """
+        Get the fingerprint of a table.
+
+        It covers CSV and BDD tables' data, the modification times of the
+        table's folders, and what its verifications read in the installation:
+        the sizes of its installed files, the registry values and the XML
+        config of its ROMs. Modifications of other tables don't change it.
+        """
+
+        csv_tables_by_id, bdd_tables_by_id = self.__get_tables_by_id()
+        csv_table = csv_tables_by_id.get(table_id, {})
+        bdd_table = bdd_tables_by_id.get(table_id, {})
+
+        table_folder_path = os.path.join(
+            Context.get_working_path(),
+            'tables',
+            self.__emulator.value,
+            table_id
+        )
+        table_versions = []
+        if os.path.isdir(table_folder_path):
+            _, table_versions = FileHelper.list_files_and_folders(
+                folder_path=table_folder_path
+            )
+
+        # ROMs and PUP videos folders of the table in CSV and in BDD, as verified by the actions
+        roms = RefreshSession.__list_values(
+            csv_table.get(Constants.CSV_COL_ROM, None),
+            bdd_table.get(Constants.BDD_COL_TABLE_ROM, None)
+        )
+        videos_paths = RefreshSession.__list_values(
+            csv_table.get(Constants.CSV_COL_VIDEOS_PATH, None),
+            bdd_table.get(Constants.BDD_COL_VIDEOS_PATH, None)
+        )
+
+        batch_verifier = self.get_batch_verifier()
+        return FingerprintHelper.compute_fingerprint(
+            Context.get_app_version(),
+            csv_table,
+            bdd_table,
+            FingerprintHelper.get_folder_mtimes(
+                folder_path=table_folder_path
+            ),
+            sorted(batch_verifier.list_table_installed_sizes(
+                table_id=table_id,
+                table_versions=table_versions,
+                table_roms=roms,
+                table_videos_paths=videos_paths
+            ).items()),
+            [
+                (
+                    rom,
+                    batch_verifier.get_rom_registry_values(
+                        rom=rom
+                    ),
+                    self.__get_rom_xml_config(
+                        rom=rom
+                    )
+                )
+                for rom in roms
+            ]
+        )
+
+    def list_changed_table_ids(
+        self,
+        changed_paths: list
+    ) -> list:
+        """
+        List ids of the tables concerned by changed paths, None if not only tables are concerned.
+
+        A path is mapped to a table by its folder in working tables, or by the
+        table id starting its name, or by a ROM or a PUP videos folder of the
+        table in its path (as the files read by the verifications).
+        """
+
+        if self.__category != Category.TABLES:
+            return None
+
+        tables_folder_path = os.path.normcase(os.path.join(
+            Context.get_working_path(),
+            'tables',
+            self.__emulator.value
+        ))
+        data_paths = [
+            os.path.normcase(str(Context.get_csv_path())),
+            os.path.normcase(str(Context.get_pinup_bdd_path()))
+        ]
+
+        # Tables ids by ROM and PUP videos folder
+        csv_tables_by_id, bdd_tables_by_id = self.__get_tables_by_id()
+        tables_ids_by_name = {}
+        for table_id in csv_tables_by_id.keys() | bdd_tables_by_id.keys():
+            csv_table = csv_tables_by_id.get(table_id, {})
+            bdd_table = bdd_tables_by_id.get(table_id, {})
+            for name in RefreshSession.__list_values(
+                csv_table.get(Constants.CSV_COL_ROM, None),
+                bdd_table.get(Constants.BDD_COL_TABLE_ROM, None),
+                csv_table.get(Constants.CSV_COL_VIDEOS_PATH, None),
+                bdd_table.get(Constants.BDD_COL_VIDEOS_PATH, None)
+            ):
+                tables_ids_by_name.setdefault(
+                    os.path.normcase(os.path.basename(os.path.normpath(name))),
+                    set()
+                ).add(table_id)
+
+        changed_tables_ids = set()
+        for changed_path in changed_paths:
+            changed_path = os.path.normcase(os.path.normpath(changed_path))
+            if changed_path in data_paths:
+                return None
+
+            # Folder of a table in working tables
+            if changed_path.startswith(tables_folder_path + os.sep):
+                changed_tables_ids.add(
+                    os.path.relpath(changed_path, tables_folder_path).split(os.sep)[0]
+                )
+                continue
+
+            # Tables named by the file, or by a folder or a file of the path
+            file_name = os.path.basename(changed_path)
+            path_tables_ids = {
+                table_id
+                for table_id in csv_tables_by_id.keys() | bdd_tables_by_id.keys()
+                if file_name.startswith(os.path.normcase(table_id))
+            }
+            for name in changed_path.split(os.sep) + [os.path.splitext(file_name)[0]]:
+                path_tables_ids.update(tables_ids_by_name.get(name, set()))
+            if len(path_tables_ids) == 0:
+                return None
+            changed_tables_ids.update(path_tables_ids)
+
+        return sorted(changed_tables_ids)
@@ -0,0 +1,273 @@
+#!/usr/bin/python3
+"""Refresh Watcher"""
+
+import os
+import threading
+import time
+
+from libraries.constants.constants import Constants, Emulator
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.fingerprint.fingerprint_helper import FingerprintHelper
+
+
+class RefreshWatcher:
+    """
+    Class to watch the folders read by refreshes.
+
+    Folders are listed once, then only their modification times are read
+    periodically in a thread: adding, deleting or replacing a file changes
+    the modification time of its folder, so only the modified folders are
+    listed again to find the changed paths. A file modified in place doesn't
+    change its folder, so all folders are listed again from time to time.
+    Changes made by the application itself are ignored, watching is paused
+    while it writes.
+    """
+
+    # Working folders written by the application itself
+    __IGNORED_WORKING_FOLDERS = [
+        'cache',
+        'logs',
+        Constants.STORE_FOLDER_NAME
+    ]
+
+    # Pauses of the watchers, changed at each pause and resume
+    __pauses_count = 0
+    __pauses_generation = 0
+    __pauses_lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize watcher"""
+
+        self.__snapshot = None
+        self.__last_change_time = 0
+        self.__changed_paths = []
+        self.__changed_paths_lock = threading.Lock()
+        self.__stop_requested = threading.Event()
+        self.__thread = None
+
+    @staticmethod
+    def pause():
+        """Pause watching while the application writes in watched folders"""
+
+        with RefreshWatcher.__pauses_lock:
+            RefreshWatcher.__pauses_count += 1
+            RefreshWatcher.__pauses_generation += 1
+
+    @staticmethod
+    def resume():
+        """Resume watching, ignoring the changes made while paused"""
+
+        with RefreshWatcher.__pauses_lock:
+            RefreshWatcher.__pauses_count -= 1
+            RefreshWatcher.__pauses_generation += 1
+
+    @staticmethod
+    def __get_pauses_generation() -> int:
+        """Get the generation of the pauses, None if paused"""
+
+        with RefreshWatcher.__pauses_lock:
+            if RefreshWatcher.__pauses_count > 0:
+                return None
+
+            return RefreshWatcher.__pauses_generation
+
+    def start(self):
+        """Start watching in a thread"""
+
+        if self.is_started():
+            return
+
+        # A stopped thread may still be waiting its event
+        self.__snapshot = None
+        self.__stop_requested = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__watch,
+            args=(self.__stop_requested,),
+            daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        """Stop watching"""
+
+        self.__stop_requested.set()
+        self.__thread = None
+
+    def is_started(self) -> bool:
+        """Specify if the watcher is started"""
+
+        return self.__thread is not None
+
+    def pop_changed_paths(self) -> list:
+        """Get the paths changed since the last call"""
+
+        with self.__changed_paths_lock:
+            changed_paths = self.__changed_paths
+            self.__changed_paths = []
+
+        return changed_paths
+
+    def get_last_change_time(self) -> float:
+        """Get the time of the last change detected, 0 if none"""
+
+        return self.__last_change_time
+
+    def __watch(
+        self,
+        stop_requested: threading.Event
+    ):
+        """Scan folders until stop requested"""
+
+        scans_count = 0
+        while True:
+            generation = RefreshWatcher.__get_pauses_generation()
+            if generation is not None:
+                previous_generation, previous_folders = (None, {}) \
+                    if self.__snapshot is None else self.__snapshot
+                scans_count += 1
+                folders, changed_paths = RefreshWatcher.__scan(
+                    previous_folders=previous_folders,
+                    full=scans_count % Constants.REFRESH_WATCH_FULL_SCAN_COUNT == 0
+                )
+
+                # Changes are ignored if the application wrote since the previous scan
+                if generation == previous_generation and \
+                        generation == RefreshWatcher.__get_pauses_generation() and \
+                        len(changed_paths) > 0:
+                    self.__last_change_time = time.time()
+                    with self.__changed_paths_lock:
+                        self.__changed_paths.extend(changed_paths)
+                self.__snapshot = (generation, folders)
+
+            if stop_requested.wait(Constants.REFRESH_WATCH_INTERVAL):
+                return
+
+    @staticmethod
+    def __list_watched_paths() -> list:
+        """List paths of folders and files read by refreshes"""
+
+        watched_paths = []
+
+        # Working folders, except the ones written by refreshes
+        _, folders = FileHelper.list_files_and_folders(
+            folder_path=Context.get_working_path()
+        )
+        for folder in folders:
+            if folder in RefreshWatcher.__IGNORED_WORKING_FOLDERS:
+                continue
+            watched_paths.append(
+                os.path.join(Context.get_working_path(), folder)
+            )
+
+        # PinUP folders and database
+        if Context.get_pinup_path():
+            watched_paths.append(
+                os.path.join(Context.get_pinup_path(), 'POPMedia')
+            )
+            watched_paths.append(
+                os.path.join(Context.get_pinup_path(), 'PUPVideos')
+            )
+            watched_paths.append(
+                Context.get_pinup_bdd_path()
+            )
+
+        # Emulators folders
+        for emulator in Emulator:
+            if emulator.value in Context.list_available_emulators() and \
+                    Context.get_emulator_path(emulator):
+                watched_paths.append(
+                    Context.get_emulator_path(emulator)
+                )
+
+        return [str(watched_path) for watched_path in watched_paths]
+
+    @staticmethod
+    def __list_folder(
+        folder_path: str
+    ) -> tuple:
+        """
+        List the files of a folder with their size and modification time, and its sub folders.
+
+        Files are read with the listing (without more access to the disk on
+        Windows), so a file replaced in a modified folder is detected too.
+        """
+
+        files = {}
+        sub_folders = set()
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        sub_folders.add(entry.name)
+                    else:
+                        entry_stat = entry.stat()
+                        files[entry.name] = (entry_stat.st_size, entry_stat.st_mtime_ns)
+        except OSError:
+            pass
+
+        return files, sub_folders
+
+    @staticmethod
+    def __scan(
+        previous_folders: dict,
+        full: bool
+    ) -> tuple:
+        """
+        Scan watched paths, listing again all folders if full, else only the modified ones.
+
+        :return: Modification time, files and sub folders by folder path, and changed paths
+        """
+
+        folders = {}
+        changed_paths = []
+        folders_paths = []
+        for watched_path in RefreshWatcher.__list_watched_paths():
+            if os.path.isdir(watched_path):
+                folders_paths.append(watched_path)
+                continue
+
+            # Watched file
+            folders[watched_path] = (
+                FingerprintHelper.get_path_mtime(
+                    path=watched_path
+                ),
+                {},
+                set()
+            )
+            previous_folder = previous_folders.get(watched_path, None)
+            if previous_folder is not None and previous_folder[0] != folders[watched_path][0]:
+                changed_paths.append(watched_path)
+
+        while len(folders_paths) > 0:
+            folder_path = folders_paths.pop()
+            mtime = FingerprintHelper.get_path_mtime(
+                path=folder_path
+            )
+            folder = previous_folders.get(folder_path, None)
+            if full or folder is None or folder[0] != mtime:
+                files, sub_folders = RefreshWatcher.__list_folder(
+                    folder_path=folder_path
+                )
+
+                # Files added, deleted or replaced and sub folders added or deleted
+                if folder is not None:
+                    changed_paths.extend(
+                        os.path.join(folder_path, name)
+                        for name in sorted(
+                            {
+                                name
+                                for name in files.keys() | folder[1].keys()
+                                if files.get(name, None) != folder[1].get(name, None)
+                            } | (sub_folders ^ folder[2])
+                        )
+                    )
+                folder = (mtime, files, sub_folders)
+
+            folders[folder_path] = folder
+            folders_paths.extend(
+                os.path.join(folder_path, sub_folder)
+                for sub_folder in folder[2]
+            )
+
+        return folders, changed_paths
@@ -0,0 +1,383 @@
+#!/usr/bin/python3
+"""Script Helper"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import os
+import re
+import struct
+import threading
+
+from libraries.cmd.cmd_helper import CmdHelper
+from libraries.compound.compound_file import CompoundFile
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.csv.csv_helper import CsvHelper
+from libraries.file.file_helper import FileHelper
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class ScriptHelper:
+    """
+    Class to help usage of the scripts of Visual Pinball X tables.
+
+    Metadata extracted from a script (ROM and PUP pack names) is cached by the
+    size, the modification time and the hash of its table file, with a copy of
+    the script, so the emulator is launched and the script is scanned only
+    once for the same table file.
+    """
+
+    # Metadata by table file path, and by hash of table file for copies of the same file
+    __metadata_by_path = {}
+    __metadata_by_hash = {}
+    __metadata_loaded = False
+    __metadata_modified = False
+    __metadata_lock = threading.Lock()
+
+    # Extractions running in parallel of the copies of files
+    __extraction_executor = None
+
+    @staticmethod
+    def __get_metadata_file_path() -> str:
+        """Get path of the file caching metadata"""
+
+        return os.path.join(
+            Context.get_cache_path(),
+            Constants.SCRIPT_METADATA_FILE_NAME
+        )
+
+    @staticmethod
+    def __get_cached_script_path(
+        script_hash: str
+    ) -> str:
+        """Get path of the cached copy of a script from its hash"""
+
+        return os.path.join(
+            Context.get_cache_path(),
+            Constants.SCRIPT_CACHE_FOLDER_NAME,
+            f'{script_hash}.vbs'
+        )
+
+    @staticmethod
+    def __load_metadata():
+        """Load cached metadata if not already loaded (called with the lock)"""
+
+        if ScriptHelper.__metadata_loaded:
+            return
+
+        for row in CsvHelper.read_data(
+            file_path=ScriptHelper.__get_metadata_file_path()
+        ):
+            ScriptHelper.__metadata_by_path[row[Constants.SCRIPT_METADATA_COL_FILE]] = row
+            ScriptHelper.__metadata_by_hash[row[Constants.SCRIPT_METADATA_COL_HASH]] = row
+        ScriptHelper.__metadata_loaded = True
+
+    @staticmethod
+    def __get_cached_metadata(
+        table_file_path: str,
+        table_file_size: str,
+        table_file_mtime: str
+    ) -> tuple:
+        """Get cached metadata of a table file (None if not cached) and the hash of the file"""
+
+        with ScriptHelper.__metadata_lock:
+            ScriptHelper.__load_metadata()
+            cached_metadata = ScriptHelper.__metadata_by_path.get(table_file_path, None)
+
+        # Hash is computed only if the file changed
+        if cached_metadata is not None and (
+            cached_metadata[Constants.SCRIPT_METADATA_COL_SIZE],
+            cached_metadata[Constants.SCRIPT_METADATA_COL_MTIME]
+        ) == (table_file_size, table_file_mtime):
+            table_file_hash = cached_metadata[Constants.SCRIPT_METADATA_COL_HASH]
+        else:
+            table_file_hash = FileHelper.compute_file_hash(
+                file_path=table_file_path
+            )
+
+        with ScriptHelper.__metadata_lock:
+            return (
+                ScriptHelper.__metadata_by_hash.get(table_file_hash, None),
+                table_file_hash
+            )
+
+    @staticmethod
+    def __get_value(
+        value: str
+    ) -> str:
+        """Get a cached value, None if written empty in CSV (or as None by previous versions)"""
+
+        if value is None or value in ['', 'None']:
+            return None
+
+        return value
+
+    @staticmethod
+    def __extract_metadata(
+        script_content: str
+    ) -> tuple:
+        """Extract ROM and PUP pack names from the content of a script"""
+
+        # Extract cPuPPack
+        pup_pack = None
+        match_cpuppack = re.search(
+            r'cPuPPack\s*=\s*"\s*([^"]+)\s*"',
+            script_content
+        )
+        if match_cpuppack:
+            pup_pack = match_cpuppack.group(1)
+
+        # Extract cGameName
+        rom = None
+        match_cgamename = re.search(
+            r'cGameName\s*=\s*"\s*([^"]+)\s*"',
+            script_content
+        )
+        if match_cgamename:
+            rom = match_cgamename.group(1)
+
+        return rom, pup_pack
+
+    @staticmethod
+    def __read_game_data_script(
+        game_data: bytes
+    ) -> bytes:
+        """Read the script from the records of the game data, None if not found"""
+
+        # Records of size (tag included), tag and data, the script follows its tag with its size
+        position = 0
+        while position + 8 <= len(game_data):
+            record_size, tag = struct.unpack_from('<i4s', game_data, position)
+            position += 4
+            if tag == b'CODE':
+                script_size = struct.unpack_from('<i', game_data, position + 4)[0]
+                return game_data[position + 8:position + 8 + script_size]
+            if tag == b'ENDB' or record_size < 4:
+                break
+            position += record_size
+
+        return None
+
+    @staticmethod
+    def read_table_script(
+        table_file_path: str
+    ) -> str:
+        """Read the script of a VPX table file without the emulator, None if not read"""
+
+        try:
+            with CompoundFile(
+                file_path=table_file_path
+            ) as compound_file:
+                if not compound_file.is_stream(Constants.VPX_GAME_DATA_STREAM):
+                    return None
+                script = ScriptHelper.__read_game_data_script(
+                    game_data=compound_file.read_stream(
+                        Constants.VPX_GAME_DATA_STREAM
+                    )
+                )
+        except Exception as exc:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_table_script_not_read',
+                    file=str(table_file_path),
+                    error=str(exc)
+                )
+            )
+            return None
+
+        if script is None:
+            return None
+
+        # Old tables are encoded in latin-1
+        try:
+            return script.decode('UTF-8')
+        except UnicodeDecodeError:
+            return script.decode('latin-1')
+
+    @staticmethod
+    def read_table_info(
+        table_file_path: str
+    ) -> dict:
+        """Read name, author and version of a VPX table file, by info stream name"""
+
+        table_info = {}
+        with CompoundFile(
+            file_path=table_file_path
+        ) as compound_file:
+            for stream_name in Constants.VPX_TABLE_INFO_STREAMS:
+                stream_path = f'{Constants.VPX_TABLE_INFO_STORAGE}/{stream_name}'
+                if compound_file.is_stream(stream_path):
+                    table_info[stream_name] = compound_file.read_stream(
+                        stream_path
+                    ).decode('utf-16-le', errors='replace').rstrip('\x00')
+                else:
+                    table_info[stream_name] = None
+
+        return table_info
+
+    @staticmethod
+    def get_metadata(
+        table_file_path: str,
+        script_file_path: str,
+        extract_cmd: str,
+        force_extraction: bool = False
+    ) -> tuple:
+        """
+        Get ROM and PUP pack names from the script of a table file.
+
+        The script is extracted beside the table file if missing or forced
+        (table file copied), except if cached for the same table file. It is
+        read from the table file, the emulator is only launched if it can't be.
+
+        :return: ROM and PUP pack names (None if not found)
+        """
+
+        table_file_key = os.path.normcase(os.path.abspath(table_file_path))
+        table_file_stat = os.stat(table_file_path)
+        table_file_size = str(table_file_stat.st_size)
+        table_file_mtime = str(table_file_stat.st_mtime_ns)
+
+        metadata, table_file_hash = ScriptHelper.__get_cached_metadata(
+            table_file_path=table_file_key,
+            table_file_size=table_file_size,
+            table_file_mtime=table_file_mtime
+        )
+
+        # Restore the script from its cached copy if missing or forced (table file copied)
+        if metadata is not None and (force_extraction or not os.path.exists(script_file_path)):
+            cached_script_path = ScriptHelper.__get_cached_script_path(
+                script_hash=metadata[Constants.SCRIPT_METADATA_COL_SCRIPT_HASH]
+            )
+            if os.path.exists(cached_script_path):
+                FileHelper.copy_file(
+                    source_file_path=cached_script_path,
+                    destination_file_path=script_file_path
+                )
+            else:
+                metadata = None
+
+        if metadata is not None:
+            with ScriptHelper.__metadata_lock:
+                ScriptHelper.__remember_path(
+                    metadata=metadata,
+                    table_file_path=table_file_key,
+                    table_file_size=table_file_size,
+                    table_file_mtime=table_file_mtime
+                )
+            return (
+                ScriptHelper.__get_value(metadata[Constants.SCRIPT_METADATA_COL_ROM]),
+                ScriptHelper.__get_value(metadata[Constants.SCRIPT_METADATA_COL_PUP_PACK])
+            )
+
+        # Extract the script, with the emulator if not read from the table file
+        script_content = None
+        if force_extraction or not os.path.exists(script_file_path):
+            script_content = ScriptHelper.read_table_script(
+                table_file_path=table_file_path
+            )
+            if script_content is not None:
+                FileHelper.write_file(
+                    file_path=script_file_path,
+                    content=script_content,
+                    atomic=True
+                )
+            elif extract_cmd is not None:
+                CmdHelper.run(f'{extract_cmd} "{table_file_path}"')
+
+        if script_content is None:
+            if not os.path.exists(script_file_path):
+                return None, None
+
+            script_content = FileHelper.read_file(
+                file_path=script_file_path
+            )
+        rom, pup_pack = ScriptHelper.__extract_metadata(
+            script_content=script_content
+        )
+
+        # Cache metadata and a copy of the script
+        script_hash = hashlib.sha256(
+            script_content.encode('UTF-8')
+        ).hexdigest()
+        FileHelper.copy_file(
+            source_file_path=script_file_path,
+            destination_file_path=ScriptHelper.__get_cached_script_path(
+                script_hash=script_hash
+            )
+        )
+        with ScriptHelper.__metadata_lock:
+            ScriptHelper.__remember_path(
+                metadata={
+                    Constants.SCRIPT_METADATA_COL_HASH: table_file_hash,
+                    Constants.SCRIPT_METADATA_COL_ROM: rom,
+                    Constants.SCRIPT_METADATA_COL_PUP_PACK: pup_pack,
+                    Constants.SCRIPT_METADATA_COL_SCRIPT_HASH: script_hash
+                },
+                table_file_path=table_file_key,
+                table_file_size=table_file_size,
+                table_file_mtime=table_file_mtime
+            )
+
+        return rom, pup_pack
+
+    @staticmethod
+    def __remember_path(
+        metadata: dict,
+        table_file_path: str,
+        table_file_size: str,
+        table_file_mtime: str
+    ):
+        """Keep metadata for the table file path (called with the lock)"""
+
+        path_metadata = {
+            **metadata,
+            Constants.SCRIPT_METADATA_COL_FILE: table_file_path,
+            Constants.SCRIPT_METADATA_COL_SIZE: table_file_size,
+            Constants.SCRIPT_METADATA_COL_MTIME: table_file_mtime
+        }
+        if ScriptHelper.__metadata_by_path.get(table_file_path, None) == path_metadata:
+            return
+
+        ScriptHelper.__metadata_by_path[table_file_path] = path_metadata
+        ScriptHelper.__metadata_by_hash[path_metadata[Constants.SCRIPT_METADATA_COL_HASH]] = \
+            path_metadata
+        ScriptHelper.__metadata_modified = True
+
+    @staticmethod
+    def submit_metadata(
+        table_file_path: str,
+        script_file_path: str,
+        extract_cmd: str,
+        force_extraction: bool = False
+    ) -> Future:
+        """Get metadata like get_metadata, in parallel of the caller"""
+
+        with ScriptHelper.__metadata_lock:
+            if ScriptHelper.__extraction_executor is None:
+                ScriptHelper.__extraction_executor = ThreadPoolExecutor(
+                    max_workers=Constants.SCRIPT_EXTRACTION_WORKERS
+                )
+
+        return ScriptHelper.__extraction_executor.submit(
+            ScriptHelper.get_metadata,
+            table_file_path=table_file_path,
+            script_file_path=script_file_path,
+            extract_cmd=extract_cmd,
+            force_extraction=force_extraction
+        )
+
+    @staticmethod
+    def save_metadata():
+        """Write cached metadata if modified"""
+
+        with ScriptHelper.__metadata_lock:
+            if not ScriptHelper.__metadata_modified:
+                return
+
+            CsvHelper.write_data(
+                file_path=ScriptHelper.__get_metadata_file_path(),
+                data=list(ScriptHelper.__metadata_by_path.values()),
+                sort_column_id=Constants.SCRIPT_METADATA_COL_FILE,
+                format_values=False
+            )
+            ScriptHelper.__metadata_modified = False
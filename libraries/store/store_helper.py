@@ -0,0 +1,359 @@
+#!/usr/bin/python3
+"""Store Helper"""
+
+import os
+import stat
+import threading
+
+from libraries.constants.constants import Constants
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.logging.logging_helper import LoggingHelper
+
+
+class StoreHelper:
+    """
+    Class to help usage of the deduplicated store.
+
+    Big files of versions are stored once as blobs named by their hash and
+    versions folders reference them through hard links. A linked file shares
+    its content with the blob: it is only written by the application, which
+    replaces the link instead of writing in place (copies and
+    FileHelper.write_file). Blobs are read-only, so are their links, to keep
+    editors outside of the application from writing them in place. A blob
+    made writable again is hashed before being linked or collected, and
+    removed from the store if its content no longer matches its hash.
+
+    A file is stored if it is the same file (device and inode) as a blob, the
+    identities of the blobs being tracked from the objects folder.
+    """
+
+    # Identities (device, inode) of the blobs, listed at first use
+    __blobs_ids = set()
+    __blobs_listed = False
+    __blobs_lock = threading.Lock()
+
+    @staticmethod
+    def __get_objects_path() -> str:
+        """Get objects path of the store"""
+
+        return os.path.join(
+            Context.get_store_path(),
+            'objects'
+        )
+
+    @staticmethod
+    def __get_blob_path(
+        file_hash: str
+    ) -> str:
+        """Get blob's path from the hash of its content"""
+
+        return os.path.join(
+            StoreHelper.__get_objects_path(),
+            file_hash[:2],
+            file_hash
+        )
+
+    @staticmethod
+    def __get_file_id(
+        file_path: str
+    ) -> tuple:
+        """Get the identity of a file, shared by its hard links"""
+
+        file_stat = os.stat(file_path)
+        return (file_stat.st_dev, file_stat.st_ino)
+
+    @staticmethod
+    def __list_blobs_ids() -> set:
+        """List identities of the blobs, from objects folder at first call (called with the lock)"""
+
+        if not StoreHelper.__blobs_listed:
+            StoreHelper.__blobs_listed = True
+            objects_path = StoreHelper.__get_objects_path()
+            if os.path.isdir(objects_path):
+                for root, _, files in FileHelper.walk_folder(objects_path):
+                    for file in files:
+                        StoreHelper.__blobs_ids.add(StoreHelper.__get_file_id(
+                            file_path=os.path.join(root, file)
+                        ))
+
+        return StoreHelper.__blobs_ids
+
+    @staticmethod
+    def __mark_read_only(
+        file_path: str
+    ):
+        """Mark a blob read-only, with its links sharing its attributes"""
+
+        file_mode = os.stat(file_path).st_mode
+        os.chmod(file_path, file_mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+    @staticmethod
+    def __verify_blob(
+        blob_path: str
+    ) -> bool:
+        """
+        Verify a blob was not modified in place since stored.
+
+        Only a blob made writable again can have been modified: it is hashed,
+        then marked read-only again if its content still matches its hash, or
+        removed from the store (its links keeping their content) otherwise.
+        """
+
+        if not os.stat(blob_path).st_mode & stat.S_IWUSR:
+            return True
+
+        if FileHelper.compute_file_hash(
+            file_path=blob_path
+        ) == os.path.basename(blob_path):
+            StoreHelper.__mark_read_only(
+                file_path=blob_path
+            )
+            return True
+
+        LoggingHelper.log_warning(
+            message=Context.get_text(
+                'warning_store_blob_modified',
+                file=str(blob_path)
+            )
+        )
+        blob_id = StoreHelper.__get_file_id(
+            file_path=blob_path
+        )
+        FileHelper.delete_file(
+            file_path=blob_path
+        )
+        with StoreHelper.__blobs_lock:
+            StoreHelper.__list_blobs_ids().discard(blob_id)
+
+        return False
+
+    @staticmethod
+    def __is_stored(
+        file_path: str
+    ) -> bool:
+        """Specify if a file is a blob of the store or a link to one"""
+
+        file_id = StoreHelper.__get_file_id(
+            file_path=file_path
+        )
+        with StoreHelper.__blobs_lock:
+            return file_id in StoreHelper.__list_blobs_ids()
+
+    @staticmethod
+    def store_file(
+        file_path: str
+    ) -> int:
+        """
+        Move the content of a file in the store.
+
+        The file is replaced by a hard link to an existing blob with the same
+        content, or becomes itself the blob if the content is new.
+
+        :return: Size saved by deduplication
+        """
+
+        if Context.is_simulated():
+            LoggingHelper.log_info(
+                message=Context.get_text(
+                    'store_file_simulation',
+                    file=str(file_path)
+                )
+            )
+            return 0
+
+        file_size = os.path.getsize(file_path)
+        if file_size < Constants.STORE_MIN_FILE_SIZE or \
+                StoreHelper.__is_stored(file_path):
+            return 0
+
+        blob_path = StoreHelper.__get_blob_path(
+            file_hash=FileHelper.compute_file_hash(
+                file_path=file_path
+            )
+        )
+
+        try:
+            if not os.path.exists(blob_path) or not StoreHelper.__verify_blob(
+                blob_path=blob_path
+            ):
+                # New content, the file becomes the blob
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.link(file_path, blob_path)
+                StoreHelper.__mark_read_only(
+                    file_path=blob_path
+                )
+                with StoreHelper.__blobs_lock:
+                    StoreHelper.__list_blobs_ids().add(StoreHelper.__get_file_id(
+                        file_path=blob_path
+                    ))
+                return 0
+
+            # Replace the file by a link to the existing blob
+            linked_file_path = file_path + Constants.FILE_COPY_PARTIAL_EXTENSION
+            os.link(blob_path, linked_file_path)
+            os.replace(linked_file_path, file_path)
+        except OSError as exc:
+            # Hard links not supported by the file system
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_store_file',
+                    file=str(file_path),
+                    error=str(exc)
+                )
+            )
+            return 0
+
+        return file_size
+
+    @staticmethod
+    def store_folder(
+        folder_path: str
+    ) -> int:
+        """
+        Move the content of all files of a folder in the store.
+
+        :return: Size saved by deduplication
+        """
+
+        if not os.path.isdir(folder_path):
+            return 0
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'store_folder_in_progress',
+                folder=str(folder_path)
+            )
+        )
+
+        saved_size = 0
+        for root, _, files in FileHelper.walk_folder(folder_path):
+            for file in files:
+                if file.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION):
+                    continue
+
+                saved_size += StoreHelper.store_file(
+                    file_path=os.path.join(root, file)
+                )
+
+        return saved_size
+
+    @staticmethod
+    def link_folder(
+        source_folder_path: str,
+        destination_folder_path: str
+    ) -> bool:
+        """
+        Copy a folder from source to destination through the store.
+
+        Big files are only linked to their blob, other files are copied.
+        """
+
+        if Context.is_simulated():
+            return FileHelper.copy_folder(
+                source_folder_path=source_folder_path,
+                destination_folder_path=destination_folder_path
+            )
+
+        if not os.path.isdir(source_folder_path):
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_not_found_folder',
+                    folder=str(source_folder_path)
+                )
+            )
+            return False
+
+        # Store source files before linking them
+        StoreHelper.store_folder(
+            folder_path=source_folder_path
+        )
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'link_folder_in_progress',
+                source_folder=str(source_folder_path),
+                destination_folder=str(destination_folder_path)
+            )
+        )
+
+        for root, _, files in FileHelper.walk_folder(source_folder_path):
+            for file in files:
+                if file.endswith(Constants.FILE_COPY_PARTIAL_EXTENSION):
+                    continue
+
+                source_file_path = os.path.join(root, file)
+                destination_file_path = os.path.join(
+                    destination_folder_path,
+                    os.path.relpath(source_file_path, source_folder_path)
+                )
+                os.makedirs(
+                    os.path.dirname(destination_file_path),
+                    exist_ok=True
+                )
+
+                if StoreHelper.__is_stored(source_file_path):
+                    try:
+                        os.link(source_file_path, destination_file_path)
+                        continue
+                    except OSError:
+                        # Copy the file if it can't be linked
+                        pass
+
+                if not FileHelper.copy_file(
+                    source_file_path=source_file_path,
+                    destination_file_path=destination_file_path
+                ):
+                    return False
+
+        return True
+
+    @staticmethod
+    def collect_garbage() -> tuple:
+        """
+        Delete blobs no longer referenced by a version.
+
+        :return: Tuple (deleted blobs count, deleted size)
+        """
+
+        deleted_blobs_count = 0
+        deleted_size = 0
+
+        objects_path = StoreHelper.__get_objects_path()
+        if not os.path.isdir(objects_path):
+            return (deleted_blobs_count, deleted_size)
+
+        for root, _, files in FileHelper.walk_folder(objects_path):
+            for file in files:
+                blob_path = os.path.join(root, file)
+
+                # A blob modified in place is no longer shared, its links being kept
+                if not StoreHelper.__verify_blob(
+                    blob_path=blob_path
+                ):
+                    continue
+
+                # A blob without other link than itself is unreferenced
+                blob_stat = os.stat(blob_path)
+                if blob_stat.st_nlink > 1:
+                    continue
+
+                if FileHelper.delete_file(
+                    file_path=blob_path
+                ):
+                    with StoreHelper.__blobs_lock:
+                        StoreHelper.__list_blobs_ids().discard(
+                            (blob_stat.st_dev, blob_stat.st_ino)
+                        )
+                    deleted_blobs_count += 1
+                    deleted_size += blob_stat.st_size
+
+        LoggingHelper.log_info(
+            message=Context.get_text(
+                'store_garbage_collected',
+                deleted_blobs_count=deleted_blobs_count,
+                deleted_size=deleted_size // (1024 * 1024)
+            )
+        )
+
+        return (deleted_blobs_count, deleted_size)
@@ -49,7 +49,8 @@ class UIHelper:
 
     @staticmethod
     def create_dialog(
-        parent: Wm
+        parent: Wm,
+        hide_parent=True
     ):
         """Create a dialog"""
 
@@ -57,7 +58,8 @@ class UIHelper:
         dialog = tk.Toplevel(parent)
 
         # Hide parent and dialog
-        parent.withdraw()
+        if hide_parent:
+            parent.withdraw()
         dialog.withdraw()
 
         return dialog
@@ -114,6 +116,15 @@ class UIHelper:
         # Show the dialog
         dialog.deiconify()
 
+    @staticmethod
+    def release_dialog(
+        dialog: Wm
+    ):
+        """Release the grab of a centered dialog, keeping it above its parent"""
+
+        dialog.grab_release()
+        dialog.transient(dialog.master)
+
     @staticmethod
     def close_dialog(
         dialog: Wm
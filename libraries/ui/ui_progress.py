@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+"""UI Progress"""
+
+import queue
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from libraries.constants.constants import Constants
+
+
+class UIProgress:
+    """
+    Class for UI Progress.
+
+    Progress can be reported from any thread: updates are queued and applied
+    by the Tk main loop at a fixed rate, only the latest value of each is kept.
+    Other calls on widgets are queued too and run in their order.
+    """
+
+    def __init__(
+        self,
+        dialog: tk.Toplevel,
+        progress_bar: ttk.Progressbar,
+        progress_label: tk.Label = None
+    ):
+        """Initialize progress"""
+
+        self.__dialog = dialog
+        self.__progress_bar = progress_bar
+        self.__progress_label = progress_label
+        self.__updates = queue.Queue()
+        self.__calls = queue.Queue()
+        self.__creation_time = time.monotonic()
+
+        # Start polling updates from the Tk main loop
+        self.__dialog.after(
+            Constants.UI_PROGRESS_REFRESH_DELAY,
+            self.__apply_updates
+        )
+
+    def set_maximum(
+        self,
+        maximum: int
+    ):
+        """Set progress bar's maximum"""
+
+        self.__updates.put(('maximum', maximum))
+
+    def set_value(
+        self,
+        value: int
+    ):
+        """Set progress bar's value"""
+
+        self.__updates.put(('value', value))
+
+    def set_text(
+        self,
+        text: str
+    ):
+        """Set progress label's text"""
+
+        self.__updates.put(('text', text))
+
+    def run_in_ui(
+        self,
+        function: any,
+        **kwargs
+    ):
+        """Run a function on widgets from the Tk main loop"""
+
+        self.__calls.put((function, kwargs))
+
+    def wait_minimum_display(self):
+        """Wait the minimum display time to see the dialog if the process is quick"""
+
+        remaining_time = Constants.UI_PROGRESS_MIN_DISPLAY_TIME - (
+            time.monotonic() - self.__creation_time
+        )
+        if remaining_time > 0:
+            time.sleep(remaining_time)
+
+    def __apply_updates(self):
+        """Apply the latest queued updates (called from the Tk main loop)"""
+
+        # Keep only the latest value of each update
+        latest_updates = {}
+        while True:
+            try:
+                key, value = self.__updates.get_nowait()
+            except queue.Empty:
+                break
+            latest_updates[key] = value
+
+        try:
+            if 'maximum' in latest_updates:
+                self.__progress_bar.config(
+                    maximum=latest_updates['maximum']
+                )
+            if 'value' in latest_updates:
+                self.__progress_bar['value'] = latest_updates['value']
+            if 'text' in latest_updates and self.__progress_label is not None:
+                self.__progress_label.config(
+                    text=latest_updates['text']
+                )
+
+            # Run calls in their order
+            while True:
+                try:
+                    function, kwargs = self.__calls.get_nowait()
+                except queue.Empty:
+                    break
+                function(**kwargs)
+
+            # Poll again while the dialog exists
+            self.__dialog.after(
+                Constants.UI_PROGRESS_REFRESH_DELAY,
+                self.__apply_updates
+            )
+        except tk.TclError:
+            # Dialog destroyed
+            pass
@@ -377,6 +377,28 @@ class UITable:
         for item in self.__tree.get_children():
             self.__tree.delete(item)
 
+        self.__insert_rows(
+            rows=rows
+        )
+
+    def append_rows(
+        self,
+        rows: list
+    ):
+        """Append rows after the existing ones"""
+
+        self.__rows = self.__rows + rows
+
+        self.__insert_rows(
+            rows=rows
+        )
+
+    def __insert_rows(
+        self,
+        rows: list
+    ):
+        """Insert rows at the end of the tree"""
+
         # Add data with tag color from rows
         colors = []
         for row in rows:
@@ -0,0 +1,1046 @@
+#!/usr/bin/python3
+"""Batch Verifier"""
+
+import bisect
+import fnmatch
+import os
+import re
+import threading
+
+from libraries.constants.constants import Action, Component, Constants, Emulator
+from libraries.context.context import Context
+from libraries.file.file_helper import FileHelper
+from libraries.file.file_name_matcher import FileNameMatcher
+from libraries.logging.logging_helper import LoggingHelper
+from libraries.manifest.manifest_helper import ManifestHelper
+from libraries.verifier.verifier import Verifier
+from libraries.winreg.registry_snapshot import RegFileBackend, RegistrySnapshot, WinRegBackend
+
+# pylint: disable=too-many-lines
+
+
+class BatchVerifier:
+    """
+    Class to verify tables files against snapshots of the installation folders.
+
+    Emulator, POPMedia and PUPVideos folders are indexed once with the size of
+    their files, then each table compares the paths expected by its version
+    with the indexes by set operations instead of checking files one by one.
+    VPinMAME registry keys are compared with a snapshot of the registry.
+    Verifications give the same results as the ones of Verifier.
+
+    Expected sizes are read from the manifests of the versions: a file of a
+    version overwritten in place (without adding or removing files in its
+    folder) keeps the size of the manifest until it is rewritten, so it is
+    compared with its previous size.
+    """
+
+    def __init__(
+        self,
+        registry_snapshot: RegistrySnapshot = None
+    ):
+        """Initialize batch verifier"""
+
+        self.__indexes = {}
+        self.__indexes_locks = {}
+        self.__indexes_lock = threading.Lock()
+
+        # Registry is read from the .reg file standing in for it if defined
+        if registry_snapshot is None:
+            registry_file_path = Context.get_registry_file_path()
+            if registry_file_path is not None:
+                registry_snapshot = RegistrySnapshot(
+                    backend=RegFileBackend(
+                        file_path=registry_file_path
+                    )
+                )
+            else:
+                registry_snapshot = RegistrySnapshot(
+                    backend=WinRegBackend()
+                )
+        self.__registry_snapshot = registry_snapshot
+
+    def __get_index(
+        self,
+        folder_path: str
+    ) -> dict:
+        """Get the index of a folder, built on first use"""
+
+        folder_path = str(folder_path)
+        index = self.__indexes.get(folder_path, None)
+        if index is not None:
+            return index
+
+        # Only the same folder is waited for, other folders are indexed meanwhile
+        with self.__indexes_lock:
+            folder_lock = self.__indexes_locks.setdefault(folder_path, threading.Lock())
+
+        with folder_lock:
+            index = self.__indexes.get(folder_path, None)
+            if index is not None:
+                return index
+
+            files_sizes = FileHelper.index_folder(
+                folder_path=folder_path
+            )
+
+            # Index files by name and by parent folders names to match names
+            names = sorted(
+                (os.path.normcase(os.path.basename(relative_path)), relative_path)
+                for relative_path in files_sizes
+            )
+            folders = {}
+            for relative_path in files_sizes:
+                if not fnmatch.fnmatch(os.path.basename(relative_path), '*.*'):
+                    continue
+                for folder in set(os.path.dirname(relative_path).split(os.sep)):
+                    folders.setdefault(folder, []).append(relative_path)
+
+            index = {
+                'sizes': files_sizes,
+                'names': names,
+                'folders': folders
+            }
+            self.__indexes[folder_path] = index
+
+            return index
+
+    def __get_size(
+        self,
+        root_path: str,
+        relative_path: str
+    ):
+        """Get the size of a file from the index of its first folder, None if not found"""
+
+        folder, _, sub_path = relative_path.partition(os.sep)
+        if len(sub_path) == 0:
+            file_path = os.path.join(root_path, relative_path)
+            if not os.path.isfile(file_path):
+                return None
+            return os.path.getsize(file_path)
+
+        return self.__get_index(
+            folder_path=os.path.join(root_path, folder)
+        )['sizes'].get(sub_path, None)
+
+    def __list_installed_sizes(
+        self,
+        installed_path: str,
+        relative_paths: set
+    ) -> dict:
+        """
+        List the installed files among relative paths, by set operations on the indexes.
+
+        Paths are grouped by their first folder, then each group is
+        intersected at once with the index of its folder.
+
+        :return: Dict of sizes by path relative to the installed folder, missing files excluded
+        """
+
+        sub_paths_by_folder = {}
+        for relative_path in relative_paths:
+            folder, _, sub_path = relative_path.partition(os.sep)
+            sub_paths_by_folder.setdefault(folder, set()).add(sub_path)
+
+        installed_sizes = {}
+        for folder, sub_paths in sub_paths_by_folder.items():
+
+            # Files at the root of the installed folder are not indexed
+            if '' in sub_paths:
+                sub_paths.discard('')
+                file_path = os.path.join(installed_path, folder)
+                if os.path.isfile(file_path):
+                    installed_sizes[folder] = os.path.getsize(file_path)
+            if len(sub_paths) == 0:
+                continue
+
+            sizes = self.__get_index(
+                folder_path=os.path.join(installed_path, folder)
+            )['sizes']
+            for sub_path in sub_paths & sizes.keys():
+                installed_sizes[os.path.join(folder, sub_path)] = sizes[sub_path]
+
+        return installed_sizes
+
+    def __list_relative_paths(
+        self,
+        folder_path: str,
+        file_name: str
+    ) -> dict:
+        """
+        List relative paths for the specified name like FileHelper.list_relative_paths.
+
+        :return: Dict of sizes by path relative to the folder
+        """
+
+        if not os.path.isdir(folder_path):
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_not_found_folder',
+                    folder=str(folder_path)
+                )
+            )
+            return {}
+
+        index = self.__get_index(
+            folder_path=folder_path
+        )
+
+        # Files of folders with the name
+        result = set(index['folders'].get(file_name, []))
+
+        # Files with the name, only names starting like it until its first wildcard can match
+        matcher = FileNameMatcher(
+            file_names=[file_name]
+        )
+        name_prefix = os.path.normcase(re.split(r'[*?[]', file_name, maxsplit=1)[0])
+        position = bisect.bisect_left(index['names'], (name_prefix,))
+        while position < len(index['names']) and \
+                index['names'][position][0].startswith(name_prefix):
+            relative_path = index['names'][position][1]
+            file = os.path.basename(relative_path)
+            if file != 'Thumbs.db' and len(matcher.match(file)) > 0:
+                result.add(relative_path)
+            position += 1
+
+        return {
+            relative_path: index['sizes'][relative_path]
+            for relative_path in result
+        }
+
+    def __list_expected_installed_sizes(
+        self,
+        table_id: str,
+        table_versions: list
+    ) -> dict:
+        """List the installed files expected by the versions of a table, by installed path"""
+
+        installed_paths = {
+            'emulator': Context.get_emulator_path(
+                Context.get_selected_emulator()
+            ),
+            'media': Context.get_pinup_media_path(),
+            'PUPVideos': os.path.join(Context.get_pinup_path(), 'PUPVideos')
+        }
+
+        installed_sizes = {}
+        for table_version in table_versions:
+            for sub_folder_path, installed_path in installed_paths.items():
+                for relative_path in ManifestHelper.list_files(
+                    version_folder_path=BatchVerifier.__get_version_path(
+                        bdd_table_id=table_id,
+                        bdd_table_version=table_version
+                    ),
+                    sub_folder_path=sub_folder_path
+                ):
+                    installed_sizes[os.path.join(installed_path, relative_path)] = \
+                        self.__get_size(
+                            root_path=installed_path,
+                            relative_path=relative_path
+                        )
+
+        return installed_sizes
+
+    def list_table_installed_sizes(
+        self,
+        table_id: str,
+        table_versions: list,
+        table_roms: list,
+        table_videos_paths: list
+    ) -> dict:
+        """
+        List the installed files read by the verifications of a table, from the indexes.
+
+        They are the files expected by its versions, and the files installed
+        with its name, the names of its ROMs or in its PUP videos folders.
+
+        :return: Dict of sizes (None if not found) by installed path
+        """
+
+        installed_sizes = self.__list_expected_installed_sizes(
+            table_id=table_id,
+            table_versions=table_versions
+        )
+
+        emulator_path = Context.get_emulator_path(
+            Context.get_selected_emulator()
+        )
+        names_by_folder = [
+            (os.path.join(emulator_path, 'Tables'), f'{table_id}*'),
+            (Context.get_pinup_media_path(), table_id)
+        ]
+        for table_rom in table_roms:
+            names_by_folder.append((
+                os.path.join(emulator_path, 'VPinMAME'),
+                table_rom
+            ))
+        for table_videos_path in table_videos_paths:
+            names_by_folder.append((
+                os.path.join(Context.get_pinup_path(), 'PUPVideos', table_videos_path),
+                '*'
+            ))
+        for folder_path, file_name in names_by_folder:
+            if not os.path.isdir(folder_path):
+                continue
+            for relative_path, size in self.__list_relative_paths(
+                folder_path=folder_path,
+                file_name=file_name
+            ).items():
+                installed_sizes[os.path.join(folder_path, relative_path)] = size
+
+        return installed_sizes
+
+    def get_rom_registry_values(
+        self,
+        rom: str
+    ) -> dict:
+        """Get the registry values of a ROM, compared by the verifications of REG configs"""
+
+        return self.__registry_snapshot.get_values_tree(
+            key=f'{Constants.VPINMAME_REG_KEY}\\{rom}'
+        )
+
+    @staticmethod
+    def __is_cache_file(
+        relative_path: str
+    ) -> bool:
+        """Specify if a file is a cache file"""
+
+        for cache_file_name in Constants.CACHE_FILES_NAMES:
+            if cache_file_name in relative_path:
+                return True
+
+        return False
+
+    @staticmethod
+    def __get_version_path(
+        bdd_table_id: str,
+        bdd_table_version: str
+    ) -> str:
+        """Get version's path of a table"""
+
+        return os.path.join(
+            Context.get_working_path(),
+            'tables',
+            Context.get_selected_emulator().value,
+            bdd_table_id,
+            bdd_table_version
+        )
+
+    @staticmethod
+    def __list_verified_paths(
+        files_sizes: dict,
+        ignore_cache_files: bool
+    ) -> set:
+        """List the expected files verified, cache files excluded if ignored"""
+
+        return {
+            relative_path
+            for relative_path in files_sizes
+            if not ignore_cache_files or not BatchVerifier.__is_cache_file(relative_path)
+        }
+
+    def __verify_install(
+        self,
+        files_sizes: dict,
+        installed_path: str,
+        version_path: str,
+        ignore_cache_files: bool,
+        installed_sizes: dict = None
+    ):
+        """Verify expected files are installed with the same sizes, looked up if not specified"""
+
+        relative_paths = BatchVerifier.__list_verified_paths(
+            files_sizes=files_sizes,
+            ignore_cache_files=ignore_cache_files
+        )
+
+        if installed_sizes is None:
+            installed_sizes = self.__list_installed_sizes(
+                installed_path=installed_path,
+                relative_paths=relative_paths
+            )
+
+        # Expected files minus installed files
+        missing_paths = relative_paths - installed_sizes.keys()
+        if len(missing_paths) > 0:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_not_found_file',
+                    file=os.path.join(installed_path, min(missing_paths))
+                )
+            )
+            return False
+
+        # Expected sizes joined with installed sizes
+        different_paths = {
+            relative_path
+            for relative_path in relative_paths
+            if installed_sizes[relative_path] != files_sizes[relative_path]
+        }
+        if len(different_paths) > 0:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_differents_files',
+                    file1=os.path.join(installed_path, min(different_paths)),
+                    file2=os.path.join(version_path, min(different_paths))
+                )
+            )
+            return False
+
+        return len(files_sizes) > 0
+
+    def __verify_uninstall(
+        self,
+        files_sizes: dict,
+        installed_path: str,
+        ignore_cache_files: bool,
+        installed_sizes: dict = None
+    ):
+        """Verify expected files are not installed, looked up if not specified"""
+
+        relative_paths = BatchVerifier.__list_verified_paths(
+            files_sizes=files_sizes,
+            ignore_cache_files=ignore_cache_files
+        )
+
+        if installed_sizes is None:
+            installed_sizes = self.__list_installed_sizes(
+                installed_path=installed_path,
+                relative_paths=relative_paths
+            )
+
+        # Expected files intersected with installed files
+        return relative_paths.isdisjoint(installed_sizes.keys())
+
+    def __verify_export(
+        self,
+        installed_sizes: dict,
+        files_sizes: dict,
+        installed_path: str,
+        version_path: str,
+        ignore_cache_files: bool
+    ):
+        """Verify installed files are exported with the same sizes"""
+
+        relative_paths = {
+            relative_path
+            for relative_path in installed_sizes
+            if not ignore_cache_files or not BatchVerifier.__is_cache_file(relative_path)
+        }
+
+        # Installed files minus exported files
+        missing_paths = relative_paths - set(files_sizes)
+        if len(missing_paths) > 0:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_not_found_file',
+                    file=os.path.join(version_path, min(missing_paths))
+                )
+            )
+            return False
+
+        # Installed sizes joined with exported sizes
+        different_paths = {
+            relative_path
+            for relative_path in relative_paths
+            if installed_sizes[relative_path] != files_sizes[relative_path]
+        }
+        if len(different_paths) > 0:
+            LoggingHelper.log_warning(
+                message=Context.get_text(
+                    'warning_differents_files',
+                    file1=os.path.join(version_path, min(different_paths)),
+                    file2=os.path.join(installed_path, min(different_paths))
+                )
+            )
+            return False
+
+        return True
+
+    def verify_table_emulator_install(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table install"""
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        version_path = BatchVerifier.__get_version_path(
+            bdd_table_id=bdd_table_id,
+            bdd_table_version=bdd_table_version
+        )
+        return self.__verify_install(
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path='emulator'
+            ),
+            installed_path=Context.get_emulator_path(
+                Context.get_selected_emulator()
+            ),
+            version_path=os.path.join(version_path, 'emulator'),
+            ignore_cache_files=False
+        )
+
+    def verify_table_emulator_export(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str,
+        csv_table_rom: str
+    ):
+        """Verify if table export"""
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        version_path = BatchVerifier.__get_version_path(
+            bdd_table_id=bdd_table_id,
+            bdd_table_version=bdd_table_version
+        )
+        emulator_path = Context.get_emulator_path(
+            Context.get_selected_emulator()
+        )
+
+        if not self.__verify_export(
+            installed_sizes=self.__list_relative_paths(
+                folder_path=os.path.join(emulator_path, 'Tables'),
+                file_name=f'{bdd_table_id}*'
+            ),
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path=os.path.join('emulator', 'Tables')
+            ),
+            installed_path=os.path.join(emulator_path, 'Tables'),
+            version_path=os.path.join(version_path, 'emulator', 'Tables'),
+            ignore_cache_files=False
+        ):
+            return False
+
+        if Verifier.verify_none_value(csv_table_rom):
+            return None
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+            return self.__verify_export(
+                installed_sizes=self.__list_relative_paths(
+                    folder_path=os.path.join(emulator_path, 'VPinMAME'),
+                    file_name=csv_table_rom
+                ),
+                files_sizes=ManifestHelper.list_files(
+                    version_folder_path=version_path,
+                    sub_folder_path=os.path.join('emulator', 'VPinMAME')
+                ),
+                installed_path=os.path.join(emulator_path, 'VPinMAME'),
+                version_path=os.path.join(version_path, 'emulator', 'VPinMAME'),
+                ignore_cache_files=False
+            )
+
+        return True
+
+    def verify_table_emulator_uninstall(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table vpx uninstall"""
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        return self.__verify_uninstall(
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=BatchVerifier.__get_version_path(
+                    bdd_table_id=bdd_table_id,
+                    bdd_table_version=bdd_table_version
+                ),
+                sub_folder_path='emulator'
+            ),
+            installed_path=Context.get_emulator_path(
+                Context.get_selected_emulator()
+            ),
+            ignore_cache_files=False
+        )
+
+    def verify_table_pinup_media_install(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table media install"""
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        version_path = BatchVerifier.__get_version_path(
+            bdd_table_id=bdd_table_id,
+            bdd_table_version=bdd_table_version
+        )
+        return self.__verify_install(
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path='media'
+            ),
+            installed_path=Context.get_pinup_media_path(),
+            version_path=os.path.join(version_path, 'media'),
+            ignore_cache_files=True
+        )
+
+    def verify_table_pinup_media_export(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table media export"""
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        version_path = BatchVerifier.__get_version_path(
+            bdd_table_id=bdd_table_id,
+            bdd_table_version=bdd_table_version
+        )
+        return self.__verify_export(
+            installed_sizes=self.__list_relative_paths(
+                folder_path=Context.get_pinup_media_path(),
+                file_name=bdd_table_id
+            ),
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path='media'
+            ),
+            installed_path=Context.get_pinup_media_path(),
+            version_path=os.path.join(version_path, 'media'),
+            ignore_cache_files=True
+        )
+
+    def verify_table_pinup_media_uninstall(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table media uninstall"""
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        return self.__verify_uninstall(
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=BatchVerifier.__get_version_path(
+                    bdd_table_id=bdd_table_id,
+                    bdd_table_version=bdd_table_version
+                ),
+                sub_folder_path='media'
+            ),
+            installed_path=Context.get_pinup_media_path(),
+            ignore_cache_files=True
+        )
+
+    def verify_table_pinup_videos_install(
+        self,
+        csv_table_videos_path: str,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table videos install"""
+
+        if Verifier.verify_none_value(csv_table_videos_path):
+            return None
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        version_path = BatchVerifier.__get_version_path(
+            bdd_table_id=bdd_table_id,
+            bdd_table_version=bdd_table_version
+        )
+        return self.__verify_install(
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path='PUPVideos'
+            ),
+            installed_path=os.path.join(Context.get_pinup_path(), 'PUPVideos'),
+            version_path=os.path.join(version_path, 'PUPVideos'),
+            ignore_cache_files=True
+        )
+
+    def verify_table_pinup_videos_export(
+        self,
+        csv_table_videos_path: str,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table videos export"""
+
+        if Verifier.verify_none_value(csv_table_videos_path):
+            return None
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        version_path = BatchVerifier.__get_version_path(
+            bdd_table_id=bdd_table_id,
+            bdd_table_version=bdd_table_version
+        )
+        videos_path = os.path.join(
+            Context.get_pinup_path(),
+            'PUPVideos',
+            csv_table_videos_path
+        )
+        return self.__verify_export(
+            installed_sizes=self.__list_relative_paths(
+                folder_path=videos_path,
+                file_name='*'
+            ),
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path=os.path.join('PUPVideos', csv_table_videos_path)
+            ),
+            installed_path=videos_path,
+            version_path=os.path.join(version_path, 'PUPVideos', csv_table_videos_path),
+            ignore_cache_files=True
+        )
+
+    def verify_table_pinup_videos_uninstall(
+        self,
+        csv_table_videos_path: str,
+        bdd_table_id: str,
+        bdd_table_version: str
+    ):
+        """Verify if table videos uninstall"""
+
+        if Verifier.verify_none_value(csv_table_videos_path):
+            return None
+
+        if Verifier.verify_none_value(bdd_table_id) or \
+                Verifier.verify_none_value(bdd_table_version):
+            return False
+
+        return self.__verify_uninstall(
+            files_sizes=ManifestHelper.list_files(
+                version_folder_path=BatchVerifier.__get_version_path(
+                    bdd_table_id=bdd_table_id,
+                    bdd_table_version=bdd_table_version
+                ),
+                sub_folder_path='PUPVideos'
+            ),
+            installed_path=os.path.join(Context.get_pinup_path(), 'PUPVideos'),
+            ignore_cache_files=True
+        )
+
+    @staticmethod
+    def __list_verified_tables(
+        csv_rows: list,
+        bdd_rows: list
+    ) -> list:
+        """
+        List the tables verified by the selected install or uninstall, as the refresh does.
+
+        :return: List of row id, table id, table version and PUP videos path of each table
+        """
+
+        csv_rows_by_id = {
+            csv_row[Constants.CSV_COL_ID]: csv_row
+            for csv_row in csv_rows
+        }
+        bdd_rows_by_id = {
+            bdd_row[Constants.BDD_COL_TABLE_ID]: bdd_row
+            for bdd_row in bdd_rows
+        }
+
+        tables = []
+        match(Context.get_selected_action()):
+            case Action.INSTALL:
+                for csv_row in csv_rows:
+                    bdd_row = bdd_rows_by_id.get(csv_row[Constants.CSV_COL_ID], {})
+                    tables.append((
+                        csv_row[Constants.CSV_COL_ID],
+                        bdd_row.get(Constants.BDD_COL_TABLE_ID, None),
+                        bdd_row.get(Constants.BDD_COL_TABLE_VERSION, None),
+                        csv_row[Constants.CSV_COL_VIDEOS_PATH]
+                    ))
+
+            case Action.UNINSTALL:
+                for bdd_row in bdd_rows:
+                    bdd_table_version = bdd_row[Constants.BDD_COL_TABLE_VERSION]
+                    if Verifier.verify_none_value(bdd_table_version):
+                        bdd_table_version = 'latest'
+                    csv_row = csv_rows_by_id.get(bdd_row[Constants.BDD_COL_TABLE_ID], {})
+                    tables.append((
+                        bdd_row[Constants.BDD_COL_TABLE_ID],
+                        bdd_row[Constants.BDD_COL_TABLE_ID],
+                        bdd_table_version,
+                        csv_row.get(Constants.CSV_COL_VIDEOS_PATH, None)
+                    ))
+
+        return tables
+
+    @staticmethod
+    def __list_components_verifications(
+        table_id: str,
+        table_version: str,
+        csv_table_videos_path: str
+    ) -> dict:
+        """
+        List the verifications of the installed files of a table, by component.
+
+        :return: Dict of expected files and folders by component, None if without version
+        """
+
+        installed_paths = {}
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+            installed_paths[Component.EMULATOR_TABLE] = ('emulator', Context.get_emulator_path(
+                Context.get_selected_emulator()
+            ))
+        installed_paths[Component.PINUP_MEDIA] = ('media', Context.get_pinup_media_path())
+        if not Verifier.verify_none_value(csv_table_videos_path):
+            installed_paths[Component.PINUP_VIDEOS] = ('PUPVideos', os.path.join(
+                Context.get_pinup_path(),
+                'PUPVideos'
+            ))
+
+        verifications = {}
+        for component, (sub_folder_path, installed_path) in installed_paths.items():
+            if Verifier.verify_none_value(table_id) or \
+                    Verifier.verify_none_value(table_version):
+                verifications[component] = None
+                continue
+
+            version_path = BatchVerifier.__get_version_path(
+                bdd_table_id=table_id,
+                bdd_table_version=table_version
+            )
+            files_sizes = ManifestHelper.list_files(
+                version_folder_path=version_path,
+                sub_folder_path=sub_folder_path
+            )
+            ignore_cache_files = component != Component.EMULATOR_TABLE
+            verifications[component] = {
+                'files_sizes': files_sizes,
+                'relative_paths': BatchVerifier.__list_verified_paths(
+                    files_sizes=files_sizes,
+                    ignore_cache_files=ignore_cache_files
+                ),
+                'installed_path': installed_path,
+                'version_path': os.path.join(version_path, sub_folder_path),
+                'ignore_cache_files': ignore_cache_files
+            }
+
+        return verifications
+
+    def verify_rows(
+        self,
+        csv_rows: list,
+        bdd_rows: list
+    ) -> dict:
+        """
+        Verify the installed files of the tables of the selected install or uninstall at once.
+
+        CSV rows are the tables verified by an install, BDD rows the ones
+        verified by an uninstall. The files expected by the versions of all
+        tables are looked up together in the indexes of each installed
+        folder, then each table gets its expected files minus the present
+        ones. Results are the same as verify_table_*_install and
+        verify_table_*_uninstall, REG and XML configs aside.
+
+        :return: Dict of results by component value, by table id
+        """
+
+        results = {}
+        verifications = []
+        expected_paths = {}
+        for row_id, table_id, table_version, videos_path in BatchVerifier.__list_verified_tables(
+            csv_rows=csv_rows,
+            bdd_rows=bdd_rows
+        ):
+            results[row_id] = {
+                Component.PINUP_VIDEOS.value: None
+            }
+            for component, verification in BatchVerifier.__list_components_verifications(
+                table_id=table_id,
+                table_version=table_version,
+                csv_table_videos_path=videos_path
+            ).items():
+                if verification is None:
+                    results[row_id][component.value] = False
+                    continue
+
+                verifications.append((row_id, component, verification))
+                expected_paths.setdefault(verification['installed_path'], set()).update(
+                    verification['relative_paths']
+                )
+
+        # Files expected by all tables, looked up at once by installed folder
+        installed_sizes = {
+            installed_path: self.__list_installed_sizes(
+                installed_path=installed_path,
+                relative_paths=relative_paths
+            )
+            for installed_path, relative_paths in expected_paths.items()
+        }
+
+        for row_id, component, verification in verifications:
+            if Context.get_selected_action() == Action.INSTALL:
+                results[row_id][component.value] = self.__verify_install(
+                    files_sizes=verification['files_sizes'],
+                    installed_path=verification['installed_path'],
+                    version_path=verification['version_path'],
+                    ignore_cache_files=verification['ignore_cache_files'],
+                    installed_sizes=installed_sizes[verification['installed_path']]
+                )
+            else:
+                results[row_id][component.value] = self.__verify_uninstall(
+                    files_sizes=verification['files_sizes'],
+                    installed_path=verification['installed_path'],
+                    ignore_cache_files=verification['ignore_cache_files'],
+                    installed_sizes=installed_sizes[verification['installed_path']]
+                )
+
+        return results
+
+    @staticmethod
+    def __get_reg_config_path(
+        table_id: str,
+        table_version: str
+    ) -> str:
+        """Get the path of the REG config of a table version"""
+
+        return os.path.join(
+            BatchVerifier.__get_version_path(
+                bdd_table_id=table_id,
+                bdd_table_version=table_version
+            ),
+            'config',
+            f'user_values{Constants.REGEDIT_FILE_EXTENSION}'
+        )
+
+    @staticmethod
+    def __get_rom_key(
+        table_id: str,
+        table_version: str,
+        table_rom: str
+    ) -> str:
+        """Get the VPinMAME registry key of the ROM of a table version, None if not specified"""
+
+        if Verifier.verify_none_value(table_id) or \
+                Verifier.verify_none_value(table_version) or \
+                Verifier.verify_none_value(table_rom):
+            return None
+
+        key = Constants.VPINMAME_REG_KEY
+        key += '\\'
+        key += table_rom
+        return key
+
+    def verify_table_reg_config_install(
+        self,
+        csv_table_id: str,
+        csv_table_version: str,
+        csv_table_rom: str
+    ):
+        """Verify if REG config for the rom install"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+
+            key = BatchVerifier.__get_rom_key(
+                table_id=csv_table_id,
+                table_version=csv_table_version,
+                table_rom=csv_table_rom
+            )
+            if key is None:
+                return None
+
+            file_path = BatchVerifier.__get_reg_config_path(
+                table_id=csv_table_id,
+                table_version=csv_table_version
+            )
+            if not os.path.isfile(file_path):
+                return None
+
+            if self.__registry_snapshot.is_key_exists(
+                key=key
+            ):
+                if self.__registry_snapshot.is_reg_file_equal(
+                    file_path=file_path
+                ):
+                    return True
+
+        return False
+
+    def verify_table_reg_config_export(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str,
+        bdd_table_rom: str
+    ):
+        """Verify if REG config for the rom export"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+
+            key = BatchVerifier.__get_rom_key(
+                table_id=bdd_table_id,
+                table_version=bdd_table_version,
+                table_rom=bdd_table_rom
+            )
+            if key is None or not self.__registry_snapshot.is_key_exists(
+                key=key
+            ):
+                return None
+
+            file_path = BatchVerifier.__get_reg_config_path(
+                table_id=bdd_table_id,
+                table_version=bdd_table_version
+            )
+            if not os.path.isfile(file_path):
+                LoggingHelper.log_warning(
+                    message=Context.get_text(
+                        'warning_not_found_file',
+                        file=str(file_path)
+                    )
+                )
+                return False
+
+            return self.__registry_snapshot.is_reg_file_equal(
+                file_path=file_path
+            )
+
+        return False
+
+    def verify_table_reg_config_uninstall(
+        self,
+        bdd_table_id: str,
+        bdd_table_version: str,
+        bdd_table_rom: str
+    ):
+        """Verify if REG config for the rom uninstall"""
+
+        if Context.get_selected_emulator() == Emulator.VISUAL_PINBALL_X:
+
+            key = BatchVerifier.__get_rom_key(
+                table_id=bdd_table_id,
+                table_version=bdd_table_version,
+                table_rom=bdd_table_rom
+            )
+            if key is None:
+                return None
+
+            file_path = BatchVerifier.__get_reg_config_path(
+                table_id=bdd_table_id,
+                table_version=bdd_table_version
+            )
+            if not os.path.isfile(file_path):
+                return None
+
+            return not self.__registry_snapshot.is_key_exists(
+                key=key
+            )
+
+        return False
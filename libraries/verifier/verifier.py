@@ -13,6 +13,7 @@ from libraries.constants.constants import Constants, Emulator, Component
 from libraries.context.context import Context
 from libraries.file.file_helper import FileHelper
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.manifest.manifest_helper import ManifestHelper
 from libraries.winreg.winreg_helper import WinRegHelper
 from libraries.xml.xml_helper import XmlHelper
 
@@ -170,18 +171,17 @@ class Verifier:
         if Verifier.verify_none_value(bdd_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 bdd_table_id,
-                bdd_table_version,
-                'emulator'
+                bdd_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='emulator'
         )
+        relative_paths = list(files_sizes)
 
         for relative_path in relative_paths:
             file1_path = os.path.join(
@@ -212,9 +212,9 @@ class Verifier:
                 )
                 return False
 
-            if not FileHelper.compare_files(
-                file1_path=file1_path,
-                file2_path=file2_path
+            if not FileHelper.compare_file_size(
+                file_path=file1_path,
+                file_size=files_sizes[relative_path]
             ):
                 LoggingHelper.log_warning(
                     message=Context.get_text(
@@ -252,6 +252,17 @@ class Verifier:
             error_if_not_found=False
         )
 
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
+                Context.get_working_path(),
+                'tables',
+                Context.get_selected_emulator().value,
+                bdd_table_id,
+                bdd_table_version
+            ),
+            sub_folder_path=os.path.join('emulator', 'Tables')
+        )
+
         for relative_path in relative_paths:
             file1_path = os.path.join(
                 Context.get_working_path(),
@@ -272,9 +283,7 @@ class Verifier:
                 relative_path
             )
 
-            if not FileHelper.is_file_exists(
-                file_path=file1_path
-            ):
+            if relative_path not in files_sizes:
                 LoggingHelper.log_warning(
                     message=Context.get_text(
                         'warning_not_found_file',
@@ -283,9 +292,9 @@ class Verifier:
                 )
                 return False
 
-            if not FileHelper.compare_files(
-                file1_path=file1_path,
-                file2_path=file2_path
+            if not FileHelper.compare_file_size(
+                file_path=file2_path,
+                file_size=files_sizes[relative_path]
             ):
                 LoggingHelper.log_warning(
                     message=Context.get_text(
@@ -312,6 +321,17 @@ class Verifier:
                 error_if_not_found=False
             )
 
+            files_sizes = ManifestHelper.list_files(
+                version_folder_path=os.path.join(
+                    Context.get_working_path(),
+                    'tables',
+                    Context.get_selected_emulator().value,
+                    bdd_table_id,
+                    bdd_table_version
+                ),
+                sub_folder_path=os.path.join('emulator', 'VPinMAME')
+            )
+
             for relative_path in relative_paths:
                 file1_path = os.path.join(
                     Context.get_working_path(),
@@ -332,9 +352,7 @@ class Verifier:
                     relative_path
                 )
 
-                if not FileHelper.is_file_exists(
-                    file_path=file1_path
-                ):
+                if relative_path not in files_sizes:
                     LoggingHelper.log_warning(
                         message=Context.get_text(
                             'warning_not_found_file',
@@ -343,9 +361,9 @@ class Verifier:
                     )
                     return False
 
-                if not FileHelper.compare_files(
-                    file1_path=file1_path,
-                    file2_path=file2_path
+                if not FileHelper.compare_file_size(
+                    file_path=file2_path,
+                    file_size=files_sizes[relative_path]
                 ):
                     LoggingHelper.log_warning(
                         message=Context.get_text(
@@ -371,18 +389,17 @@ class Verifier:
         if Verifier.verify_none_value(bdd_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 bdd_table_id,
-                bdd_table_version,
-                'emulator'
+                bdd_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='emulator'
         )
+        relative_paths = list(files_sizes)
 
         for relative_path in relative_paths:
             file_path = os.path.join(
@@ -411,18 +428,17 @@ class Verifier:
         if Verifier.verify_none_value(bdd_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 bdd_table_id,
-                bdd_table_version,
-                'media'
+                bdd_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='media'
         )
+        relative_paths = list(files_sizes)
 
         for relative_path in relative_paths:
             # Ignore cache file
@@ -460,9 +476,9 @@ class Verifier:
                 )
                 return False
 
-            if not FileHelper.compare_files(
-                file1_path=file1_path,
-                file2_path=file2_path
+            if not FileHelper.compare_file_size(
+                file_path=file1_path,
+                file_size=files_sizes[relative_path]
             ):
                 LoggingHelper.log_warning(
                     message=Context.get_text(
@@ -496,6 +512,17 @@ class Verifier:
             error_if_not_found=False
         )
 
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
+                Context.get_working_path(),
+                'tables',
+                Context.get_selected_emulator().value,
+                bdd_table_id,
+                bdd_table_version
+            ),
+            sub_folder_path='media'
+        )
+
         for relative_path in relative_paths:
             # Ignore cache file
             cache_file_found = False
@@ -521,9 +548,7 @@ class Verifier:
                 relative_path
             )
 
-            if not FileHelper.is_file_exists(
-                file_path=file1_path
-            ):
+            if relative_path not in files_sizes:
                 LoggingHelper.log_warning(
                     message=Context.get_text(
                         'warning_not_found_file',
@@ -532,9 +557,9 @@ class Verifier:
                 )
                 return False
 
-            if not FileHelper.compare_files(
-                file1_path=file1_path,
-                file2_path=file2_path
+            if not FileHelper.compare_file_size(
+                file_path=file2_path,
+                file_size=files_sizes[relative_path]
             ):
                 LoggingHelper.log_warning(
                     message=Context.get_text(
@@ -560,18 +585,17 @@ class Verifier:
         if Verifier.verify_none_value(bdd_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 bdd_table_id,
-                bdd_table_version,
-                'media'
+                bdd_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='media'
         )
+        relative_paths = list(files_sizes)
 
         for relative_path in relative_paths:
             # Ignore cache file
@@ -601,18 +625,17 @@ class Verifier:
     ):
         """Verify if table media edit"""
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 csv_table_id,
-                csv_table_version,
-                'media'
+                csv_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='media'
         )
+        relative_paths = list(files_sizes)
 
         parents_paths = []
         for relative_path in relative_paths:
@@ -640,18 +663,17 @@ class Verifier:
         if Verifier.verify_none_value(bdd_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 bdd_table_id,
-                bdd_table_version,
-                'PUPVideos'
+                bdd_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='PUPVideos'
         )
+        relative_paths = list(files_sizes)
 
         for relative_path in relative_paths:
             # Ignore cache file
@@ -690,9 +712,9 @@ class Verifier:
                 )
                 return False
 
-            if not FileHelper.compare_files(
-                file1_path=file1_path,
-                file2_path=file2_path
+            if not FileHelper.compare_file_size(
+                file_path=file1_path,
+                file_size=files_sizes[relative_path]
             ):
                 LoggingHelper.log_warning(
                     message=Context.get_text(
@@ -732,6 +754,17 @@ class Verifier:
             error_if_not_found=False
         )
 
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
+                Context.get_working_path(),
+                'tables',
+                Context.get_selected_emulator().value,
+                bdd_table_id,
+                bdd_table_version
+            ),
+            sub_folder_path=os.path.join('PUPVideos', csv_table_videos_path)
+        )
+
         for relative_path in relative_paths:
             # Ignore cache file
             cache_file_found = False
@@ -760,9 +793,7 @@ class Verifier:
                 relative_path
             )
 
-            if not FileHelper.is_file_exists(
-                file_path=file1_path
-            ):
+            if relative_path not in files_sizes:
                 LoggingHelper.log_warning(
                     message=Context.get_text(
                         'warning_not_found_file',
@@ -771,9 +802,9 @@ class Verifier:
                 )
                 return False
 
-            if not FileHelper.compare_files(
-                file1_path=file1_path,
-                file2_path=file2_path
+            if not FileHelper.compare_file_size(
+                file_path=file2_path,
+                file_size=files_sizes[relative_path]
             ):
                 LoggingHelper.log_warning(
                     message=Context.get_text(
@@ -803,18 +834,17 @@ class Verifier:
         if Verifier.verify_none_value(bdd_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 bdd_table_id,
-                bdd_table_version,
-                'PUPVideos'
+                bdd_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='PUPVideos'
         )
+        relative_paths = list(files_sizes)
 
         for relative_path in relative_paths:
             # Ignore cache file
@@ -855,18 +885,17 @@ class Verifier:
         if Verifier.verify_none_value(csv_table_version):
             return False
 
-        relative_paths = FileHelper.list_relative_paths(
-            folder_path=os.path.join(
+        files_sizes = ManifestHelper.list_files(
+            version_folder_path=os.path.join(
                 Context.get_working_path(),
                 'tables',
                 Context.get_selected_emulator().value,
                 csv_table_id,
-                csv_table_version,
-                'PUPVideos'
+                csv_table_version
             ),
-            file_name='*',
-            error_if_not_found=False
+            sub_folder_path='PUPVideos'
         )
+        relative_paths = list(files_sizes)
 
         return len(relative_paths) > 0
 
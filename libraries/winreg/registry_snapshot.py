@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+"""Registry Snapshot"""
+
+import os
+import threading
+
+from libraries.constants.constants import Constants
+from libraries.winreg.winreg_helper import WinRegHelper
+
+
+class WinRegBackend:
+    """Class to read user keys in the Windows Registry"""
+
+    def load_values_tree(
+        self,
+        key: str
+    ) -> dict:
+        """Load values of a user key and of all its sub keys"""
+
+        return WinRegHelper.load_user_values_tree(
+            key=key
+        )
+
+
+class RegFileBackend:
+    """Class to read user keys in a .reg file standing in for the Windows Registry"""
+
+    def __init__(
+        self,
+        file_path: str
+    ):
+        """Initialize backend"""
+
+        self.__file_path = file_path
+
+    def load_values_tree(
+        self,
+        key: str
+    ) -> dict:
+        """Load values of a user key and of all its sub keys"""
+
+        tree = {}
+        root_prefix = Constants.REGEDIT_ROOT_KEY_NAME + Constants.REGEDIT_KEY_SEPARATOR
+        for full_path, values in WinRegHelper.load_values_tree_from_reg_file(
+            file_path=self.__file_path
+        ).items():
+            if not full_path.upper().startswith(root_prefix):
+                continue
+            user_key = full_path[len(root_prefix):]
+            if user_key.lower() == key.lower() or \
+                    user_key.lower().startswith(key.lower() + Constants.REGEDIT_KEY_SEPARATOR):
+                tree[user_key] = values
+
+        return tree
+
+
+class RegistrySnapshot:
+    """
+    Class to verify .reg files against a snapshot of the registry.
+
+    The sub keys of the root key are read once, and each .reg file is parsed
+    once while it is not modified, so verifications only compare dictionaries.
+    Keys are compared without case, as in the Windows Registry.
+    """
+
+    def __init__(
+        self,
+        backend,
+        root_key: str = Constants.VPINMAME_REG_KEY
+    ):
+        """Initialize snapshot, reading keys from the backend (WinRegBackend or RegFileBackend)"""
+
+        self.__backend = backend
+        self.__root_key = root_key
+        self.__trees = {}
+        self.__reg_files = {}
+        self.__lock = threading.Lock()
+
+    def __get_tree(
+        self,
+        key: str
+    ) -> dict:
+        """Get the values tree containing a key, read on first use"""
+
+        # Keys outside of the root key are read with their sub keys
+        tree_key = self.__root_key
+        if key.lower() != tree_key.lower() and \
+                not key.lower().startswith(tree_key.lower() + Constants.REGEDIT_KEY_SEPARATOR):
+            tree_key = key
+
+        with self.__lock:
+            tree = self.__trees.get(tree_key.lower(), None)
+            if tree is None:
+                tree = {
+                    values_key.lower(): values
+                    for values_key, values in self.__backend.load_values_tree(
+                        key=tree_key
+                    ).items()
+                }
+                self.__trees[tree_key.lower()] = tree
+
+            return tree
+
+    def get_values(
+        self,
+        key: str
+    ) -> dict:
+        """Get values of a user key, None if not found"""
+
+        return self.__get_tree(key).get(key.lower(), None)
+
+    def get_values_tree(
+        self,
+        key: str
+    ) -> dict:
+        """Get values of a user key and of all its sub keys, by lower case key"""
+
+        key = key.lower()
+        return {
+            values_key: values
+            for values_key, values in self.__get_tree(key).items()
+            if values_key == key or
+            values_key.startswith(key + Constants.REGEDIT_KEY_SEPARATOR)
+        }
+
+    def is_key_exists(
+        self,
+        key: str
+    ) -> bool:
+        """Specify if user key exists"""
+
+        return self.get_values(key) is not None
+
+    def __get_reg_file_tree(
+        self,
+        file_path: str
+    ) -> dict:
+        """Get values by user key of a .reg file, parsed again only if modified"""
+
+        file_path = str(file_path)
+        mtime = os.stat(file_path).st_mtime_ns
+        with self.__lock:
+            cached_reg_file = self.__reg_files.get(file_path, None)
+            if cached_reg_file is not None and cached_reg_file[0] == mtime:
+                return cached_reg_file[1]
+
+        root_prefix = Constants.REGEDIT_ROOT_KEY_NAME + Constants.REGEDIT_KEY_SEPARATOR
+        reg_file_tree = {
+            full_path[len(root_prefix):]: values
+            for full_path, values in WinRegHelper.load_values_tree_from_reg_file(
+                file_path=file_path
+            ).items()
+            if full_path.upper().startswith(root_prefix)
+        }
+
+        with self.__lock:
+            self.__reg_files[file_path] = (mtime, reg_file_tree)
+
+        return reg_file_tree
+
+    def is_reg_file_equal(
+        self,
+        file_path: str
+    ) -> bool:
+        """Compares the values of the keys defined in a .reg file with the snapshot"""
+
+        match = True
+        for key, file_values in self.__get_reg_file_tree(file_path).items():
+            registry_values = self.get_values(key)
+            if not WinRegHelper.is_values_equal(
+                file_values=file_values,
+                registry_values=registry_values if registry_values is not None else {}
+            ):
+                match = False
+
+        return match
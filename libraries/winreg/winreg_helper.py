@@ -3,12 +3,18 @@
 
 import re
 import os
-import winreg
 import subprocess
-from libraries.constants.constants import Constants
+from libraries.constants.constants import Constants, Metric
 from libraries.context.context import Context
 from libraries.file.file_helper import FileHelper
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
+
+# Windows Registry exists only on Windows, .reg files are parsed everywhere
+try:
+    import winreg
+except ImportError:
+    winreg = None
 
 
 class WinRegHelper:
@@ -24,6 +30,34 @@ class WinRegHelper:
             return f'"{name}"=hex:{value_hex}'
         return f'Unknown type for {name}'
 
+    @staticmethod
+    def __parse_reg_value(
+        line: str
+    ):
+        """
+        Parses a value line of a .reg file (only REG_DWORD supported).
+
+        :param line: Stripped line of the .reg file
+        :return: Tuple (value_name, (type, value)), None if not supported
+        """
+        match = re.match(
+            r'"(.+?)"=(dword|hex|hex\(.*?\)|".*?")(.+)',
+            line
+        )
+        if match:
+            name, value_type, raw_data = match.groups()
+            value_type = value_type.lower()
+            raw_data = raw_data.strip()
+
+            # Handle REG_DWORD values
+            if value_type.startswith("dword"):
+                value = int(raw_data.split(':')[-1], 16)
+                return name, ("REG_DWORD", value)
+
+            # Other types can be added here if needed
+
+        return None
+
     @staticmethod
     def __load_values_from_reg_file(
         file_path: str
@@ -48,23 +82,44 @@ class WinRegHelper:
                 registry_path = line[1:-1]
             # Parse lines of the form "name"=dword:00000001
             elif '=' in line:
-                match = re.match(
-                    r'"(.+?)"=(dword|hex|hex\(.*?\)|".*?")(.+)',
-                    line
-                )
-                if match:
-                    name, value_type, raw_data = match.groups()
-                    value_type = value_type.lower()
-                    raw_data = raw_data.strip()
+                parsed_value = WinRegHelper.__parse_reg_value(line)
+                if parsed_value:
+                    name, value = parsed_value
+                    values[name] = value
 
-                    # Handle REG_DWORD values
-                    if value_type.startswith("dword"):
-                        value = int(raw_data.split(':')[-1], 16)
-                        values[name] = ("REG_DWORD", value)
+        return registry_path, values
 
-                    # Other types can be added here if needed
+    @staticmethod
+    def load_values_tree_from_reg_file(
+        file_path: str
+    ) -> dict:
+        """
+        Parses a .reg file to extract the values of each of its keys (only REG_DWORD supported).
 
-        return registry_path, values
+        :param file_path: Path to the .reg file
+        :return: Dictionary of registry key path -> dict of value_name -> (type, value)
+        """
+        tree = {}
+
+        file_content = FileHelper.read_file(
+            file_path=file_path,
+            encoding=Constants.REGEDIT_FILE_ENCODING
+        )
+        # Values before the first key are kept out of the tree
+        values = {}
+        for line in file_content.splitlines():
+            line = line.strip()
+            # Detect the registry key path in [brackets]
+            if line.startswith('[') and line.endswith(']'):
+                values = tree.setdefault(line[1:-1], {})
+            # Parse lines of the form "name"=dword:00000001
+            elif '=' in line:
+                parsed_value = WinRegHelper.__parse_reg_value(line)
+                if parsed_value:
+                    name, value = parsed_value
+                    values[name] = value
+
+        return tree
 
     @staticmethod
     def __open_key_from_path(
@@ -119,6 +174,60 @@ class WinRegHelper:
                     break
         return values
 
+    @staticmethod
+    def load_user_values_tree(
+        key: str
+    ) -> dict:
+        """
+        Loads values of a user key and of all its sub keys (supports REG_DWORD).
+
+        :param key: User key path
+        :return: Dictionary of key path -> dict of value_name -> (type, value),
+                 empty if the key does not exist
+        """
+        tree = {}
+        try:
+            registry_key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                key,
+                0,
+                winreg.KEY_READ
+            )
+        except OSError:
+            return tree
+
+        with registry_key:
+            values = {}
+            i = 0
+            while True:
+                try:
+                    name, val, val_type = winreg.EnumValue(registry_key, i)
+                    type_str = {
+                        winreg.REG_DWORD: "REG_DWORD"
+                    }.get(val_type)
+                    if type_str:
+                        values[name] = (type_str, val)
+                    i += 1
+                except OSError:
+                    break
+            tree[key] = values
+
+            # Retrieve sub keys
+            i = 0
+            while True:
+                try:
+                    subkey_name = winreg.EnumKey(registry_key, i)
+                    tree.update(
+                        WinRegHelper.load_user_values_tree(
+                            key=f"{key}\\{subkey_name}"
+                        )
+                    )
+                    i += 1
+                except OSError:
+                    break
+
+        return tree
+
     @staticmethod
     def is_user_key_exists(
         key: str
@@ -137,6 +246,7 @@ class WinRegHelper:
             return False
 
     @staticmethod
+    @MetricsHelper.measured(Metric.REGISTRY)
     def extract_user_key(
         extracted_file_path: str,
         key: str
@@ -213,6 +323,7 @@ class WinRegHelper:
         )
 
     @staticmethod
+    @MetricsHelper.measured(Metric.REGISTRY)
     def delete_user_key(
         key: str
     ):
@@ -248,6 +359,7 @@ class WinRegHelper:
             return
 
     @staticmethod
+    @MetricsHelper.measured(Metric.REGISTRY)
     def import_user_key(
         extracted_file_path: str
     ):
@@ -343,6 +455,24 @@ class WinRegHelper:
             full_path=reg_path
         )
 
+        return WinRegHelper.is_values_equal(
+            file_values=file_values,
+            registry_values=registry_values
+        )
+
+    @staticmethod
+    def is_values_equal(
+        file_values: dict,
+        registry_values: dict
+    ) -> bool:
+        """
+        Compares the values of a registry key defined in a .reg file
+        with the values read in the Windows Registry.
+
+        :param file_values: Dict of value_name -> (type, value) of the .reg file
+        :param registry_values: Dict of value_name -> (type, value) of the registry
+        :return: True if values and types match exactly, False otherwise
+        """
         match = True
 
         # pylint: disable=consider-using-dict-items
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""XML Batch"""
+
+from libraries.constants.constants import Metric
+from libraries.file.file_helper import FileHelper
+from libraries.metrics.metrics_helper import MetricsHelper
+from libraries.xml.xml_index import XmlIndex
+
+
+class XmlBatch:
+    """
+    Class to batch modifications of tags of a XML file.
+
+    Deletions and imports are collected, then applied in one pass over the
+    file and written once. The result is the same as applying them one by one:
+    a deletion removes the tag from the file and from the tags imported before
+    it, and imported tags are inserted in order before the closing parent tag.
+    """
+
+    def __init__(
+        self,
+        xml_file_path: str
+    ):
+        """Initialize batch"""
+
+        self.__xml_file_path = xml_file_path
+        self.__operations = []
+
+    def delete_tags(
+        self,
+        tags: list
+    ):
+        """Delete tags from XML file"""
+
+        self.__operations.append((tags, None, None))
+
+    def import_tags(
+        self,
+        extracted_file_path: str,
+        parent_tag: str
+    ):
+        """Import tags in a XML file from a XML file"""
+
+        self.__operations.append((
+            None,
+            FileHelper.read_file(
+                file_path=extracted_file_path
+            ),
+            parent_tag
+        ))
+
+    @staticmethod
+    def __filter_lines(
+        xml_index: XmlIndex,
+        deleted_tags: list
+    ) -> list:
+        """Filter lines of an index without the lines of deleted tags"""
+
+        deleted_lines = [False] * len(xml_index.get_lines())
+        for tag in deleted_tags:
+            for start, end in xml_index.list_tag_ranges(tag):
+                deleted_lines[start:end] = [True] * (end - start)
+
+        return [
+            line
+            for line, deleted in zip(xml_index.get_lines(), deleted_lines)
+            if not deleted
+        ]
+
+    @MetricsHelper.measured(Metric.XML)
+    def apply(self):
+        """Apply modifications in XML file"""
+
+        if len(self.__operations) == 0:
+            return
+
+        # Retrieve the last deletion of each tag
+        last_deletions = {}
+        for i, (tags, _, _) in enumerate(self.__operations):
+            if tags is not None:
+                for tag in tags:
+                    last_deletions[tag] = i
+
+        # Retrieve imported tags not deleted after their import by parent tag
+        imported_contents = {}
+        for i, (_, tags_content, parent_tag) in enumerate(self.__operations):
+            if tags_content is None:
+                continue
+
+            # Content of the last operation is not parsed again
+            if i == len(self.__operations) - 1:
+                imported_content = tags_content + '\n'
+            else:
+                tags_index = XmlIndex(
+                    xml_content=tags_content + '\n'
+                )
+                imported_content = ''.join(
+                    line + '\n'
+                    for line in XmlBatch.__filter_lines(
+                        xml_index=tags_index,
+                        deleted_tags=[
+                            tag
+                            for tag in tags_index.list_tags()
+                            if last_deletions.get(tag, -1) > i
+                        ]
+                    )
+                )
+            imported_contents.setdefault(parent_tag, []).append(imported_content)
+
+        # Rebuild content in one pass
+        new_content = []
+        for line in XmlBatch.__filter_lines(
+            xml_index=XmlIndex.get(
+                xml_file_path=self.__xml_file_path
+            ),
+            deleted_tags=list(last_deletions)
+        ):
+            if line.strip().startswith('</') and line.strip().endswith('>'):
+                new_content.extend(
+                    imported_contents.get(line.strip()[2:-1], [])
+                )
+            new_content.append(line + '\n')
+
+        FileHelper.write_file(
+            file_path=self.__xml_file_path,
+            content=''.join(new_content),
+            atomic=True
+        )
+        XmlIndex.invalidate(
+            xml_file_path=self.__xml_file_path
+        )
+        self.__operations = []
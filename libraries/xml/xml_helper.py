@@ -2,9 +2,13 @@
 """XML Helper"""
 
 import os
+from libraries.constants.constants import Metric
 from libraries.context.context import Context
 from libraries.file.file_helper import FileHelper
 from libraries.logging.logging_helper import LoggingHelper
+from libraries.metrics.metrics_helper import MetricsHelper
+from libraries.xml.xml_batch import XmlBatch
+from libraries.xml.xml_index import XmlIndex
 
 
 class XmlHelper:
@@ -17,17 +21,14 @@ class XmlHelper:
     ):
         """Specify if tag in XML file"""
 
-        # Load XML files
-        xml_content = FileHelper.read_file(
-            file_path=xml_file_path
+        return XmlIndex.get(
+            xml_file_path=xml_file_path
+        ).is_tag(
+            tag=tag
         )
-        for line in xml_content.splitlines():
-            if line.strip() == f'<{tag}>':
-                return True
-
-        return False
 
     @staticmethod
+    @MetricsHelper.measured(Metric.XML)
     def extract_tags(
         xml_file_path: str,
         extracted_file_path: str,
@@ -35,22 +36,18 @@ class XmlHelper:
     ):
         """Extract tags in a XML file from a XML file"""
 
-        # Load XML file
-        xml_content = FileHelper.read_file(
-            file_path=xml_file_path
+        # Load XML file index
+        xml_index = XmlIndex.get(
+            xml_file_path=xml_file_path
         )
-        export_content = ''
+        export_lines = []
         for tag in tags:
-            tag_line = False
-            for line in xml_content.splitlines():
-                if line.strip() == f'<{tag}>':
-                    tag_line = True
-                if tag_line:
-                    if len(export_content) > 0:
-                        export_content += '\n'
-                    export_content += line
-                if line.strip() == f'</{tag}>':
-                    tag_line = False
+            export_lines.extend(
+                xml_index.get_tag_lines(
+                    tag=tag
+                )
+            )
+        export_content = '\n'.join(export_lines)
 
         if len(export_content) == 0:
             return
@@ -77,34 +74,23 @@ class XmlHelper:
         )
 
     @staticmethod
+    @MetricsHelper.measured(Metric.XML)
     def delete_tags(
         xml_file_path: str,
         tags: list
     ):
         """Delete tags from XML file"""
 
-        # Load XML files
-        xml_content = FileHelper.read_file(
-            file_path=xml_file_path
+        xml_batch = XmlBatch(
+            xml_file_path=xml_file_path
         )
-        new_content = ''
-        tag_line = False
-        for line in xml_content.splitlines():
-            for tag in tags:
-                if line.strip() == f'<{tag}>':
-                    tag_line = True
-            if not tag_line:
-                new_content += line + '\n'
-            for tag in tags:
-                if line.strip() == f'</{tag}>':
-                    tag_line = False
-
-        FileHelper.write_file(
-            file_path=xml_file_path,
-            content=new_content
+        xml_batch.delete_tags(
+            tags=tags
         )
+        xml_batch.apply()
 
     @staticmethod
+    @MetricsHelper.measured(Metric.XML)
     def import_tags(
         xml_file_path: str,
         extracted_file_path: str,
@@ -112,20 +98,11 @@ class XmlHelper:
     ):
         """Import tags in a XML file from a XML file"""
 
-        # Load XML files
-        xml_content = FileHelper.read_file(
-            file_path=xml_file_path
-        )
-        tags_content = FileHelper.read_file(
-            file_path=extracted_file_path
+        xml_batch = XmlBatch(
+            xml_file_path=xml_file_path
         )
-        new_content = ''
-        for line in xml_content.splitlines():
-            if line.strip() == f'</{parent_tag}>':
-                new_content += tags_content + '\n'
-            new_content += line + '\n'
-
-        FileHelper.write_file(
-            file_path=xml_file_path,
-            content=new_content
+        xml_batch.import_tags(
+            extracted_file_path=extracted_file_path,
+            parent_tag=parent_tag
         )
+        xml_batch.apply()
@@ -0,0 +1,126 @@
+#!/usr/bin/python3
+"""XML Index"""
+
+import os
+import threading
+
+from libraries.file.file_helper import FileHelper
+
+
+class XmlIndex:
+    """
+    Class to index the tags of a XML file.
+
+    The file is parsed once, lines ranges of each tag are kept by tag name,
+    and the index is parsed again only when the file is modified.
+    """
+
+    # Indexes by XML file path
+    __indexes = {}
+    __indexes_lock = threading.Lock()
+
+    def __init__(
+        self,
+        xml_content: str
+    ):
+        """Initialize index from XML content"""
+
+        self.__lines = xml_content.splitlines()
+        self.__ranges = {}
+
+        # Same ranges as a line scan: from the opening line to the next closing line
+        opened_tags = {}
+        for i, line in enumerate(self.__lines):
+            line = line.strip()
+            if not line.startswith('<') or not line.endswith('>'):
+                continue
+            if line.startswith('</'):
+                tag = line[2:-1]
+                if tag in opened_tags:
+                    self.__ranges.setdefault(tag, []).append(
+                        (opened_tags.pop(tag), i + 1)
+                    )
+            else:
+                opened_tags.setdefault(line[1:-1], i)
+
+        # Tags not closed until the end of the file
+        for tag, start in opened_tags.items():
+            self.__ranges.setdefault(tag, []).append(
+                (start, len(self.__lines))
+            )
+
+    @staticmethod
+    def get(
+        xml_file_path: str
+    ):
+        """Get the index of a XML file, parsed again if modified"""
+
+        xml_file_path = str(xml_file_path)
+        try:
+            stat = os.stat(xml_file_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None
+
+        with XmlIndex.__indexes_lock:
+            cached_index = XmlIndex.__indexes.get(xml_file_path, None)
+            if cached_index is not None and cached_index[0] == version:
+                return cached_index[1]
+
+        index = XmlIndex(
+            xml_content=FileHelper.read_file(
+                file_path=xml_file_path
+            )
+        )
+
+        with XmlIndex.__indexes_lock:
+            XmlIndex.__indexes[xml_file_path] = (version, index)
+
+        return index
+
+    @staticmethod
+    def invalidate(
+        xml_file_path: str
+    ):
+        """Invalidate the index of a XML file, to call after modifications"""
+
+        with XmlIndex.__indexes_lock:
+            XmlIndex.__indexes.pop(str(xml_file_path), None)
+
+    def is_tag(
+        self,
+        tag: str
+    ) -> bool:
+        """Specify if tag in index"""
+
+        return tag in self.__ranges
+
+    def list_tags(self) -> list:
+        """List tags in index"""
+
+        return list(self.__ranges)
+
+    def list_tag_ranges(
+        self,
+        tag: str
+    ) -> list:
+        """List lines ranges (start, end excluded) of every occurrence of a tag"""
+
+        return sorted(self.__ranges.get(tag, []))
+
+    def get_lines(self) -> list:
+        """Get lines of the XML content"""
+
+        return self.__lines
+
+    def get_tag_lines(
+        self,
+        tag: str
+    ) -> list:
+        """Get lines of every occurrence of a tag, from opening to closing line"""
+
+        tag_lines = []
+        for start, end in self.list_tag_ranges(tag):
+            tag_lines.extend(self.__lines[start:end])
+
+        return tag_lines
@@ -4,9 +4,11 @@
 """Application to manage my Pincab"""
 
 import os
+import sys
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog
+from tkinter import messagebox
 
 from dialogs.about.about_dialog import AboutDialog
 from dialogs.editor.configs_files_editor_dialog import ConfigsFilesEditorDialog
@@ -17,9 +19,13 @@ from dialogs.editor.tables_editor_dialog import TablesEditorDialog
 from dialogs.refresh.refresh_dialog import RefreshDialog
 from dialogs.setup.setup_dialog import SetupDialog
 from dialogs.execute.execute_dialog import ExecuteDialog
+from executor.execution_checkpoint import ExecutionCheckpoint
+from headless.headless_runner import HeadlessRunner
 from libraries.csv.csv_helper import CsvHelper
 from libraries.constants.constants import Action, Category, Component, Constants, Emulator
 from libraries.context.context import Context
+from libraries.refresh.refresh_session import RefreshSession
+from libraries.refresh.refresh_watcher import RefreshWatcher
 from libraries.ui.ui_helper import UIHelper
 from libraries.ui.ui_table import UITable
 
@@ -42,7 +48,10 @@ class ApplicationWindow:
         selected_bottom_rows = self.table_bottom.get_selected_rows()
 
         # Update execute button state
-        if len(selected_top_rows) > 0 and len(selected_bottom_rows) > 0:
+        if self.__refresh_in_progress:
+            # Wait the end of the refresh
+            self.button_execute.config(state=tk.DISABLED)
+        elif len(selected_top_rows) > 0 and len(selected_bottom_rows) > 0:
             self.button_execute.config(state=tk.NORMAL)
         else:
             # Authorize edit if no rows in top
@@ -138,26 +147,47 @@ class ApplicationWindow:
             # Update data
             self.__update_ui()
 
-    def __update_ui(self):
-        """Update UI depending on choices made in combos"""
+            # Refresh in background if folders changed since CSV written
+            if self.__refresh_watcher.is_started() and \
+                    Context.get_selected_rows_csv_path().stat().st_mtime < \
+                    self.__refresh_watcher.get_last_change_time():
+                self.__load_refresh(
+                    background=True
+                )
+
+    def __convert_rows(
+        self,
+        rows: list
+    ):
+        """Convert rows read from CSV to rows of table"""
 
-        # Create table top from CSV
-        table_top_rows = []
-        for row in CsvHelper.read_data(
-            file_path=Context.get_selected_rows_csv_path()
-        ):
-            table_top_row = {}
+        table_rows = []
+        for row in rows:
+            table_row = {}
             for key, value in row.items():
                 if value == Constants.CSV_YES_VALUE:
-                    table_top_row[key] = True
+                    table_row[key] = True
                 elif value == Constants.CSV_NO_VALUE:
-                    table_top_row[key] = False
+                    table_row[key] = False
                 else:
-                    table_top_row[key] = value
-            table_top_rows.append(table_top_row)
+                    table_row[key] = value
+            table_rows.append(table_row)
+
+        return table_rows
+
+    def __update_ui(self, rows=None):
+        """Update UI depending on choices made in combos"""
+
+        # Create table top from CSV if no rows given
+        if rows is None:
+            rows = CsvHelper.read_data(
+                file_path=Context.get_selected_rows_csv_path()
+            )
 
         self.__create_table_top(
-            rows=table_top_rows
+            rows=self.__convert_rows(
+                rows=rows
+            )
         )
 
         # Change labels for top frame
@@ -208,16 +238,130 @@ class ApplicationWindow:
         Context.set_selected_configs_rows([])
         Context.set_selected_components([])
 
-    def __load_refresh(self, only_ids=None):
+    def __load_refresh(self, only_ids=None, background=False):
         """Load refresh"""
 
+        # Ignore if a refresh is already in progress
+        if self.__refresh_in_progress:
+            return
+
+        # Changes detected until now are refreshed by a refresh of all items
+        if only_ids is None:
+            self.__refresh_pending_paths = []
+
+        # Lock components changing the selection during the refresh
+        self.__set_refresh_in_progress(True)
+        self.__refresh_rows_streamed = False
+
+        # Keep selected rows if refreshing in background
+        self.__refresh_selected_ids = []
+        if background:
+            self.__refresh_selected_ids = self.table_top.get_selected_ids()
+
         # Load dialog to refresh
+        on_rows = self.__on_refresh_rows
+        if background:
+            on_rows = None
         RefreshDialog(
             self.__window,
             only_ids=only_ids,
-            callback=self.__update_ui
+            callback=self.__on_refresh_finished,
+            on_rows=on_rows,
+            background=background
+        )
+
+    def __update_refresh_watcher(self):
+        """Start or stop watching folders depending on setup"""
+
+        if Context.is_auto_refresh():
+            self.__refresh_watcher.start()
+        else:
+            self.__refresh_watcher.stop()
+
+    def __check_refresh_watcher(self):
+        """Refresh in background the tables of the changed paths (called from the Tk main loop)"""
+
+        self.__refresh_pending_paths.extend(
+            self.__refresh_watcher.pop_changed_paths()
+        )
+
+        # Wait the end of other refreshes and the close of dialogs
+        if len(self.__refresh_pending_paths) > 0 and \
+                not self.__refresh_in_progress and \
+                self.__window.state() == 'normal' and \
+                Context.get_setup_file_path().exists():
+            changed_tables_ids = RefreshSession.get().list_changed_table_ids(
+                changed_paths=self.__refresh_pending_paths
+            )
+            self.__refresh_pending_paths = []
+            if changed_tables_ids is None or len(changed_tables_ids) > 0:
+                self.__load_refresh(
+                    only_ids=changed_tables_ids,
+                    background=True
+                )
+
+        self.__window.after(
+            Constants.UI_REFRESH_WATCHER_DELAY,
+            self.__check_refresh_watcher
+        )
+
+    def __set_refresh_in_progress(
+        self,
+        refresh_in_progress: bool
+    ):
+        """Lock or unlock components changing the selection during a refresh"""
+
+        self.__refresh_in_progress = refresh_in_progress
+
+        combo_state = "readonly"
+        button_state = tk.NORMAL
+        if refresh_in_progress:
+            combo_state = tk.DISABLED
+            button_state = tk.DISABLED
+        self.combo_category.config(state=combo_state)
+        self.combo_action.config(state=combo_state)
+        self.combo_emulator.config(state=combo_state)
+        self.button_setup.config(state=button_state)
+        if refresh_in_progress:
+            self.button_execute.config(state=tk.DISABLED)
+
+    def __on_refresh_rows(self, rows: list):
+        """Called when rows are verified by the refresh"""
+
+        table_rows = self.__convert_rows(
+            rows=rows
+        )
+
+        # Replace previous rows by the first rows verified
+        if not self.__refresh_rows_streamed:
+            self.__refresh_rows_streamed = True
+            self.__create_table_top(
+                rows=table_rows
+            )
+        else:
+            self.table_top.append_rows(
+                rows=table_rows
+            )
+
+    def __on_refresh_finished(self, rows=None):
+        """Called when the refresh is finished, with sorted rows if not interrupted"""
+
+        self.__set_refresh_in_progress(False)
+
+        self.__update_ui(
+            rows=rows
         )
 
+        # Select again rows selected before a refresh in background
+        if len(self.__refresh_selected_ids) > 0:
+            self.table_top.set_selected_rows(
+                rows_idx=[
+                    row_idx
+                    for row_idx, row in enumerate(self.table_top.list_rows())
+                    if row[Constants.UI_TABLE_KEY_COL_ID] in self.__refresh_selected_ids
+                ]
+            )
+
     def __load_setup(self):
         """Load setup"""
 
@@ -238,6 +382,10 @@ class ApplicationWindow:
     def __execute(self):
         """Execute"""
 
+        # Wait the end of the refresh
+        if self.__refresh_in_progress:
+            return
+
         # Update context
         match(Context.get_selected_category()):
             case Category.TABLES:
@@ -287,6 +435,29 @@ class ApplicationWindow:
                 folder_path=folder_path
             )
 
+            # Ask if the folder must be synchronized (only new or changed files copied)
+            copy_sync = messagebox.askyesno(
+                Context.get_text('question'),
+                Context.get_text(
+                    'question_copy_sync',
+                    folder=folder_path
+                ).replace('\\n', '\n'),
+                parent=self.__window
+            )
+            Context.set_selected_copy_sync(
+                copy_sync=copy_sync
+            )
+
+            # Ask if stale files must be deleted during synchronization
+            copy_sync_delete = copy_sync and messagebox.askyesno(
+                Context.get_text('question'),
+                Context.get_text('question_copy_sync_delete'),
+                parent=self.__window
+            )
+            Context.set_selected_copy_sync_delete(
+                copy_sync_delete=copy_sync_delete
+            )
+
         if Context.get_selected_action() == Action.EDIT:
 
             selected_component = Context.get_selected_components()[0]
@@ -326,10 +497,26 @@ class ApplicationWindow:
                         callback=self.__load_refresh
                     )
         else:
+            # Ask if an interrupted execution of the same selection must be resumed
+            checkpoint = ExecutionCheckpoint.load()
+            if checkpoint is not None and not checkpoint.is_matching_selection():
+                checkpoint = None
+            if checkpoint is not None and not messagebox.askyesno(
+                Context.get_text('question'),
+                Context.get_text(
+                    'question_resume_execution',
+                    completed_count=len(checkpoint.list_completed_ids()),
+                    total_count=len(checkpoint.list_rows())
+                ).replace('\\n', '\n'),
+                parent=self.__window
+            ):
+                checkpoint = None
+
             # If other action, execution is automatic
             ExecuteDialog(
                 self.__window,
-                callback=self.__load_refresh
+                callback=self.__load_refresh,
+                checkpoint=checkpoint
             )
 
     def __create_top_components(self):
@@ -549,6 +736,9 @@ class ApplicationWindow:
     def __update_components_from_context(self):
         """Update components from context"""
 
+        # Watch folders if auto refresh
+        self.__update_refresh_watcher()
+
         # Fix windows's title
         title = Context.get_text('title')
         title += f' ({Context.get_app_version()})'
@@ -622,6 +812,11 @@ class ApplicationWindow:
 
         # Create window
         self.__window = tk.Tk()
+        self.__refresh_in_progress = False
+        self.__refresh_rows_streamed = False
+        self.__refresh_selected_ids = []
+        self.__refresh_pending_paths = []
+        self.__refresh_watcher = RefreshWatcher()
 
         # Handle window close event
         self.__window.protocol("WM_DELETE_WINDOW", self.__on_close)
@@ -652,16 +847,29 @@ class ApplicationWindow:
         if not Context.get_setup_file_path().exists():
             self.__load_setup()
 
+        # Check changes detected by the watcher
+        self.__window.after(
+            Constants.UI_REFRESH_WATCHER_DELAY,
+            self.__check_refresh_watcher
+        )
+
         # Show window
         self.__window.mainloop()
 
     def __on_close(self):
         """Called when the window is closing"""
+
+        # Stop watching folders
+        self.__refresh_watcher.stop()
+
         Context.destroy()
         self.__window.destroy()
 
 
 if __name__ == "__main__":
-    # python3 pincab-manager.py
+    # python3 pincab-manager.py [--headless --category ... --action ...]
+    if '--headless' in sys.argv[1:]:
+        sys.exit(HeadlessRunner(sys.argv[1:]).run())
+
     app = ApplicationWindow()
     app.show()
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""Tests of the REG configs verifications against a .reg file standing in for the registry"""
+
+import os
+import tempfile
+import unittest
+
+from libraries.constants.constants import Constants, Emulator
+from libraries.context.context import Context
+from libraries.verifier.batch_verifier import BatchVerifier
+from libraries.winreg.registry_snapshot import RegFileBackend, RegistrySnapshot
+
+REG_FILE_HEADER = 'Windows Registry Editor Version 5.00\n'
+
+
+class TestRegistrySnapshot(unittest.TestCase):
+    """Tests of the REG configs verifications with RegFileBackend"""
+
+    @staticmethod
+    def __write_reg_file(
+        file_path: str,
+        values_by_rom: dict
+    ):
+        """Write a .reg file with the values of VPinMAME ROMs"""
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        lines = [REG_FILE_HEADER]
+        for rom, values in values_by_rom.items():
+            lines.append(
+                f'[{Constants.REGEDIT_ROOT_KEY_NAME}\\{Constants.VPINMAME_REG_KEY}\\{rom}]'
+            )
+            for name, value in values.items():
+                lines.append(f'"{name}"=dword:{value:08x}')
+            lines.append('')
+
+        with open(file_path, 'w', encoding=Constants.REGEDIT_FILE_ENCODING) as file:
+            file.write('\n'.join(lines))
+
+    @classmethod
+    def __write_reg_config(
+        cls,
+        table_id: str,
+        values_by_rom: dict
+    ):
+        """Write the REG config of a table version"""
+
+        TestRegistrySnapshot.__write_reg_file(
+            file_path=os.path.join(
+                cls.working_path,
+                'tables',
+                Emulator.VISUAL_PINBALL_X.value,
+                table_id,
+                '1.0',
+                'config',
+                f'user_values{Constants.REGEDIT_FILE_EXTENSION}'
+            ),
+            values_by_rom=values_by_rom
+        )
+
+    @classmethod
+    def setUpClass(cls):
+        """Write the sample registry and the REG configs of the tables"""
+
+        cls.working_path = tempfile.mkdtemp()
+        os.environ['PINCAB_MANAGER_PATH'] = cls.working_path
+        if Context.get_working_path() != cls.working_path:
+            raise unittest.SkipTest('Context initialized with another working path')
+        Context.set_selected_emulator(Emulator.VISUAL_PINBALL_X)
+
+        registry_file_path = os.path.join(cls.working_path, 'registry.reg')
+        TestRegistrySnapshot.__write_reg_file(
+            file_path=registry_file_path,
+            values_by_rom={
+                'afm_113b': {'cabinet_mode': 1, 'dmd_red': 255},
+                'tz_94h': {'cabinet_mode': 1}
+            }
+        )
+        cls.__write_reg_config(
+            table_id='Attack from Mars',
+            values_by_rom={'afm_113b': {'cabinet_mode': 1, 'dmd_red': 255}}
+        )
+        cls.__write_reg_config(
+            table_id='Twilight Zone',
+            values_by_rom={'tz_94h': {'cabinet_mode': 0}}
+        )
+        cls.__write_reg_config(
+            table_id='Medieval Madness',
+            values_by_rom={'mm_109c': {'cabinet_mode': 1}}
+        )
+
+        cls.batch_verifier = BatchVerifier(
+            registry_snapshot=RegistrySnapshot(
+                RegFileBackend(
+                    file_path=registry_file_path
+                )
+            )
+        )
+
+    def test_verify_install(self):
+        """Installed only if the key exists with the values of the REG config"""
+
+        self.assertTrue(self.batch_verifier.verify_table_reg_config_install(
+            csv_table_id='Attack from Mars',
+            csv_table_version='1.0',
+            csv_table_rom='afm_113b'
+        ))
+        self.assertFalse(self.batch_verifier.verify_table_reg_config_install(
+            csv_table_id='Twilight Zone',
+            csv_table_version='1.0',
+            csv_table_rom='tz_94h'
+        ))
+        self.assertFalse(self.batch_verifier.verify_table_reg_config_install(
+            csv_table_id='Medieval Madness',
+            csv_table_version='1.0',
+            csv_table_rom='mm_109c'
+        ))
+
+    def test_verify_export(self):
+        """Exported only if the REG config has the values of the key, not verified without key"""
+
+        self.assertTrue(self.batch_verifier.verify_table_reg_config_export(
+            bdd_table_id='Attack from Mars',
+            bdd_table_version='1.0',
+            bdd_table_rom='AFM_113B'
+        ))
+        self.assertFalse(self.batch_verifier.verify_table_reg_config_export(
+            bdd_table_id='Twilight Zone',
+            bdd_table_version='1.0',
+            bdd_table_rom='tz_94h'
+        ))
+        self.assertIsNone(self.batch_verifier.verify_table_reg_config_export(
+            bdd_table_id='Medieval Madness',
+            bdd_table_version='1.0',
+            bdd_table_rom='mm_109c'
+        ))
+
+    def test_verify_uninstall(self):
+        """Uninstalled only if the key does not exist"""
+
+        self.assertFalse(self.batch_verifier.verify_table_reg_config_uninstall(
+            bdd_table_id='Attack from Mars',
+            bdd_table_version='1.0',
+            bdd_table_rom='afm_113b'
+        ))
+        self.assertTrue(self.batch_verifier.verify_table_reg_config_uninstall(
+            bdd_table_id='Medieval Madness',
+            bdd_table_version='1.0',
+            bdd_table_rom='mm_109c'
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()